@@ -1,3 +1,192 @@
+import pandas as pd
+import numpy as np
+import math
+import json
+import os
+import hashlib
+import pickle
+import functools
+import inspect
+import warnings
+import io
+import gzip
+import bz2
+import lzma
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+import matplotlib.pyplot as plt
+from matplotlib.figure import Figure
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+
+class CacheResultados:
+    """
+    Caché en disco de los resultados de los métodos de las variables. Cada
+    resultado se guarda con una clave formada por la huella de los datos de
+    la columna, el nombre del método y sus argumentos, así que si la columna
+    no cambió entre una ejecución y otra el resultado se devuelve de inmediato.
+
+    El tamaño total está acotado: cuando se supera, se borran primero las
+    entradas usadas hace más tiempo (LRU, usando la fecha de modificación de
+    cada archivo). Está desactivada por defecto: se activa con `activa = True`
+    o con la variable de entorno POO_LIBRERIA_CACHE=1. Cualquier error de
+    lectura o escritura en la carpeta se trata como si la entrada no estuviera.
+    """
+    def __init__(self, directorio=None, tamano_maximo=256 * 1024 * 1024, activa=None):
+        """
+        Args:
+            directorio (str, optional): Carpeta de la caché. Por defecto,
+                                        ~/.cache/poo_libreria/resultados.
+            tamano_maximo (int): Tamaño máximo de la caché en bytes.
+            activa (bool, optional): Si es None, se lee de POO_LIBRERIA_CACHE.
+        """
+        if directorio is None:
+            directorio = os.path.join(os.path.expanduser("~"), ".cache", "poo_libreria", "resultados")
+        if activa is None:
+            activa = os.environ.get("POO_LIBRERIA_CACHE", "0") == "1"
+        self.directorio = directorio
+        self.tamano_maximo = tamano_maximo
+        self.activa = activa
+        # Tamaño total de las entradas; se calcula recorriendo la carpeta una
+        # sola vez y luego se actualiza con cada escritura
+        self._tamano_total = None
+
+    def _ruta(self, clave):
+        nombre = hashlib.blake2b(repr(clave).encode("utf-8"), digest_size=20).hexdigest()
+        return os.path.join(self.directorio, nombre + ".pkl")
+
+    def obtener(self, clave):
+        """
+        Returns:
+            tuple: (True, valor) si la clave está en la caché; (False, None) si no.
+        """
+        ruta = self._ruta(clave)
+        try:
+            with open(ruta, "rb") as f:
+                valor = pickle.load(f)
+        except (OSError, pickle.UnpicklingError, EOFError):
+            return False, None
+        # Marcamos la entrada como usada recientemente
+        try:
+            os.utime(ruta)
+        except OSError:
+            pass
+        return True, valor
+
+    def guardar(self, clave, valor):
+        try:
+            contenido = pickle.dumps(valor, protocol=pickle.HIGHEST_PROTOCOL)
+        except (pickle.PicklingError, TypeError, AttributeError):
+            return
+        if len(contenido) > self.tamano_maximo:
+            return
+        ruta = self._ruta(clave)
+        temporal = f"{ruta}.{os.getpid()}.tmp"
+        try:
+            os.makedirs(self.directorio, exist_ok=True)
+            if self._tamano_total is None:
+                self._tamano_total = sum(tamano for _, tamano, _ in self._entradas())
+            try:
+                anterior = os.path.getsize(ruta)
+            except OSError:
+                anterior = 0
+            with open(temporal, "wb") as f:
+                f.write(contenido)
+            os.replace(temporal, ruta)
+        except OSError:
+            # Sin permisos, disco lleno, etc.: el resultado simplemente no se guarda
+            try:
+                os.remove(temporal)
+            except OSError:
+                pass
+            return
+        self._tamano_total += len(contenido) - anterior
+        if self._tamano_total > self.tamano_maximo:
+            self._desalojar()
+
+    def _entradas(self):
+        """Lista (fecha de modificación, tamaño, ruta) de las entradas guardadas."""
+        entradas = []
+        try:
+            for entrada in os.scandir(self.directorio):
+                if entrada.name.endswith(".pkl"):
+                    try:
+                        estado = entrada.stat()
+                    except OSError:
+                        continue
+                    entradas.append((estado.st_mtime_ns, estado.st_size, entrada.path))
+        except OSError:
+            pass
+        return entradas
+
+    def _desalojar(self):
+        """Borra las entradas menos usadas hasta volver a estar bajo tamano_maximo."""
+        entradas = self._entradas()
+        total = sum(tamano for _, tamano, _ in entradas)
+        for _, tamano, ruta in sorted(entradas):
+            if total <= self.tamano_maximo:
+                break
+            try:
+                os.remove(ruta)
+            except OSError:
+                continue
+            total -= tamano
+        self._tamano_total = total
+
+    def limpiar(self):
+        """Borra todos los resultados guardados."""
+        for _, _, ruta in self._entradas():
+            try:
+                os.remove(ruta)
+            except OSError:
+                pass
+        self._tamano_total = 0
+
+
+# Caché usada por defecto por todas las variables
+CACHE_RESULTADOS = CacheResultados()
+
+
+def _clave_argumento(valor):
+    """
+    Representación exacta de un argumento para la clave de la caché. No se
+    usa repr() directamente porque numpy abrevia los arreglos largos y dos
+    arreglos distintos podrían compartir la clave.
+    """
+    if isinstance(valor, (pd.Series, pd.Index)):
+        valor = valor.to_numpy()
+    if isinstance(valor, np.ndarray):
+        if valor.dtype == object:
+            return ("ndarray", "object", valor.shape, repr(valor.tolist()))
+        contenido = hashlib.blake2b(np.ascontiguousarray(valor).tobytes(), digest_size=20).hexdigest()
+        return ("ndarray", valor.dtype.str, valor.shape, contenido)
+    if isinstance(valor, (list, tuple)):
+        return (type(valor).__name__, tuple(_clave_argumento(elemento) for elemento in valor))
+    if isinstance(valor, dict):
+        return ("dict", tuple(sorted((repr(k), _clave_argumento(v)) for k, v in valor.items())))
+    return repr(valor)
+
+
+def memoizar_en_disco(metodo):
+    """
+    Decorador para los métodos de las variables: busca el resultado en
+    CACHE_RESULTADOS antes de calcularlo y lo guarda después. La clave incluye
+    el nombre de la variable porque algunos resultados lo llevan (por ejemplo,
+    el nombre del índice de las tablas de frecuencia).
+    """
+    @functools.wraps(metodo)
+    def envoltura(self, *args, **kwargs):
+        if not CACHE_RESULTADOS.activa:
+            return metodo(self, *args, **kwargs)
+        clave = (type(self).__name__, self._huella_datos(), self.nombre, getattr(self.datos, "name", None),
+                 metodo.__name__, _clave_argumento(args), _clave_argumento(kwargs))
+        encontrado, valor = CACHE_RESULTADOS.obtener(clave)
+        if encontrado:
+            return valor
+        valor = metodo(self, *args, **kwargs)
+        CACHE_RESULTADOS.guardar(clave, valor)
+        return valor
+    return envoltura
+
+
 class Variable:
     def __init__(self, datos, nombre=None):
         """
@@ -26,25 +215,385 @@ class Variable:
         self.tipo = self.detectar_tipo()
         self.n = len(self.datos)
 
+    TAMANO_MUESTRA = 1000
+
     def detectar_tipo(self):
+        """
+        Decide si la variable es cuantitativa o cualitativa. La conversión a
+        float que pueda hacer _clasificar se descarta: solo VariableCuantitativa
+        la conserva.
+        """
+        return self._clasificar(self.datos)[0]
+
+    @classmethod
+    def _clasificar(cls, datos):
+        """
+        Clasifica una Serie sin copiar la columna cuando no hace falta: si el
+        dtype ya es numérico no se convierte nada; si no, primero se prueba una
+        muestra (se corta en el primer valor no numérico) y solo si pasa se
+        convierte todo.
+
+        Returns:
+            tuple: (tipo, valores), donde valores es la columna convertida a
+            float64 si hubo que convertirla, o None.
+        """
+        if pd.api.types.is_numeric_dtype(datos.dtype):
+            return "cuantitativa", None
         try:
-            self.datos.astype(float)
-            return "cuantitativa"
-        except ValueError:
-            return "cualitativa"
+            datos.iloc[:cls.TAMANO_MUESTRA].astype(float)
+            return "cuantitativa", datos.astype(np.float64).to_numpy()
+        except (TypeError, ValueError):
+            return "cualitativa", None
+
+class AcumuladorMomentos:
+    """
+    Acumula en una sola pasada los momentos centrales de un conjunto de datos:
+    n, media, M2, M3 y M4 (sumas de desvíos a la potencia 2, 3 y 4).
+
+    Los datos se procesan por bloques vectorizados y cada bloque se combina
+    con lo acumulado usando las fórmulas de actualización de Welford/Terriberry,
+    por lo que dos acumuladores parciales también pueden combinarse entre sí.
+
+    La media se guarda relativa a un desplazamiento (el primer dato): con datos
+    lejos del 0 (por ejemplo 1e9 + ruido) las medias de los bloques quedan
+    cerca de 0 y su diferencia, que entra en M2, M3 y M4, no pierde precisión.
+    """
+    TAMANO_BLOQUE = 1 << 16
+
+    def __init__(self):
+        self.n = 0
+        self.desplazamiento = 0.0
+        self.media_relativa = 0.0
+        self.m2 = 0.0
+        self.m3 = 0.0
+        self.m4 = 0.0
+
+    @property
+    def media(self):
+        return self.desplazamiento + self.media_relativa
+
+    @classmethod
+    def desde_datos(cls, datos):
+        """Crea un acumulador y lo llena con los datos en una sola pasada."""
+        acumulador = cls()
+        acumulador.actualizar(datos)
+        return acumulador
+
+    def actualizar(self, datos):
+        """
+        Incorpora nuevos datos al acumulador.
+
+        Args:
+            datos (array-like): Valores numéricos sin faltantes.
+        """
+        datos = np.asarray(datos, dtype=np.float64)
+        if self.n == 0 and len(datos) and math.isfinite(datos[0]):
+            self.desplazamiento = float(datos[0])
+        for inicio in range(0, len(datos), self.TAMANO_BLOQUE):
+            relativos = datos[inicio:inicio + self.TAMANO_BLOQUE] - self.desplazamiento
+            parcial = AcumuladorMomentos()
+            parcial.n = len(relativos)
+            parcial.desplazamiento = self.desplazamiento
+            parcial.media_relativa = float(relativos.mean())
+            desvios = relativos - parcial.media_relativa
+            cuadrados = desvios * desvios
+            parcial.m2 = float(cuadrados.sum())
+            parcial.m3 = float(np.dot(cuadrados, desvios))
+            parcial.m4 = float(np.dot(cuadrados, cuadrados))
+            self.combinar(parcial)
+        return self
+
+    def combinar(self, otro):
+        """
+        Combina los momentos de otro acumulador con los de este (en el lugar).
+
+        Args:
+            otro (AcumuladorMomentos): Momentos calculados sobre otra parte de los datos.
+        """
+        if otro.n == 0:
+            return self
+        if self.n == 0:
+            self.n, self.desplazamiento, self.media_relativa = otro.n, otro.desplazamiento, otro.media_relativa
+            self.m2, self.m3, self.m4 = otro.m2, otro.m3, otro.m4
+            return self
+
+        na, nb = self.n, otro.n
+        n = na + nb
+        delta = (otro.desplazamiento - self.desplazamiento) + (otro.media_relativa - self.media_relativa)
+        delta_n = delta / n
+        delta_n2 = delta_n * delta_n
+        termino = delta * delta_n * na * nb
+
+        m4 = (self.m4 + otro.m4
+              + termino * delta_n2 * (na * na - na * nb + nb * nb)
+              + 6.0 * delta_n2 * (na * na * otro.m2 + nb * nb * self.m2)
+              + 4.0 * delta_n * (na * otro.m3 - nb * self.m3))
+        m3 = (self.m3 + otro.m3
+              + termino * delta_n * (na - nb)
+              + 3.0 * delta_n * (na * otro.m2 - nb * self.m2))
+        m2 = self.m2 + otro.m2 + termino
+
+        self.n = n
+        self.media_relativa = self.media_relativa + delta_n * nb
+        self.m2, self.m3, self.m4 = m2, m3, m4
+        return self
+
+    def varianza(self, es_muestra=True):
+        if es_muestra and self.n < 2: return 0
+        if not es_muestra and self.n < 1: return 0
+        return self.m2 / (self.n - 1) if es_muestra else self.m2 / self.n
+
+    def asimetria(self):
+        if self.n < 3: return 0 # No está bien definida para pocos datos
+        std_dev = math.sqrt(self.varianza(es_muestra=False))
+        if std_dev == 0: return 0
+        tercer_momento = self.m3 / std_dev ** 3
+        return (self.n / ((self.n - 1) * (self.n - 2))) * tercer_momento # Corrección de sesgo muestral
+
+    def curtosis(self):
+        if self.n < 4: return 0 # No está bien definida para pocos datos
+        std_dev = math.sqrt(self.varianza(es_muestra=False))
+        if std_dev == 0: return 0
+        # Se resta 3 para que una distribución normal tenga curtosis de 0 (exceso de curtosis)
+        return (self.m4 / std_dev ** 4) / self.n - 3
+
+class SketchCuantiles:
+    """
+    Sketch KLL para aproximar percentiles sin guardar todos los datos.
+
+    Los valores se guardan en niveles ("compactadores"): cada elemento del
+    nivel h representa 2**h datos originales. Cuando un nivel se llena se
+    ordena y se conserva uno de cada dos elementos, que suben al nivel
+    siguiente. La memoria queda acotada por unos 3*k elementos y el error en
+    el rango de cada percentil es aproximadamente `error` (con 99% de confianza).
+    Los sketches de distintas partes de los datos pueden combinarse y
+    serializarse.
+    """
+    C = 2 / 3
+
+    def __init__(self, error=0.01, semilla=None):
+        """
+        Args:
+            error (float): Error relativo de rango aceptado (por ejemplo 0.01 = 1%).
+            semilla (int, optional): Semilla para que las compactaciones sean reproducibles.
+        """
+        if not 0 < error < 1:
+            raise ValueError("El error del sketch debe estar entre 0 y 1.")
+        self.error = error
+        self.k = max(8, math.ceil(3.3 / error))
+        self.n = 0
+        self.minimo = math.inf
+        self.maximo = -math.inf
+        self.niveles = [np.empty(0)]
+        self._rng = np.random.default_rng(semilla)
+        self._ponderados = None
+
+    def _capacidad(self, nivel):
+        altura = len(self.niveles)
+        return max(2, math.ceil(self.k * self.C ** (altura - 1 - nivel)))
+
+    def _compactar(self):
+        """Compacta los niveles que superan su capacidad hasta que ninguno lo haga."""
+        while True:
+            llenos = [h for h, items in enumerate(self.niveles) if len(items) > self._capacidad(h)]
+            if not llenos:
+                return
+            nivel = llenos[0]
+            if nivel + 1 == len(self.niveles):
+                self.niveles.append(np.empty(0))
+            items = np.sort(self.niveles[nivel])
+            # Si la cantidad es impar, el último elemento se queda en su nivel
+            sobrante = len(items) % 2
+            pares = items[:len(items) - sobrante]
+            inicio = int(self._rng.integers(2))
+            self.niveles[nivel + 1] = np.concatenate([self.niveles[nivel + 1], pares[inicio::2]])
+            self.niveles[nivel] = items[len(items) - sobrante:]
+
+    def actualizar(self, datos):
+        """
+        Incorpora nuevos datos al sketch.
+
+        Args:
+            datos (array-like): Valores numéricos sin faltantes.
+        """
+        datos = np.asarray(datos, dtype=np.float64)
+        if len(datos) == 0:
+            return self
+        self.n += len(datos)
+        self.minimo = min(self.minimo, float(datos.min()))
+        self.maximo = max(self.maximo, float(datos.max()))
+        self.niveles[0] = np.concatenate([self.niveles[0], datos])
+        self._compactar()
+        self._ponderados = None
+        return self
+
+    def combinar(self, otro):
+        """
+        Combina en este sketch los datos resumidos en otro (en el lugar).
+
+        Args:
+            otro (SketchCuantiles): Sketch de otra parte de los datos.
+        """
+        if otro.n == 0:
+            return self
+        self.k = min(self.k, otro.k)
+        self.error = max(self.error, otro.error)
+        while len(self.niveles) < len(otro.niveles):
+            self.niveles.append(np.empty(0))
+        for nivel, items in enumerate(otro.niveles):
+            self.niveles[nivel] = np.concatenate([self.niveles[nivel], items])
+        self.n += otro.n
+        self.minimo = min(self.minimo, otro.minimo)
+        self.maximo = max(self.maximo, otro.maximo)
+        self._compactar()
+        self._ponderados = None
+        return self
+
+    def serializar(self):
+        """Devuelve el estado del sketch como bytes (JSON) para guardarlo o enviarlo."""
+        # Sin datos, el mínimo y el máximo son infinitos, que JSON no admite
+        vacio = self.n == 0
+        estado = {
+            "error": self.error,
+            "k": self.k,
+            "n": self.n,
+            "minimo": None if vacio else self.minimo,
+            "maximo": None if vacio else self.maximo,
+            "niveles": [items.tolist() for items in self.niveles],
+        }
+        return json.dumps(estado).encode("utf-8")
+
+    @classmethod
+    def deserializar(cls, contenido, semilla=None):
+        """Reconstruye un sketch a partir de lo devuelto por serializar()."""
+        estado = json.loads(contenido)
+        sketch = cls(error=estado["error"], semilla=semilla)
+        sketch.k = estado["k"]
+        sketch.n = estado["n"]
+        if estado["n"]:
+            sketch.minimo = estado["minimo"]
+            sketch.maximo = estado["maximo"]
+        sketch.niveles = [np.asarray(items, dtype=np.float64) for items in estado["niveles"]]
+        return sketch
+
+    def _valores_ponderados(self):
+        """Valores guardados ordenados junto con su peso acumulado."""
+        if self._ponderados is None:
+            valores = np.concatenate(self.niveles)
+            pesos = np.concatenate([np.full(len(items), 2 ** h, dtype=np.int64)
+                                    for h, items in enumerate(self.niveles)])
+            orden = np.argsort(valores, kind="stable")
+            self._ponderados = (valores[orden], np.cumsum(pesos[orden]))
+        return self._ponderados
+
+    def percentiles(self, ps):
+        """
+        Aproxima varios percentiles a la vez.
+
+        Args:
+            ps (list): Percentiles pedidos, cada uno entre 0 y 100.
+
+        Returns:
+            list: Un valor por cada percentil, en el mismo orden.
+        """
+        ps = np.asarray(ps, dtype=np.float64)
+        if np.any((ps < 0) | (ps > 100)):
+            raise ValueError("El percentil debe estar entre 0 y 100.")
+        if self.n == 0: return [0] * len(ps)
+
+        valores, acumulado = self._valores_ponderados()
+        # Misma regla de interpolación lineal que VariableCuantitativa.percentil,
+        # aplicada sobre los rangos aproximados
+        indices = (ps / 100) * (self.n - 1)
+        bajos = np.floor(indices)
+        fracciones = indices - bajos
+        valores_bajos = valores[np.searchsorted(acumulado, bajos, side="right")]
+        altos = np.minimum(np.searchsorted(acumulado, bajos + 1, side="right"), len(valores) - 1)
+        valores_altos = valores[altos]
+        resultado = valores_bajos + (valores_altos - valores_bajos) * fracciones
+        resultado = np.clip(resultado, self.minimo, self.maximo)
+        resultado[ps == 0] = self.minimo
+        resultado[ps == 100] = self.maximo
+        return resultado.tolist()
+
+    def percentil(self, p):
+        if not 0 <= p <= 100:
+            raise ValueError("El percentil debe estar entre 0 y 100.")
+        return self.percentiles([p])[0]
+
+    def mediana(self):
+        return self.percentil(50)
+
+    def cuartiles(self):
+        q1, q2, q3 = self.percentiles([25, 50, 75])
+        return {'Q1': q1, 'Q2': q2, 'Q3': q3}
+
+    def rango_intercuartilico(self):
+        cuartiles = self.cuartiles()
+        return cuartiles['Q3'] - cuartiles['Q1']
+
+    def limites_atipicos(self):
+        """
+        Límites del método del IQR usados por detectar_atipicos.
+
+        Returns:
+            dict: Límites 'inferior' y 'superior'.
+        """
+        cuartiles = self.cuartiles()
+        iqr = cuartiles['Q3'] - cuartiles['Q1']
+        return {'inferior': cuartiles['Q1'] - 1.5 * iqr, 'superior': cuartiles['Q3'] + 1.5 * iqr}
 
 class VariableCuantitativa(Variable):
     """
     Heredamos de la clase Variable toda su información 
+
+    Si se indica error_cuantiles, los percentiles, la mediana, los cuartiles
+    y los límites de atípicos se aproximan con un SketchCuantiles en lugar de
+    ordenar toda la columna.
     """
-    def __init__(self, datos, nombre=None):
+    def __init__(self, datos, nombre=None, error_cuantiles=None):
         super().__init__(datos, nombre=nombre)
+        self.error_cuantiles = error_cuantiles
 
         if self.tipo != "cuantitativa":
             raise TypeError(f"La variable '{self.nombre}' no parece ser cuantitativa.")
         
-        # Convertimos la Serie de Pandas a una lista de Python para los cálculos
-        self.datos = self.datos.astype(float).tolist()
+        # Guardamos los datos como un arreglo contiguo de float64 para poder
+        # vectorizar los cálculos (no se copia si la Serie ya es numérica y,
+        # si detectar_tipo ya convirtió los datos, se reutiliza esa conversión)
+        if self._valores_float is not None:
+            valores = self._valores_float
+            self._valores_float = None
+        else:
+            valores = self.datos.to_numpy(dtype=np.float64)
+        self.datos = np.ascontiguousarray(valores)
+        # Vista ordenada de los datos, se construye la primera vez que se necesita,
+        # y lotes ordenados de agregar() que todavía no se mezclaron con ella
+        self._ordenados = None
+        self._ordenados_origen = None
+        self._corridas = []
+        # Momentos de la variable, se calculan en una sola pasada al primer uso
+        self._momentos = None
+        self._momentos_origen = None
+        # Sketch de cuantiles, solo se usa si se pidió error_cuantiles
+        self._sketch = None
+        self._sketch_origen = None
+        # Huella de los datos para la caché de resultados en disco, y el hash del que sale
+        self._huella = None
+        self._huella_origen = None
+        self._hash = None
+        # Mínimo y máximo, y el arreglo con espacio libre que usa agregar()
+        self._extremos = None
+        self._extremos_origen = None
+        self._buffer = None
+
+    def detectar_tipo(self):
+        """
+        Como Variable.detectar_tipo, pero guarda la conversión a float (si la
+        hubo) para que __init__ no vuelva a convertir la columna.
+        """
+        tipo, self._valores_float = self._clasificar(self.datos)
+        return tipo
 
     def __str__(self):
         """
@@ -53,87 +602,286 @@ class VariableCuantitativa(Variable):
         return (f"VariableCuantitativa(nombre='{self.nombre}', n={self.n}, "
                 f"media={self.media():.2f}, std={self.desviacion_estandar():.2f})")
 
+    def _datos_ordenados(self):
+        """
+        Devuelve los datos ordenados. Se ordenan una sola vez y se reutilizan
+        en todos los estadísticos de orden mientras self.datos no cambie.
+        """
+        if self._ordenados is None or self._ordenados_origen is not self.datos:
+            self._ordenados = np.sort(self.datos)
+            self._ordenados_origen = self.datos
+            self._corridas = []
+        elif self._corridas:
+            # Lotes agregados con agregar(): se mezclan con la vista ordenada recién
+            # ahora. El orden "stable" (timsort) aprovecha que cada parte ya está ordenada
+            self._ordenados = np.sort(np.concatenate([self._ordenados, *self._corridas]), kind="stable")
+            self._corridas = []
+        return self._ordenados
+
+    def _momentos_datos(self):
+        """
+        Devuelve el AcumuladorMomentos de la variable. Se llena con una sola
+        pasada sobre los datos y lo comparten todos los métodos basados en momentos.
+        """
+        if self._momentos is None or self._momentos_origen is not self.datos:
+            self._momentos = AcumuladorMomentos.desde_datos(self.datos)
+            self._momentos_origen = self.datos
+        return self._momentos
+
+    def _sketch_datos(self):
+        """Devuelve el SketchCuantiles de la variable, construido al primer uso."""
+        if self._sketch is None or self._sketch_origen is not self.datos:
+            self._sketch = SketchCuantiles(error=self.error_cuantiles).actualizar(self.datos)
+            self._sketch_origen = self.datos
+        return self._sketch
+
+    def _extremos_datos(self):
+        """Devuelve (mínimo, máximo) de los datos, calculados al primer uso."""
+        if self._extremos is None or self._extremos_origen is not self.datos:
+            self._extremos = (float(self.datos.min()), float(self.datos.max()))
+            self._extremos_origen = self.datos
+        return self._extremos
+
+    def _huella_datos(self):
+        """
+        Huella (hash) de los datos, usada como clave en CACHE_RESULTADOS.
+        Incluye error_cuantiles porque cambia los resultados de los percentiles.
+        """
+        if self._huella is None or self._huella_origen is not self.datos:
+            # Se guarda el estado del hash para que agregar() pueda seguirlo con
+            # los datos nuevos y obtener la misma huella que una variable nueva
+            self._hash = hashlib.blake2b(memoryview(np.ascontiguousarray(self.datos)), digest_size=20)
+            self._huella = (self._hash.hexdigest(), self.error_cuantiles)
+            self._huella_origen = self.datos
+        return self._huella
+
+    def __getstate__(self):
+        # El estado de un hash de hashlib no se puede serializar; se recalcula si hace falta
+        estado = self.__dict__.copy()
+        estado["_hash"] = None
+        if estado["_huella_origen"] is not None:
+            estado["_huella"] = estado["_huella_origen"] = None
+        return estado
+
+    def _invalidar_cache(self):
+        """Descarta la vista ordenada, los momentos, el sketch y la huella; se llama cuando cambian los datos."""
+        self._ordenados = None
+        self._ordenados_origen = None
+        self._corridas = []
+        self._momentos = None
+        self._momentos_origen = None
+        self._sketch = None
+        self._sketch_origen = None
+        self._huella = None
+        self._huella_origen = None
+        self._hash = None
+        self._extremos = None
+        self._extremos_origen = None
+
+    def agregar(self, datos):
+        """
+        Agrega nuevos datos a la variable sin recalcular todo desde cero: los
+        momentos, el mínimo y el máximo, el sketch y la huella se actualizan
+        solo con el lote nuevo, y el lote ordenado se guarda aparte para
+        mezclarlo con la vista ordenada (si existe) recién cuando se la pida.
+        Así el costo de cada llamada depende del tamaño del lote y no del
+        total (salvo cuando se llena el arreglo de datos, que se guarda con
+        espacio libre y duplica su capacidad).
+
+        Args:
+            datos (list, np.ndarray, pd.Series): Lote de valores nuevos.
+
+        Returns:
+            VariableCuantitativa: La misma variable, para encadenar llamadas.
+        """
+        lote = (datos if isinstance(datos, pd.Series) else pd.Series(datos)).dropna()
+        tipo, valores = self._clasificar(lote)
+        if tipo != "cuantitativa":
+            raise TypeError(f"Los datos agregados a '{self.nombre}' no parecen ser cuantitativos.")
+        if valores is None:
+            valores = lote.to_numpy(dtype=np.float64)
+        if len(valores) == 0:
+            return self
+
+        total = self.n + len(valores)
+        if self._buffer is None or len(self._buffer) < total:
+            buffer = np.empty(max(2 * total, 1024), dtype=np.float64)
+            buffer[:self.n] = self.datos
+            self._buffer = buffer
+        self._buffer[self.n:total] = valores
+        anteriores = self.datos
+        self.datos = self._buffer[:total]
+        self.n = total
+
+        # Solo se actualiza lo que ya estaba calculado para los datos anteriores
+        if self._momentos is not None and self._momentos_origen is anteriores:
+            self._momentos.actualizar(valores)
+            self._momentos_origen = self.datos
+        if self._extremos is not None and self._extremos_origen is anteriores:
+            minimo, maximo = self._extremos
+            self._extremos = (min(minimo, float(valores.min())), max(maximo, float(valores.max())))
+            self._extremos_origen = self.datos
+        if self._ordenados is not None and self._ordenados_origen is anteriores:
+            self._corridas.append(np.sort(valores))
+            self._ordenados_origen = self.datos
+        if self._sketch is not None and self._sketch_origen is anteriores:
+            self._sketch.actualizar(valores)
+            self._sketch_origen = self.datos
+        if self._huella is not None and self._huella_origen is anteriores and self._hash is not None:
+            # Seguir el hash con el lote da la misma huella que hashear todos los datos juntos
+            self._hash.update(memoryview(np.ascontiguousarray(valores)))
+            self._huella = (self._hash.hexdigest(), self.error_cuantiles)
+            self._huella_origen = self.datos
+        return self
+
+    def ventana(self, tamano, tipo="deslizante", tiempos=None, min_periodos=None):
+        """
+        Devuelve una VentanaCuantitativa para calcular estadísticos móviles
+        (deslizantes) o por bloques (fijos) de esta variable.
+        """
+        return VentanaCuantitativa(self, tamano, tipo=tipo, tiempos=tiempos, min_periodos=min_periodos)
+
+    def por_grupo(self, grupos):
+        """
+        Resume la variable para cada categoría de una VariableCualitativa
+        alineada con ella (ver EstadisticasPorGrupo).
+
+        Returns:
+            pd.DataFrame: Una fila por categoría y una columna por estadístico.
+        """
+        return EstadisticasPorGrupo(self, grupos).tabla()
+
+    def correlacion(self, otra, metodo="pearson"):
+        """
+        Correlación entre esta variable y otra alineada dato a dato.
+
+        Args:
+            otra (VariableCuantitativa): Variable con la misma cantidad de datos.
+            metodo (str): "pearson" o "spearman".
+        """
+        if metodo not in ("pearson", "spearman"):
+            raise ValueError("El método debe ser 'pearson' o 'spearman'.")
+        matriz = getattr(MatrizCorrelacion([self, otra]), metodo)()
+        return float(matriz.iloc[0, 1])
+
+    def intervalo_confianza(self, estadistico, *args, nivel=0.95, remuestras=10_000, semilla=None,
+                            max_trabajadores=None):
+        """
+        Intervalo de confianza bootstrap de cualquiera de los estadísticos de
+        la variable (ver Bootstrap), por ejemplo intervalo_confianza("mediana").
+        """
+        bootstrap = Bootstrap(self, remuestras=remuestras, semilla=semilla, max_trabajadores=max_trabajadores)
+        return bootstrap.intervalo(estadistico, *args, nivel=nivel)
+
+    @memoizar_en_disco
     def media(self):
         if self.n == 0: return 0
-        return sum(self.datos) / self.n
+        return self._momentos_datos().media
 
+    @memoizar_en_disco
     def varianza(self, es_muestra=True):
-        if es_muestra and self.n < 2: return 0
-        if not es_muestra and self.n < 1: return 0
-        
-        media_val = self.media()
-        suma_cuadrados = sum((x - media_val) ** 2 for x in self.datos)
-        
-        return suma_cuadrados / (self.n - 1) if es_muestra else suma_cuadrados / self.n
+        return self._momentos_datos().varianza(es_muestra)
 
+    @memoizar_en_disco
     def desviacion_estandar(self, es_muestra=True):
         return math.sqrt(self.varianza(es_muestra))
 
+    @memoizar_en_disco
     def mediana(self):
         if self.n == 0: return 0
-        datos_ordenados = sorted(self.datos)
+        if self.error_cuantiles is not None:
+            return self._sketch_datos().mediana()
+        datos_ordenados = self._datos_ordenados()
         indice_medio = self.n // 2
         
         if self.n % 2 == 1:
-            return datos_ordenados[indice_medio]
+            return float(datos_ordenados[indice_medio])
         else:
-            return (datos_ordenados[indice_medio - 1] + datos_ordenados[indice_medio]) / 2
+            return float(datos_ordenados[indice_medio - 1] + datos_ordenados[indice_medio]) / 2
 
+    @memoizar_en_disco
     def percentil(self, p):
         if not 0 <= p <= 100:
             raise ValueError("El percentil debe estar entre 0 y 100.")
         if self.n == 0: return 0
+        if self.error_cuantiles is not None:
+            return self._sketch_datos().percentil(p)
 
-        datos_ordenados = sorted(self.datos)
+        datos_ordenados = self._datos_ordenados()
         indice = (p / 100) * (self.n - 1)
         
-        if indice.is_integer():
-            return datos_ordenados[int(indice)]
+        if float(indice).is_integer():
+            return float(datos_ordenados[int(indice)])
         else:
             indice_bajo = int(indice)
             indice_alto = indice_bajo + 1
             fraccion = indice - indice_bajo
-            return datos_ordenados[indice_bajo] + (datos_ordenados[indice_alto] - datos_ordenados[indice_bajo]) * fraccion
+            return float(datos_ordenados[indice_bajo] + (datos_ordenados[indice_alto] - datos_ordenados[indice_bajo]) * fraccion)
             
+    @memoizar_en_disco
+    def percentiles(self, ps):
+        """
+        Calcula varios percentiles con una sola selección sobre los datos.
+
+        Usa la vista ordenada si ya existe; si no, hace un único np.partition
+        con todas las posiciones necesarias. La interpolación es la misma de
+        percentil().
+
+        Args:
+            ps (list): Percentiles pedidos, cada uno entre 0 y 100.
+
+        Returns:
+            list: Un valor por cada percentil, en el mismo orden.
+        """
+        ps = np.asarray(ps, dtype=np.float64)
+        if np.any((ps < 0) | (ps > 100)):
+            raise ValueError("El percentil debe estar entre 0 y 100.")
+        if self.n == 0: return [0] * len(ps)
+        if self.error_cuantiles is not None:
+            return self._sketch_datos().percentiles(ps)
+
+        indices = (ps / 100) * (self.n - 1)
+        bajos = np.floor(indices).astype(np.int64)
+        altos = np.minimum(bajos + 1, self.n - 1)
+        fracciones = indices - bajos
+
+        if self._ordenados is not None and self._ordenados_origen is self.datos:
+            seleccion = self._datos_ordenados()
+        else:
+            seleccion = np.partition(self.datos, np.unique(np.concatenate([bajos, altos])))
+        valores_bajos = seleccion[bajos]
+        valores_altos = seleccion[altos]
+        return (valores_bajos + (valores_altos - valores_bajos) * fracciones).tolist()
+
+    @memoizar_en_disco
     def rango(self):
         if self.n == 0: return 0
-        return max(self.datos) - min(self.datos)
+        minimo, maximo = self._extremos_datos()
+        return maximo - minimo
     
+    @memoizar_en_disco
     def coeficiente_variacion(self):
         media_val = self.media()
         if media_val == 0: return float('inf')
         return (self.desviacion_estandar() / abs(media_val)) * 100
     
+    @memoizar_en_disco
     def asimetria(self):
+        return self._momentos_datos().asimetria()
 
-        if self.n < 3: return 0 # No está bien definida para pocos datos
-        media_val = self.media()
-
-        std_dev = self.desviacion_estandar(es_muestra=False)
-        if std_dev == 0: return 0
-        
-        tercer_momento = sum(((x - media_val) / std_dev) ** 3 for x in self.datos)
-        return (self.n / ((self.n - 1) * (self.n - 2))) * tercer_momento # Corrección de sesgo muestral
-
+    @memoizar_en_disco
     def curtosis(self):
-        if self.n < 4: return 0 # No está bien definida para pocos datos
-        media_val = self.media()
-        std_dev = self.desviacion_estandar(es_muestra=False)
-        if std_dev == 0: return 0
-        # Suma del cuarto momento estandarizado
-        cuarto_momento = sum(((x - media_val) / std_dev) ** 4 for x in self.datos)
-        # Se resta 3 para que una distribución normal tenga curtosis de 0 (exceso de curtosis)
-        return (cuarto_momento / self.n) - 3
+        return self._momentos_datos().curtosis()
     
+    @memoizar_en_disco
     def cuartiles(self):
         """
         Calcula el primer cuartil (Q1), el segundo (Q2, la mediana) y el tercer cuartil (Q3).
         """
-        q1 = self.percentil(25)
-        q2 = self.mediana()
-        q3 = self.percentil(75)
+        q1, q2, q3 = self.percentiles([25, 50, 75])
         return {'Q1': q1, 'Q2': q2, 'Q3': q3}
     
+    @memoizar_en_disco
     def rango_intercuartilico(self):
         """
         Calcula el Rango Intercuartílico (IQR = Q3 - Q1).
@@ -141,6 +889,7 @@ class VariableCuantitativa(Variable):
         cuartiles = self.cuartiles()
         return cuartiles['Q3'] - cuartiles['Q1']
     
+    @memoizar_en_disco
     def detectar_atipicos(self):
         """
         Identifica valores atípicos leves usando el método del IQR.
@@ -149,16 +898,91 @@ class VariableCuantitativa(Variable):
             dict: Un diccionario con listas de valores atípicos inferiores y superiores.
         """
         cuartiles = self.cuartiles()
-        iqr = self.rango_intercuartilico()
+        iqr = cuartiles['Q3'] - cuartiles['Q1']
         
         limite_inferior = cuartiles['Q1'] - 1.5 * iqr
         limite_superior = cuartiles['Q3'] + 1.5 * iqr
         
-        atipicos_inf = [x for x in self.datos if x < limite_inferior]
-        atipicos_sup = [x for x in self.datos if x > limite_superior]
+        atipicos_inf = self.datos[self.datos < limite_inferior].tolist()
+        atipicos_sup = self.datos[self.datos > limite_superior].tolist()
         
         return {'inferiores': atipicos_inf, 'superiores': atipicos_sup}
     
+    @memoizar_en_disco
+    def histograma(self, bins='auto'):
+        """
+        Cuenta los datos por intervalo en una sola pasada vectorizada.
+
+        Para las reglas 'auto', 'fd', 'sturges', 'scott', 'rice' y 'sqrt' el
+        ancho de los intervalos se obtiene de estadísticos ya calculados (n,
+        extremos, IQR y desviación), con las mismas fórmulas que numpy, así
+        que solo se recorren los datos para contar.
+
+        Args:
+            bins (int, str, array): Cantidad de intervalos, regla o bordes.
+
+        Returns:
+            tuple: (conteos, bordes), como np.histogram.
+        """
+        if self.n == 0:
+            return np.zeros(0, dtype=np.int64), np.zeros(1)
+        if isinstance(bins, str) and bins in ('auto', 'fd', 'sturges', 'scott', 'rice', 'sqrt'):
+            minimo, maximo = self._extremos_datos()
+            amplitud = maximo - minimo
+            sturges = amplitud / (np.log2(self.n) + 1.0)
+            fd = 2.0 * self.rango_intercuartilico() * self.n ** (-1.0 / 3.0)
+            raiz = amplitud / np.sqrt(self.n)
+            anchos = {
+                'sturges': sturges,
+                'fd': fd,
+                # Igual que numpy: FD acotado para no generar demasiados intervalos
+                'auto': min(max(fd, raiz / 2), sturges),
+                'scott': (24.0 * np.pi ** 0.5 / self.n) ** (1.0 / 3.0) * self.desviacion_estandar(es_muestra=False),
+                'rice': amplitud / (2.0 * self.n ** (1.0 / 3)),
+                'sqrt': raiz,
+            }
+            ancho = anchos[bins]
+            cantidad = int(np.ceil(amplitud / ancho)) if ancho else 1
+            return np.histogram(self.datos, bins=cantidad, range=(minimo, maximo))
+        if isinstance(bins, (int, np.integer)):
+            return np.histogram(self.datos, bins=bins, range=self._extremos_datos())
+        return np.histogram(self.datos, bins=bins)
+
+    def resumen_dict(self):
+        """
+        Devuelve el resumen de la variable como diccionario, con tipos nativos
+        de Python para poder serializarlo directamente (ver ExportadorResumenes).
+        Los momentos, cuartiles y extremos se calculan una sola vez.
+
+        Returns:
+            dict: Nombre, tipo, n y todos los estadísticos de resumen().
+        """
+        if self.n == 0:
+            return {"nombre": self.nombre, "tipo": self.tipo, "n": 0}
+        cuartiles = self.cuartiles()
+        atipicos = self.detectar_atipicos()
+        minimo, maximo = self._extremos_datos()
+        return {
+            "nombre": self.nombre,
+            "tipo": self.tipo,
+            "n": self.n,
+            "media": float(self.media()),
+            "mediana": float(cuartiles['Q2']),
+            "desviacion_estandar": float(self.desviacion_estandar()),
+            "varianza": float(self.varianza()),
+            "minimo": minimo,
+            "Q1": float(cuartiles['Q1']),
+            "Q3": float(cuartiles['Q3']),
+            "maximo": maximo,
+            "rango": float(self.rango()),
+            "rango_intercuartilico": float(cuartiles['Q3'] - cuartiles['Q1']),
+            "coeficiente_variacion": float(self.coeficiente_variacion()),
+            "asimetria": float(self.asimetria()),
+            "curtosis": float(self.curtosis()),
+            "atipicos_inferiores": len(atipicos['inferiores']),
+            "atipicos_superiores": len(atipicos['superiores']),
+        }
+
     def resumen(self):
         """
         Imprime un resumen estadístico completo y formateado de la variable.
@@ -179,10 +1003,11 @@ class VariableCuantitativa(Variable):
         print("---------------------------------------------")
         
         cuartiles = self.cuartiles()
-        print(f"Mínimo:                   {min(self.datos) if self.n > 0 else 0:.4f}")
+        minimo, maximo = self._extremos_datos() if self.n > 0 else (0, 0)
+        print(f"Mínimo:                   {minimo:.4f}")
         print(f"Cuartil 1 (Q1 - 25%):     {cuartiles.get('Q1', 0):.4f}")
         print(f"Cuartil 3 (Q3 - 75%):     {cuartiles.get('Q3', 0):.4f}")
-        print(f"Máximo:                   {max(self.datos) if self.n > 0 else 0:.4f}")
+        print(f"Máximo:                   {maximo:.4f}")
         print("---------------------------------------------")
 
         atipicos = self.detectar_atipicos()
@@ -196,68 +1021,715 @@ class VariableCuantitativa(Variable):
             print("Valores Atípicos:         No detectados")
 
         print("======================================================")
-class VisualizadorEstadistico:
+class AcumuladorCuantitativo:
     """
-    Clase dedicada exclusivamente a crear visualizaciones estadísticas
-    a partir de un objeto de análisis de variables.
+    Contraparte por bloques de VariableCuantitativa para archivos que no caben
+    en memoria. Recibe los datos en partes (por ejemplo, los bloques de
+    pd.read_csv(..., chunksize=...)) y solo guarda los momentos, el mínimo y
+    el máximo, así que la memoria usada no depende del tamaño del archivo.
+
+    Dos acumuladores parciales (por ejemplo, de distintos procesos que leen
+    partes diferentes del archivo) pueden combinarse con combinar().
+
+    Si se indica error_cuantiles también se mantiene un SketchCuantiles, con
+    el que se aproximan percentiles, cuartiles y límites de atípicos.
     """
-    def __init__(self, variable: VariableCuantitativa):
+    def __init__(self, nombre="Sin Nombre", error_cuantiles=None):
+        self.nombre = nombre
+        self.momentos = AcumuladorMomentos()
+        self.minimo = math.inf
+        self.maximo = -math.inf
+        self.sketch = SketchCuantiles(error=error_cuantiles) if error_cuantiles is not None else None
+
+    @property
+    def n(self):
+        return self.momentos.n
+
+    @classmethod
+    def desde_csv(cls, ruta, columna, tamano_bloque=1_000_000, error_cuantiles=None, **kwargs):
         """
-        El constructor recibe el objeto con los datos y cálculos.
-        
+        Recorre un CSV por bloques leyendo solo la columna pedida.
+
         Args:
-            variable (VariableCuantitativa): El objeto de análisis que se va a visualizar.
+            ruta (str): Ruta del archivo CSV.
+            columna (str): Nombre de la columna a analizar.
+            tamano_bloque (int): Cantidad de filas leídas en cada bloque.
+            error_cuantiles (float, optional): Activa el sketch de cuantiles con este error.
+            **kwargs: Argumentos adicionales para pd.read_csv.
         """
-        if not isinstance(variable, VariableCuantitativa):
-            raise TypeError("Se requiere un objeto de tipo VariableCuantitativa.")
-        self.variable = variable
+        acumulador = cls(nombre=columna, error_cuantiles=error_cuantiles)
+        for bloque in pd.read_csv(ruta, usecols=[columna], chunksize=tamano_bloque, **kwargs):
+            acumulador.agregar_bloque(bloque[columna])
+        return acumulador
 
-    def graficar_histograma(self, bins='auto'):
-        """Genera un histograma de la variable."""
-        plt.hist(self.variable.datos, bins=bins, edgecolor='black', alpha=0.7)
-        plt.title(f'Histograma de {self.variable.nombre}')
-        plt.xlabel('Valores')
-        plt.ylabel('Frecuencia')
-        plt.grid(axis='y', linestyle='--', alpha=0.7)
-        plt.show()
+    def agregar_bloque(self, datos):
+        """
+        Incorpora un bloque de datos. Los valores faltantes se descartan.
 
-    def graficar_boxplot(self):
-        """Genera un diagrama de caja de la variable."""
-        plt.boxplot(self.variable.datos, vert=False, patch_artist=True)
-        plt.title(f'Diagrama de Caja de {self.variable.nombre}')
-        plt.xlabel('Valores')
-        plt.grid(True, linestyle='--', alpha=0.6)
-        plt.show()
-        
-# Clase cualitativas
-class VariableCualitativa(Variable):
-    def __init__(self, nombre, datos):
-        super().__init__(nombre, datos)
+        Args:
+            datos (list, np.ndarray, pd.Series): Bloque de valores numéricos.
+        """
+        if not isinstance(datos, pd.Series):
+            datos = pd.Series(datos)
+        datos = datos.dropna()
+        try:
+            valores = datos.to_numpy(dtype=np.float64)
+        except (TypeError, ValueError):
+            raise TypeError(f"La variable '{self.nombre}' no parece ser cuantitativa.")
+        if len(valores) == 0:
+            return self
 
-    def calcular_moda(self):
-        conteo = self.datos.value_counts()
-        valor_moda = conteo.idxmax()
-        frecuencia = conteo.max()
-        return valor_moda, frecuencia
+        self.momentos.actualizar(valores)
+        self.minimo = min(self.minimo, float(valores.min()))
+        self.maximo = max(self.maximo, float(valores.max()))
+        if self.sketch is not None:
+            self.sketch.actualizar(valores)
+        return self
 
-    def calcular_menos_frecuente(self):
-        conteo = self.datos.value_counts()
-        valor_menos = conteo.idxmin()
-        frecuencia_menos = conteo.min()
-        return valor_menos, frecuencia_menos
+    def combinar(self, otro):
+        """
+        Combina en este acumulador el estado parcial de otro.
+
+        Args:
+            otro (AcumuladorCuantitativo): Acumulador de otra parte de los datos.
+        """
+        if (self.sketch is None) != (otro.sketch is None):
+            raise ValueError("Solo se pueden combinar acumuladores que usen (o no) sketch de cuantiles.")
+        self.momentos.combinar(otro.momentos)
+        self.minimo = min(self.minimo, otro.minimo)
+        self.maximo = max(self.maximo, otro.maximo)
+        if self.sketch is not None:
+            self.sketch.combinar(otro.sketch)
+        return self
+
+    def media(self):
+        if self.n == 0: return 0
+        return self.momentos.media
+
+    def varianza(self, es_muestra=True):
+        return self.momentos.varianza(es_muestra)
+
+    def desviacion_estandar(self, es_muestra=True):
+        return math.sqrt(self.varianza(es_muestra))
+
+    def rango(self):
+        if self.n == 0: return 0
+        return self.maximo - self.minimo
+
+    def coeficiente_variacion(self):
+        media_val = self.media()
+        if media_val == 0: return float('inf')
+        return (self.desviacion_estandar() / abs(media_val)) * 100
+
+    def asimetria(self):
+        return self.momentos.asimetria()
+
+    def curtosis(self):
+        return self.momentos.curtosis()
+
+    def _sketch_requerido(self):
+        if self.sketch is None:
+            raise ValueError(f"El acumulador '{self.nombre}' no tiene sketch de cuantiles; "
+                             "créalo con error_cuantiles para calcular percentiles.")
+        return self.sketch
+
+    def percentil(self, p):
+        return self._sketch_requerido().percentil(p)
+
+    def percentiles(self, ps):
+        return self._sketch_requerido().percentiles(ps)
+
+    def mediana(self):
+        return self._sketch_requerido().mediana()
+
+    def cuartiles(self):
+        return self._sketch_requerido().cuartiles()
+
+    def rango_intercuartilico(self):
+        return self._sketch_requerido().rango_intercuartilico()
+
+    def limites_atipicos(self):
+        return self._sketch_requerido().limites_atipicos()
+
+def _combinar_momentos(a, b):
+    """
+    Versión vectorizada de AcumuladorMomentos.combinar: une elemento a
+    elemento los momentos (n, media, M2, M3, M4) de dos partes de los datos.
+    Si una de las partes está vacía (n = 0) el resultado es la otra.
+    """
+    na, media_a, m2a, m3a, m4a = a
+    nb, media_b, m2b, m3b, m4b = b
+    n = na + nb
+    delta = media_b - media_a
+    delta_n = delta / np.maximum(n, 1)
+    delta_n2 = delta_n * delta_n
+    termino = delta * delta_n * na * nb
+
+    m4 = (m4a + m4b
+          + termino * delta_n2 * (na * na - na * nb + nb * nb)
+          + 6.0 * delta_n2 * (na * na * m2b + nb * nb * m2a)
+          + 4.0 * delta_n * (na * m3b - nb * m3a))
+    m3 = (m3a + m3b
+          + termino * delta_n * (na - nb)
+          + 3.0 * delta_n * (na * m2b - nb * m2a))
+    m2 = m2a + m2b + termino
+    return n, media_a + delta_n * nb, m2, m3, m4
+
+
+def _momentos_rangos(datos, inicio, fin):
+    """
+    Momentos (n, media, M2, M3, M4) de datos[inicio[i]:fin[i]] para cada i.
+
+    Se precalculan los momentos de los bloques alineados de 2, 4, 8, ...
+    datos y cada rango se arma uniendo a lo sumo dos bloques por nivel con
+    las fórmulas de combinación de AcumuladorMomentos. Así cada ventana queda
+    centrada en su propia media (no hay restas de sumas de potencias grandes)
+    y el costo es O(n log w) para ventanas de hasta w datos.
+    """
+    cantidad = len(inicio)
+    inicio = np.asarray(inicio, dtype=np.int64).copy()
+    fin = np.asarray(fin, dtype=np.int64)
+    largo_maximo = int((fin - inicio).max()) if cantidad else 0
+    niveles = max(1, largo_maximo.bit_length())
+
+    # Bloques alineados: en el nivel L, el bloque j cubre datos[j*2^L:(j+1)*2^L].
+    # El nivel 0 son los datos mismos (n = 1 y momentos centrales nulos)
+    bloques = [(datos, None, None, None)]
+    for nivel in range(1, niveles):
+        media, m2, m3, m4 = bloques[-1]
+        pares = len(media) // 2
+        if pares == 0:
+            break
+        tamano = 2.0 ** (nivel - 1)
+        izquierda = [np.full(pares, tamano), media[0:2 * pares:2]]
+        derecha = [np.full(pares, tamano), media[1:2 * pares:2]]
+        for momento in (m2, m3, m4):
+            izquierda.append(0.0 if momento is None else momento[0:2 * pares:2])
+            derecha.append(0.0 if momento is None else momento[1:2 * pares:2])
+        bloques.append(_combinar_momentos(izquierda, derecha)[1:])
+
+    acumulado = [np.zeros(cantidad) for _ in range(5)]
+
+    def tomar(nivel, filas):
+        """Une a las filas indicadas el bloque de `nivel` que empieza en su inicio."""
+        media, m2, m3, m4 = bloques[nivel]
+        j = inicio[filas] >> nivel
+        bloque = [np.full(len(filas), 2.0 ** nivel), media[j]]
+        bloque += [0.0 if momento is None else momento[j] for momento in (m2, m3, m4)]
+        actual = [componente[filas] for componente in acumulado]
+        for componente, valor in zip(acumulado, _combinar_momentos(actual, bloque)):
+            componente[filas] = valor
+        inicio[filas] += 1 << nivel
+
+    # Primero se sube de nivel para alinear el inicio y después se baja
+    for nivel in range(len(bloques)):
+        tomar(nivel, np.flatnonzero(((inicio >> nivel) & 1 == 1) & (inicio + (1 << nivel) <= fin)))
+    for nivel in range(len(bloques) - 1, -1, -1):
+        tomar(nivel, np.flatnonzero(inicio + (1 << nivel) <= fin))
+    return tuple(acumulado)
+
+
+class VentanaCuantitativa:
+    """
+    Estadísticos de una VariableCuantitativa calculados por ventanas, con el
+    resultado alineado con los datos (un valor por dato).
+
+    - tipo="deslizante": en cada posición, los últimos `tamano` datos (o, si se
+      dan `tiempos`, los datos dentro del último intervalo `tamano`, por ejemplo "5min").
+    - tipo="fija": los datos se dividen en bloques consecutivos de `tamano`
+      datos (o intervalos de tiempo) y cada dato recibe el valor de su bloque.
+
+    Los momentos de cada ventana se arman uniendo momentos de bloques
+    precalculados (ver _momentos_rangos), de modo que cada ventana queda
+    centrada en su propia media aunque el nivel de los datos cambie mucho, y
+    los percentiles salen de rolling().quantile, que mantiene la ventana
+    ordenada en O(log w) por paso. Se usan las mismas fórmulas que
+    VariableCuantitativa.
+    """
+    def __init__(self, variable, tamano, tipo="deslizante", tiempos=None, min_periodos=None):
+        """
+        Args:
+            variable (VariableCuantitativa): Variable a analizar.
+            tamano (int, str): Cantidad de datos, o intervalo de tiempo si se dan `tiempos`.
+            tipo (str): "deslizante" o "fija".
+            tiempos (array-like, optional): Marca de tiempo de cada dato (ordenadas).
+            min_periodos (int, optional): Mínimo de datos para dar un resultado; si
+                                          no se alcanza, el resultado es NaN. Por
+                                          defecto, `tamano` para ventanas de datos y 1
+                                          para ventanas de tiempo.
+        """
+        if tipo not in ("deslizante", "fija"):
+            raise ValueError("El tipo de ventana debe ser 'deslizante' o 'fija'.")
+        if tiempos is None and (not isinstance(tamano, (int, np.integer)) or tamano < 1):
+            raise ValueError("Sin tiempos, el tamaño de la ventana debe ser un entero positivo.")
+        self.variable = variable
+        self.tamano = tamano
+        self.tipo = tipo
+        self.min_periodos = min_periodos if min_periodos is not None else (1 if tiempos is not None else tamano)
+        indice = pd.DatetimeIndex(tiempos) if tiempos is not None else None
+        if indice is not None and len(indice) != variable.n:
+            raise ValueError("Debe haber un tiempo por cada dato de la variable.")
+        self._serie = pd.Series(variable.datos, index=indice, copy=False)
+        self._momentos_ventana = None
+
+    def _grupos(self):
+        """Código del bloque de cada dato (solo para ventanas fijas)."""
+        if self._serie.index.dtype.kind == "M":
+            return pd.factorize(self._serie.index.floor(self.tamano))[0]
+        return np.arange(len(self._serie)) // self.tamano
+
+    def _agregar(self, serie, funcion, *args, **kwargs):
+        """Aplica `funcion` (por ejemplo "sum" o "quantile") por ventana y alinea el resultado."""
+        if self.tipo == "deslizante":
+            movil = serie.rolling(self.tamano, min_periods=self.min_periodos)
+            return getattr(movil, funcion)(*args, **kwargs).to_numpy()
+        grupos = self._grupos()
+        por_grupo = getattr(serie.groupby(grupos), funcion)(*args, **kwargs).to_numpy()
+        cantidad = np.bincount(grupos)
+        por_grupo = np.where(cantidad >= self.min_periodos, por_grupo, np.nan)
+        return por_grupo[grupos]
+
+    def _limites(self):
+        """Inicio y fin (exclusivo) de la ventana de cada dato."""
+        cantidad = len(self._serie)
+        if self.tipo == "fija":
+            grupos = self._grupos()
+            # Los bloques son consecutivos porque los datos (o tiempos) están ordenados
+            cambios = np.flatnonzero(np.diff(grupos)) + 1
+            inicios = np.concatenate(([0], cambios))
+            fines = np.concatenate((cambios, [cantidad]))
+            return inicios[grupos], fines[grupos]
+        fin = np.arange(1, cantidad + 1)
+        if self._serie.index.dtype.kind == "M":
+            # Igual que rolling de pandas: intervalo (t - tamano, t]
+            tiempos = self._serie.index.to_numpy()
+            return np.searchsorted(tiempos, tiempos - pd.Timedelta(self.tamano), side="right"), fin
+        return np.maximum(fin - self.tamano, 0), fin
+
+    def _momentos(self):
+        """n, media y sumas de desvíos M2, M3 y M4 de cada ventana (n es NaN si no llega a min_periodos)."""
+        if self._momentos_ventana is None:
+            inicio, fin = self._limites()
+            if self.tipo == "fija":
+                # Cada bloque se calcula una sola vez y se reparte entre sus datos
+                inicios, posiciones = np.unique(inicio, return_inverse=True)
+                fines = fin[np.searchsorted(inicio, inicios)]
+                momentos = [m[posiciones] for m in _momentos_rangos(self.variable.datos, inicios, fines)]
+            else:
+                momentos = list(_momentos_rangos(self.variable.datos, inicio, fin))
+            incompletas = momentos[0] < self.min_periodos
+            self._momentos_ventana = tuple(np.where(incompletas, np.nan, m) for m in momentos)
+        return self._momentos_ventana
+
+    def media(self):
+        return self._momentos()[1]
+
+    def varianza(self, es_muestra=True):
+        n, _, m2, _, _ = self._momentos()
+        with np.errstate(invalid="ignore", divide="ignore"):
+            if es_muestra:
+                return np.where(n < 2, 0.0, m2 / (n - 1))
+            return np.where(n < 1, 0.0, m2 / n)
+
+    def desviacion_estandar(self, es_muestra=True):
+        return np.sqrt(self.varianza(es_muestra))
+
+    def asimetria(self):
+        n, _, m2, m3, _ = self._momentos()
+        std_dev = np.sqrt(self.varianza(es_muestra=False))
+        with np.errstate(invalid="ignore", divide="ignore"):
+            valor = (n / ((n - 1) * (n - 2))) * m3 / std_dev ** 3
+        valor = np.where((n < 3) | (std_dev == 0), 0.0, valor)
+        return np.where(np.isnan(n), np.nan, valor)
+
+    def curtosis(self):
+        n, _, m2, _, m4 = self._momentos()
+        std_dev = np.sqrt(self.varianza(es_muestra=False))
+        with np.errstate(invalid="ignore", divide="ignore"):
+            valor = (m4 / std_dev ** 4) / n - 3
+        valor = np.where((n < 4) | (std_dev == 0), 0.0, valor)
+        return np.where(np.isnan(n), np.nan, valor)
+
+    def percentil(self, p):
+        if not 0 <= p <= 100:
+            raise ValueError("El percentil debe estar entre 0 y 100.")
+        return self._agregar(self._serie, "quantile", p / 100, interpolation="linear")
+
+    def detectar_atipicos(self):
+        """
+        Marca cada dato que queda fuera de los límites del IQR de su ventana.
+
+        Returns:
+            dict: Máscaras booleanas 'inferiores' y 'superiores', alineadas con los datos.
+        """
+        q1 = self.percentil(25)
+        q3 = self.percentil(75)
+        iqr = q3 - q1
+        datos = self.variable.datos
+        return {'inferiores': datos < q1 - 1.5 * iqr, 'superiores': datos > q3 + 1.5 * iqr}
+
+def _renderizar_figura(dibujar, archivo=None, formato=None, tamano=None, dpi=100):
+    """
+    Dibuja un gráfico y lo muestra o lo guarda.
+
+    Sin `archivo` se usa pyplot y se muestra con plt.show(), como siempre.
+    Con `archivo` (ruta o buffer, por ejemplo io.BytesIO) se dibuja en una
+    Figure propia con el backend Agg, sin tocar el estado global de pyplot,
+    y la figura se libera al terminar.
+
+    Args:
+        dibujar (callable): Función que recibe los ejes y dibuja el gráfico.
+        archivo (str, file-like, optional): Destino de la imagen.
+        formato (str, optional): "png", "svg", etc. Por defecto, según la extensión (o "png").
+        tamano (tuple, optional): Tamaño de la figura en pulgadas.
+        dpi (int): Resolución de la imagen.
+
+    Returns:
+        El mismo `archivo`, o None si el gráfico se mostró en pantalla.
+    """
+    if archivo is None:
+        figura = plt.figure(figsize=tamano)
+        dibujar(figura.gca())
+        plt.show()
+        return None
+
+    if formato is None and not isinstance(archivo, (str, os.PathLike)):
+        formato = "png"
+    figura = Figure(figsize=tamano)
+    FigureCanvasAgg(figura)
+    try:
+        dibujar(figura.subplots())
+        figura.savefig(archivo, format=formato, dpi=dpi)
+    finally:
+        figura.clear()
+    return archivo
+
+
+# Funciones de dibujo: reciben los ejes y solo datos ya resumidos, así los
+# gráficos se pueden dibujar en otro proceso sin enviarle la columna entera
+
+def _dibujar_histograma(ax, nombre, conteos, bordes):
+    ax.hist(bordes[:-1], bins=bordes, weights=conteos, edgecolor='black', alpha=0.7)
+    ax.set_title(f'Histograma de {nombre}')
+    ax.set_xlabel('Valores')
+    ax.set_ylabel('Frecuencia')
+    ax.grid(axis='y', linestyle='--', alpha=0.7)
+
+
+def _dibujar_boxplot(ax, nombre, estadisticas):
+    # orientation existe desde matplotlib 3.10, que además marca vert como obsoleto
+    if "orientation" in inspect.signature(ax.bxp).parameters:
+        ax.bxp([estadisticas], orientation='horizontal', patch_artist=True)
+    else:
+        ax.bxp([estadisticas], vert=False, patch_artist=True)
+    ax.set_title(f'Diagrama de Caja de {nombre}')
+    ax.set_xlabel('Valores')
+    ax.grid(True, linestyle='--', alpha=0.6)
+
+
+def _dibujar_pastel(ax, nombre, frecuencias):
+    ax.pie(
+        frecuencias,
+        labels=frecuencias.index,
+        autopct='%1.1f%%',
+        startangle=90
+    )
+    ax.set_title(f"Distribución de {nombre}")
+
+
+def _dibujar_barras(ax, nombre, frecuencias):
+    ax.bar(frecuencias.index, frecuencias, color="skyblue", edgecolor="black")
+    ax.set_title(f"Frecuencia absoluta de {nombre}")
+    ax.set_xlabel("Categorías")
+    ax.set_ylabel("Frecuencia absoluta")
+    ax.tick_params(axis="x", labelrotation=45)
+    ax.figure.tight_layout()
+
+
+class VisualizadorEstadistico:
+    """
+    Clase dedicada exclusivamente a crear visualizaciones estadísticas
+    a partir de un objeto de análisis de variables.
+    """
+    def __init__(self, variable: VariableCuantitativa):
+        """
+        El constructor recibe el objeto con los datos y cálculos.
+        
+        Args:
+            variable (VariableCuantitativa): El objeto de análisis que se va a visualizar.
+        """
+        if not isinstance(variable, VariableCuantitativa):
+            raise TypeError("Se requiere un objeto de tipo VariableCuantitativa.")
+        self.variable = variable
+
+    MAX_ATIPICOS = 1000
+
+    def _preparar_histograma(self, bins='auto'):
+        """Función de dibujo, sus argumentos (los conteos por intervalo) y tamaño de la figura."""
+        conteos, bordes = self.variable.histograma(bins)
+        return _dibujar_histograma, {"nombre": self.variable.nombre, "conteos": conteos, "bordes": bordes}, None
+
+    def graficar_histograma(self, bins='auto', archivo=None, formato=None, dpi=100):
+        """
+        Genera un histograma de la variable a partir de los conteos de
+        VariableCuantitativa.histograma, así matplotlib solo dibuja un
+        rectángulo por intervalo sin recibir todos los datos.
+
+        Args:
+            bins (int, str): Cantidad de intervalos o regla para calcularlos.
+            archivo (str, file-like, optional): Si se indica, guarda la imagen en vez de mostrarla.
+            formato (str, optional): "png" o "svg". Por defecto, según la extensión.
+            dpi (int): Resolución de la imagen.
+        """
+        dibujo, argumentos, tamano = self._preparar_histograma(bins)
+        return _renderizar_figura(functools.partial(dibujo, **argumentos), archivo, formato, tamano, dpi)
+
+    def estadisticas_caja(self, max_atipicos=None):
+        """
+        Calcula lo necesario para dibujar el diagrama de caja con Axes.bxp,
+        usando cuartiles y detectar_atipicos de la variable.
+
+        Los bigotes llegan al dato más extremo dentro de 1.5 * IQR, igual que
+        en plt.boxplot; los bigotes y los atípicos se ubican con searchsorted
+        sobre la vista ordenada de la variable. Si hay más atípicos que
+        max_atipicos, se dibuja una muestra ordenada y equiespaciada de ellos
+        que conserva los extremos.
 
+        Args:
+            max_atipicos (int, optional): Máximo de atípicos a dibujar. Por defecto, MAX_ATIPICOS.
+
+        Returns:
+            dict: 'med', 'q1', 'q3', 'whislo', 'whishi', 'fliers' y 'label'.
+        """
+        max_atipicos = self.MAX_ATIPICOS if max_atipicos is None else max_atipicos
+        variable = self.variable
+        cuartiles = variable.cuartiles()
+        iqr = cuartiles['Q3'] - cuartiles['Q1']
+        limite_inf = cuartiles['Q1'] - 1.5 * iqr
+        limite_sup = cuartiles['Q3'] + 1.5 * iqr
+        if variable.error_cuantiles is None:
+            ordenados = variable._datos_ordenados()
+        else:
+            # Con el sketch no se ordena la columna entera: solo los datos fuera de la caja
+            datos = variable.datos
+            ordenados = np.sort(datos[(datos <= cuartiles['Q1']) | (datos >= cuartiles['Q3'])])
+        # Los atípicos son los datos antes de `inicio` y desde `fin`; los bigotes, los
+        # extremos del resto (sin entrar en la caja, como en matplotlib)
+        inicio = np.searchsorted(ordenados, limite_inf, side="left")
+        fin = np.searchsorted(ordenados, limite_sup, side="right")
+        bigote_inf = min(ordenados[inicio], cuartiles['Q1']) if inicio < len(ordenados) else cuartiles['Q1']
+        bigote_sup = max(ordenados[fin - 1], cuartiles['Q3']) if fin > 0 else cuartiles['Q3']
+
+        fliers = np.concatenate([ordenados[:inicio], ordenados[fin:]])
+        if len(fliers) > max_atipicos:
+            fliers = fliers[np.linspace(0, len(fliers) - 1, max_atipicos).round().astype(np.int64)]
+        return {
+            'med': cuartiles['Q2'],
+            'q1': cuartiles['Q1'],
+            'q3': cuartiles['Q3'],
+            'whislo': float(bigote_inf),
+            'whishi': float(bigote_sup),
+            'fliers': fliers,
+            'label': variable.nombre,
+        }
+
+    def _preparar_boxplot(self, max_atipicos=None):
+        """Función de dibujo, sus argumentos (las estadísticas de la caja) y tamaño de la figura."""
+        return _dibujar_boxplot, {"nombre": self.variable.nombre,
+                                  "estadisticas": self.estadisticas_caja(max_atipicos)}, None
+
+    def graficar_boxplot(self, archivo=None, formato=None, dpi=100, max_atipicos=None):
+        """
+        Genera un diagrama de caja de la variable a partir de sus cuartiles
+        y atípicos ya calculados (ver estadisticas_caja).
+
+        Args:
+            max_atipicos (int, optional): Máximo de atípicos a dibujar.
+            archivo (str, file-like, optional): Si se indica, guarda la imagen en vez de mostrarla.
+            formato (str, optional): "png" o "svg". Por defecto, según la extensión.
+            dpi (int): Resolución de la imagen.
+        """
+        dibujo, argumentos, tamano = self._preparar_boxplot(max_atipicos)
+        return _renderizar_figura(functools.partial(dibujo, **argumentos), archivo, formato, tamano, dpi)
+        
+# Clase cualitativas
+class VariableCualitativa(Variable):
+    def __init__(self, nombre, datos):
+        super().__init__(nombre, datos)
+        # Codificamos las categorías como enteros (igual que pd.Categorical):
+        # cada valor se guarda como un código y las etiquetas una sola vez
+        codigos, categorias = self._factorizar(self.datos)
+        self.datos = pd.Series(pd.Categorical.from_codes(codigos, categorias),
+                               index=self.datos.index, name=self.datos.name)
+        # Conteo por código, conteo por categoría y tabla de frecuencias, se calculan al primer uso
+        self._conteos = None
+        self._conteos_origen = None
+        self._conteo = None
+        self._tabla = None
+        self._indice = None
+        self._huella = None
+        self._huella_origen = None
+        # Arreglo de códigos con espacio libre que usa agregar()
+        self._buffer = None
+
+    @staticmethod
+    def _factorizar(serie):
+        """
+        Códigos enteros y etiquetas de una Serie. Las etiquetas quedan en orden
+        de aparición, salvo que los datos ya vengan como categóricos: ahí se
+        conservan las categorías declaradas (aunque no se usen) y su orden,
+        como hace value_counts().
+        """
+        if isinstance(serie.dtype, pd.CategoricalDtype):
+            return np.asarray(serie.array.codes), serie.cat.categories
+        return pd.factorize(serie)
+
+    def agregar(self, datos):
+        """
+        Agrega nuevos datos a la variable sin recalcular todo desde cero: el
+        lote se codifica con las categorías existentes (agregando las nuevas
+        al final) y el conteo por categoría se actualiza solo con el lote.
+        Los códigos se guardan en un arreglo con espacio libre que duplica su
+        capacidad al llenarse.
+
+        Args:
+            datos (list, np.ndarray, pd.Series): Lote de valores nuevos.
+
+        Returns:
+            VariableCualitativa: La misma variable, para encadenar llamadas.
+        """
+        lote = Variable(datos, self.nombre).datos
+        if len(lote) == 0:
+            return self
+
+        codigos_lote, unicos = self._factorizar(lote)
+        categorias = self.categorias
+        mapa = categorias.get_indexer(unicos)
+        nuevas = unicos[mapa == -1]
+        mapa[mapa == -1] = len(categorias) + np.arange(len(nuevas))
+        if len(nuevas):
+            categorias = categorias.append(nuevas)
+        codigos_lote = mapa[codigos_lote]
+
+        # El tipo de los códigos depende de la cantidad de categorías (como en pandas)
+        tipo = np.int8 if len(categorias) < 2 ** 7 else np.int16 if len(categorias) < 2 ** 15 else np.int32
+        total = self.n + len(codigos_lote)
+        if self._buffer is None or len(self._buffer) < total or self._buffer.dtype != tipo:
+            buffer = np.empty(max(2 * total, 1024), dtype=tipo)
+            buffer[:self.n] = self.codigos
+            self._buffer = buffer
+        self._buffer[self.n:total] = codigos_lote
+
+        anteriores = self.datos
+        categorico = pd.Categorical.from_codes(self._buffer[:total], dtype=pd.CategoricalDtype(categorias),
+                                               validate=False)
+        self.datos = pd.Series(categorico, name=anteriores.name, copy=False)
+        self.n = total
+
+        # Solo se actualiza lo que ya estaba calculado para los datos anteriores
+        if self._conteos is not None and self._conteos_origen is anteriores:
+            conteos = np.zeros(len(categorias), dtype=self._conteos.dtype)
+            conteos[:len(self._conteos)] = self._conteos
+            conteos += np.bincount(codigos_lote, minlength=len(categorias))
+            self._conteos = conteos
+            self._conteos_origen = self.datos
+        self._conteo = None
+        # La huella encadenada no coincide con la de una variable nueva con los
+        # mismos datos (los códigos pueden cambiar de tipo), así que la caché en
+        # disco no comparte resultados entre las dos; solo evita volver a hashear todo
+        if self._huella is not None and self._huella_origen is anteriores:
+            resumen = hashlib.blake2b(self._huella.encode("utf-8"), digest_size=20)
+            resumen.update(memoryview(np.ascontiguousarray(codigos_lote)))
+            resumen.update(repr(nuevas.tolist()).encode("utf-8"))
+            self._huella = resumen.hexdigest()
+            self._huella_origen = self.datos
+        return self
+
+    def _huella_datos(self):
+        """Huella (hash) de los códigos y las categorías, usada como clave en CACHE_RESULTADOS."""
+        if self._huella is None or self._huella_origen is not self.datos:
+            resumen = hashlib.blake2b(memoryview(np.ascontiguousarray(self.codigos)), digest_size=20)
+            resumen.update(repr(self.categorias.tolist()).encode("utf-8"))
+            self._huella = resumen.hexdigest()
+            self._huella_origen = self.datos
+        return self._huella
+
+    def _conteos_codigos(self):
+        """Cantidad de datos de cada código, calculada con un solo bincount."""
+        if self._conteos is None or self._conteos_origen is not self.datos:
+            self._conteos = np.bincount(self.codigos, minlength=len(self.categorias))
+            self._conteos_origen = self.datos
+            self._conteo = None
+        return self._conteos
+
+    def _conteo_categorias(self):
+        """
+        Devuelve el conteo por categoría. Se calcula una sola vez y de él salen
+        la moda, las tablas de frecuencias y los porcentajes, mientras
+        self.datos no cambie. Las categorías declaradas sin datos aparecen con
+        frecuencia 0.
+        """
+        conteos = self._conteos_codigos()
+        if self._conteo is None:
+            # Orden descendente estable, igual que value_counts()
+            orden = np.argsort(-conteos, kind="stable")
+            self._conteo = pd.Series(conteos[orden],
+                                     index=pd.Index(self.categorias[orden], name=self.datos.name),
+                                     name="count")
+            self._tabla = None
+            self._indice = None
+        return self._conteo
+
+    def _indice_categorias(self):
+        """
+        Diccionario categoría -> frecuencia absoluta, para consultas en O(1).
+        Solo incluye las categorías que aparecen en los datos.
+        """
+        conteo = self._conteo_categorias()
+        if self._indice is None:
+            conteo = conteo[conteo > 0]
+            self._indice = dict(zip(conteo.index.tolist(), conteo.tolist()))
+        return self._indice
+
+    @property
+    def codigos(self):
+        """Código entero de cada dato (posición de su categoría en self.categorias)."""
+        return np.asarray(self.datos.array.codes)
+
+    @property
+    def categorias(self):
+        """Etiquetas de las categorías, en el orden en que aparecen en los datos."""
+        return self.datos.cat.categories
+
+    @memoizar_en_disco
+    def calcular_moda(self):
+        conteo = self._conteo_categorias()
+        valor_moda = conteo.idxmax()
+        frecuencia = conteo.max()
+        return valor_moda, frecuencia
+
+    @memoizar_en_disco
+    def calcular_menos_frecuente(self):
+        conteo = self._conteo_categorias()
+        valor_menos = conteo.idxmin()
+        frecuencia_menos = conteo.min()
+        return valor_menos, frecuencia_menos
+
+    @memoizar_en_disco
     def calcular_frecuencia(self):
-        frec_abs = self.datos.value_counts()
-        frec_rel = round(frec_abs / self.n, 3)
-        tabla = pd.DataFrame({
-            "Frecuencia absoluta": frec_abs,
-            "Frecuencia relativa": frec_rel
-        })
-        return tabla
+        frec_abs = self._conteo_categorias()
+        if self._tabla is None:
+            frec_rel = round(frec_abs / self.n, 3)
+            self._tabla = pd.DataFrame({
+                "Frecuencia absoluta": frec_abs,
+                "Frecuencia relativa": frec_rel
+            })
+        # Se devuelve una copia porque otros métodos le agregan columnas
+        return self._tabla.copy()
 
     #  Gráfico de pastel
     def grafico_pastel(self):
-        frec_abs = self.datos.value_counts()
+        frec_abs = self._conteo_categorias()
         plt.figure(figsize=(6,6))
         plt.pie(frec_abs, labels=frec_abs.index, autopct='%1.1f%%', startangle=90)
         plt.title(f"Distribución de {self.nombre} (Gráfico de pastel)")
@@ -295,14 +1767,36 @@ class VariableCualitativa(Variable):
 
     def porcentaje_categoria(self, categoria):
         """Devuelve el porcentaje de una categoría específica"""
-        if categoria in self.datos.values:
-            conteo = self.datos.value_counts(normalize=True) * 100
-            print(f"La categoría '{categoria}' representa el {round(conteo[categoria], 2)}% del total.")
-            return round(conteo[categoria], 2)
+        indice = self._indice_categorias()
+        if categoria in indice:
+            porcentaje = round(indice[categoria] / self.n * 100, 2)
+            print(f"La categoría '{categoria}' representa el {porcentaje}% del total.")
+            return porcentaje
         else:
             print(f"⚠️ La categoría '{categoria}' no existe en los datos.")
             return None
 
+    @memoizar_en_disco
+    def porcentajes_categorias(self, categorias):
+        """
+        Devuelve el porcentaje de varias categorías en una sola llamada.
+
+        Args:
+            categorias (list): Categorías a consultar.
+
+        Returns:
+            dict: Porcentaje (redondeado a 2 decimales) de cada categoría;
+                  None para las que no existen en los datos.
+        """
+        indice = self._indice_categorias()
+        return {categoria: round(indice[categoria] / self.n * 100, 2) if categoria in indice else None
+                for categoria in categorias}
+
+    def tabla_contingencia(self, *otras):
+        """Cruza esta variable con otras variables cualitativas alineadas (ver TablaContingencia)."""
+        return TablaContingencia(self, *otras)
+
+    @memoizar_en_disco
     def tabla_frecuencia_acumulada(self):
         """Devuelve una tabla con frecuencias acumuladas"""
         tabla = self.calcular_frecuencia()
@@ -310,17 +1804,44 @@ class VariableCualitativa(Variable):
         tabla["Frecuencia relativa acumulada"] = tabla["Frecuencia relativa"].cumsum().round(3)
         return tabla
 
+    @memoizar_en_disco
     def tabla_frecuencia_alfabetica(self): ###### SE TIENE QUE LLAMAR MANUALMENTE, YA QUE ES UN CÓDIGO PERSONALIZADO
         """Ordena la tabla de frecuencias alfabéticamente por categoría"""
         tabla = self.calcular_frecuencia()
         return tabla.sort_index() 
 
 
+    def resumen_dict(self):
+        """
+        Devuelve el resumen de la variable como diccionario, con tipos nativos
+        de Python para poder serializarlo directamente (ver ExportadorResumenes).
+        Todo sale del mismo conteo de categorías.
+
+        Returns:
+            dict: Nombre, tipo, n, moda, categoría menos frecuente y la frecuencia de cada categoría.
+        """
+        if self.n == 0:
+            return {"nombre": self.nombre, "tipo": self.tipo, "n": 0, "categorias": 0}
+        indice = self._indice_categorias()
+        moda, frec_moda = self.calcular_moda()
+        menos, frec_menos = self.calcular_menos_frecuente()
+        return {
+            "nombre": self.nombre,
+            "tipo": self.tipo,
+            "n": self.n,
+            "categorias": len(indice),
+            "moda": moda.item() if isinstance(moda, np.generic) else moda,
+            "frecuencia_moda": int(frec_moda),
+            "menos_frecuente": menos.item() if isinstance(menos, np.generic) else menos,
+            "frecuencia_menos_frecuente": int(frec_menos),
+            "frecuencias": {categoria: int(frecuencia) for categoria, frecuencia in indice.items()},
+        }
+
     def resumen(self):
                 """Muestra un resumen completo de la variable cualitativa"""
                 print(f"\n📊 Resumen de la variable: {self.nombre}")
                 print(f"Cantidad de datos: {self.n}")
-                print(f"Número de categorías: {self.datos.nunique()}")
+                print(f"Número de categorías: {np.count_nonzero(self._conteos_codigos())}")
                 moda, frec_moda = self.calcular_moda()
                 menos, frec_menos = self.calcular_menos_frecuente()
                 print(f"Categoría más frecuente: {moda} ({frec_moda} veces)")
@@ -338,7 +1859,7 @@ class VariableCualitativa(Variable):
         with open(nombre_archivo, "w", encoding="utf-8") as f:
             f.write(f"📊 Resumen de la variable: {self.nombre}\n")
             f.write(f"Cantidad de datos: {self.n}\n")
-            f.write(f"Número de categorías: {self.datos.nunique()}\n")
+            f.write(f"Número de categorías: {np.count_nonzero(self._conteos_codigos())}\n")
     
             moda, frec_moda = self.calcular_moda()
             menos, frec_menos = self.calcular_menos_frecuente()
@@ -371,30 +1892,1453 @@ class VisualizadorCualitativo:
             raise TypeError("Se requiere un objeto de tipo VariableCualitativa.")
         self.variable = variable
 
-    def graficar_pastel(self):
-        """Genera un gráfico de pastel para visualizar los porcentajes de cada categoría."""
-        tabla = self.variable.calcular_frecuencia()
-        plt.figure(figsize=(6, 6))
-        plt.pie(
-            tabla["Frecuencia absoluta"],
-            labels=tabla.index,
-            autopct='%1.1f%%',
-            startangle=90
-        )
-        plt.title(f"Distribución de {self.variable.nombre}")
-        plt.show()
+    def _preparar_pastel(self):
+        """Función de dibujo, sus argumentos (las frecuencias) y tamaño de la figura."""
+        frecuencias = self.variable.calcular_frecuencia()["Frecuencia absoluta"]
+        return _dibujar_pastel, {"nombre": self.variable.nombre, "frecuencias": frecuencias}, (6, 6)
 
-    def graficar_barras(self):
-        """Genera un gráfico de barras con las frecuencias absolutas."""
-        tabla = self.variable.calcular_frecuencia()
-        plt.figure(figsize=(7, 5))
-        plt.bar(tabla.index, tabla["Frecuencia absoluta"], color="skyblue", edgecolor="black")
-        plt.title(f"Frecuencia absoluta de {self.variable.nombre}")
-        plt.xlabel("Categorías")
-        plt.ylabel("Frecuencia absoluta")
-        plt.xticks(rotation=45)
-        plt.tight_layout()
-        plt.show()
+    def _preparar_barras(self):
+        """Función de dibujo, sus argumentos (las frecuencias) y tamaño de la figura."""
+        frecuencias = self.variable.calcular_frecuencia()["Frecuencia absoluta"]
+        return _dibujar_barras, {"nombre": self.variable.nombre, "frecuencias": frecuencias}, (7, 5)
+
+    def graficar_pastel(self, archivo=None, formato=None, dpi=100):
+        """
+        Genera un gráfico de pastel para visualizar los porcentajes de cada categoría.
+
+        Args:
+            archivo (str, file-like, optional): Si se indica, guarda la imagen en vez de mostrarla.
+            formato (str, optional): "png" o "svg". Por defecto, según la extensión.
+            dpi (int): Resolución de la imagen.
+        """
+        dibujo, argumentos, tamano = self._preparar_pastel()
+        return _renderizar_figura(functools.partial(dibujo, **argumentos), archivo, formato, tamano, dpi)
+
+    def graficar_barras(self, archivo=None, formato=None, dpi=100):
+        """
+        Genera un gráfico de barras con las frecuencias absolutas.
+
+        Args:
+            archivo (str, file-like, optional): Si se indica, guarda la imagen en vez de mostrarla.
+            formato (str, optional): "png" o "svg". Por defecto, según la extensión.
+            dpi (int): Resolución de la imagen.
+        """
+        dibujo, argumentos, tamano = self._preparar_barras()
+        return _renderizar_figura(functools.partial(dibujo, **argumentos), archivo, formato, tamano, dpi)
+
+
+#### Renderizado por lotes ###
+
+def _renderizar_tarea(dibujo, argumentos, tamano, archivo, formato, dpi):
+    """Renderiza un gráfico en un proceso del pool; sin archivo devuelve los bytes de la imagen."""
+    dibujar = functools.partial(dibujo, **argumentos)
+    if archivo is None:
+        buffer = io.BytesIO()
+        _renderizar_figura(dibujar, buffer, formato or "png", tamano, dpi)
+        return buffer.getvalue()
+    return _renderizar_figura(dibujar, archivo, formato, tamano, dpi)
+
+
+class RenderizadorGraficos:
+    """
+    Renderiza muchos gráficos de una vez, sin pantalla, repartiéndolos en un
+    pool de procesos. Los resúmenes de cada gráfico (conteos del histograma,
+    estadísticas de la caja, frecuencias) se calculan en el proceso principal
+    al encolarlo, y a los procesos solo se les envían esos resúmenes, nunca
+    los datos de la variable. Cada gráfico se dibuja en su propia Figure
+    (backend Agg) que se libera apenas se guarda, así la memoria no crece.
+    """
+    def __init__(self, max_trabajadores=None, formato=None, dpi=100):
+        """
+        Args:
+            max_trabajadores (int, optional): Tamaño del pool. Por defecto, os.cpu_count().
+            formato (str, optional): Formato de las imágenes ("png" o "svg").
+            dpi (int): Resolución de las imágenes.
+        """
+        self.max_trabajadores = max_trabajadores or os.cpu_count() or 1
+        self.formato = formato
+        self.dpi = dpi
+        self.trabajos = []
+
+    def agregar(self, visualizador, metodo, archivo=None, **kwargs):
+        """
+        Encola un gráfico y calcula ya los resúmenes que necesita.
+
+        Args:
+            visualizador (VisualizadorEstadistico, VisualizadorCualitativo): Objeto a graficar.
+            metodo (str): Método de graficado, por ejemplo "graficar_histograma".
+            archivo (str, optional): Ruta de la imagen. Sin ruta, renderizar() devuelve los bytes.
+            **kwargs: Argumentos adicionales del método (por ejemplo, bins).
+        """
+        preparar = getattr(visualizador, "_preparar_" + metodo.removeprefix("graficar_"), None)
+        if not metodo.startswith("graficar_") or preparar is None:
+            raise ValueError(f"'{type(visualizador).__name__}' no tiene el método '{metodo}'.")
+        self.trabajos.append((*preparar(**kwargs), archivo))
+        return self
+
+    def renderizar(self):
+        """
+        Renderiza todos los gráficos encolados y vacía la cola.
+
+        Returns:
+            list: Para cada gráfico, su ruta o los bytes de la imagen, en el orden en que se agregaron.
+        """
+        trabajos, self.trabajos = self.trabajos, []
+        if not trabajos:
+            return []
+        dibujos, argumentos, tamanos, archivos = zip(*trabajos)
+        cantidad = len(trabajos)
+        formatos, dpis = [self.formato] * cantidad, [self.dpi] * cantidad
+
+        trabajadores = min(self.max_trabajadores, cantidad)
+        if trabajadores <= 1:
+            return list(map(_renderizar_tarea, dibujos, argumentos, tamanos, archivos, formatos, dpis))
+        with ProcessPoolExecutor(max_workers=trabajadores) as pool:
+            return list(pool.map(_renderizar_tarea, dibujos, argumentos, tamanos, archivos, formatos, dpis))
+
+
+#### Estadísticas por grupo ###
+
+class EstadisticasPorGrupo:
+    """
+    Resume una VariableCuantitativa por cada categoría de una
+    VariableCualitativa (por ejemplo, el ingreso por ciudad) sin separar el
+    DataFrame por grupos: se hace un solo ordenamiento por (grupo, valor) y
+    los momentos de todos los grupos salen de np.bincount con pesos.
+
+    Las dos variables deben estar alineadas dato a dato; para partir de un
+    DataFrame con faltantes, usar desde_dataframe().
+    """
+    def __init__(self, variable, grupos):
+        """
+        Args:
+            variable (VariableCuantitativa): Variable a resumir.
+            grupos (VariableCualitativa): Variable cuyas categorías definen los grupos.
+        """
+        if not isinstance(variable, VariableCuantitativa):
+            raise TypeError("Se requiere un objeto de tipo VariableCuantitativa.")
+        if not isinstance(grupos, VariableCualitativa):
+            raise TypeError("Los grupos deben ser un objeto de tipo VariableCualitativa.")
+        if variable.n != grupos.n:
+            raise ValueError(f"'{variable.nombre}' y '{grupos.nombre}' no tienen la misma cantidad de datos; "
+                             "usa EstadisticasPorGrupo.desde_dataframe para alinearlas.")
+        self.variable = variable
+        self.grupos = grupos
+
+    @classmethod
+    def desde_dataframe(cls, df, columna_valor, columna_grupo):
+        """Crea el agrupador a partir de dos columnas, descartando las filas con faltantes en alguna."""
+        filas = df[[columna_valor, columna_grupo]].dropna()
+        return cls(VariableCuantitativa(filas[columna_valor], columna_valor),
+                   VariableCualitativa(filas[columna_grupo], columna_grupo))
+
+    def tabla(self):
+        """
+        Calcula todos los estadísticos para todos los grupos.
+
+        Returns:
+            pd.DataFrame: Una fila por categoría (ordenadas alfabéticamente) y una
+                          columna por estadístico.
+        """
+        valores = self.variable.datos
+        codigos = self.grupos.codigos
+        k = len(self.grupos.categorias)
+
+        n = np.bincount(codigos, minlength=k)
+        presentes = np.flatnonzero(n)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            media = np.bincount(codigos, weights=valores, minlength=k) / n
+            desvios = valores - media[codigos]
+            cuadrados = desvios * desvios
+            m2 = np.bincount(codigos, weights=cuadrados, minlength=k)
+            m3 = np.bincount(codigos, weights=cuadrados * desvios, minlength=k)
+            m4 = np.bincount(codigos, weights=cuadrados * cuadrados, minlength=k)
+
+            varianza = np.where(n < 2, 0.0, m2 / (n - 1))
+            std_pob = np.sqrt(m2 / n)
+            asimetria = np.where((n < 3) | (std_pob == 0), 0.0,
+                                 (n / ((n - 1) * (n - 2))) * m3 / std_pob ** 3)
+            curtosis = np.where((n < 4) | (std_pob == 0), 0.0, (m4 / std_pob ** 4) / n - 3)
+            desviacion = np.sqrt(varianza)
+            coeficiente = np.where(media == 0, np.inf, desviacion / np.abs(media) * 100)
+
+        # Un solo ordenamiento por (grupo, valor): cada grupo queda en un tramo ordenado
+        orden = np.lexsort((valores, codigos))
+        ordenados = valores[orden]
+        inicios = np.concatenate([[0], np.cumsum(n)[:-1]])
+
+        def percentil_grupos(p):
+            indice = (p / 100) * (n - 1)
+            bajo = np.floor(indice).astype(np.int64)
+            alto = np.minimum(bajo + 1, n - 1)
+            fraccion = indice - bajo
+            posiciones_bajas = np.clip(inicios + bajo, 0, len(ordenados) - 1)
+            posiciones_altas = np.clip(inicios + alto, 0, len(ordenados) - 1)
+            valores_bajos = ordenados[posiciones_bajas]
+            return valores_bajos + (ordenados[posiciones_altas] - valores_bajos) * fraccion
+
+        q1, q2, q3 = percentil_grupos(25), percentil_grupos(50), percentil_grupos(75)
+        minimo = ordenados[np.clip(inicios, 0, len(ordenados) - 1)]
+        maximo = ordenados[np.clip(inicios + n - 1, 0, len(ordenados) - 1)]
+        iqr = q3 - q1
+        atipicos_inf = np.bincount(codigos, weights=valores < (q1 - 1.5 * iqr)[codigos], minlength=k)
+        atipicos_sup = np.bincount(codigos, weights=valores > (q3 + 1.5 * iqr)[codigos], minlength=k)
+
+        tabla = pd.DataFrame({
+            "n": n,
+            "media": media,
+            "mediana": q2,
+            "desviacion_estandar": desviacion,
+            "varianza": varianza,
+            "minimo": minimo,
+            "Q1": q1,
+            "Q3": q3,
+            "maximo": maximo,
+            "rango": maximo - minimo,
+            "rango_intercuartilico": iqr,
+            "coeficiente_variacion": coeficiente,
+            "asimetria": asimetria,
+            "curtosis": curtosis,
+            "atipicos_inferiores": atipicos_inf.astype(np.int64),
+            "atipicos_superiores": atipicos_sup.astype(np.int64),
+        }, index=pd.Index(self.grupos.categorias, name=self.grupos.nombre))
+        return tabla.iloc[presentes].sort_index()
+
+
+#### Tablas de contingencia ###
+
+def _gamma_superior_regularizada(a, x):
+    """Q(a, x) = 1 - P(a, x); con ella se obtiene el p-valor de la chi-cuadrado."""
+    if x <= 0:
+        return 1.0
+    factor = math.exp(-x + a * math.log(x) - math.lgamma(a))
+    if x < a + 1:
+        # Serie de P(a, x)
+        termino = suma = 1.0 / a
+        denominador = a
+        for _ in range(10_000):
+            denominador += 1
+            termino *= x / denominador
+            suma += termino
+            if abs(termino) < abs(suma) * 1e-15:
+                break
+        return max(0.0, 1.0 - suma * factor)
+    # Fracción continua de Q(a, x) (método de Lentz)
+    minimo = 1e-300
+    b = x + 1 - a
+    c = 1 / minimo
+    d = 1 / b
+    resultado = d
+    for i in range(1, 10_000):
+        an = -i * (i - a)
+        b += 2
+        d = an * d + b
+        d = d if abs(d) > minimo else minimo
+        c = b + an / c
+        c = c if abs(c) > minimo else minimo
+        d = 1 / d
+        delta = d * c
+        resultado *= delta
+        if abs(delta - 1) < 1e-15:
+            break
+    return resultado * factor
+
+
+class TablaContingencia:
+    """
+    Tabla de contingencia de dos o más variables cualitativas alineadas dato
+    a dato (por ejemplo Ciudad x Grado x Estado_Civil).
+
+    Los códigos enteros de cada variable se combinan en un solo código por
+    dato (en base mixta) y todas las celdas se cuentan con un único
+    np.bincount. Si la cantidad de combinaciones posibles es muy grande, se
+    cuentan solo las combinaciones observadas (np.unique) y la tabla se
+    devuelve en formato largo, así la memoria depende de los datos y no del
+    producto de las categorías.
+    """
+    LIMITE_DENSA = 10_000_000
+
+    def __init__(self, *variables):
+        """
+        Args:
+            *variables (VariableCualitativa): Dos o más variables con la misma cantidad de datos.
+        """
+        if len(variables) < 2:
+            raise ValueError("Se necesitan al menos dos variables para una tabla de contingencia.")
+        for variable in variables:
+            if not isinstance(variable, VariableCualitativa):
+                raise TypeError("Se requieren objetos de tipo VariableCualitativa.")
+        if len({variable.n for variable in variables}) != 1:
+            raise ValueError("Las variables no tienen la misma cantidad de datos; "
+                             "usa TablaContingencia.desde_dataframe para alinearlas.")
+        self.variables = variables
+        self.n = variables[0].n
+        self.dimensiones = tuple(len(variable.categorias) for variable in variables)
+        self._celdas = None
+
+    @classmethod
+    def desde_dataframe(cls, df, columnas):
+        """Crea la tabla a partir de columnas de un DataFrame, descartando filas con faltantes."""
+        filas = df[list(columnas)].dropna()
+        return cls(*(VariableCualitativa(filas[columna], columna) for columna in columnas))
+
+    @property
+    def es_dispersa(self):
+        return math.prod(self.dimensiones) > self.LIMITE_DENSA
+
+    def _contar(self):
+        """
+        Returns:
+            tuple: (códigos de cada variable por celda observada, frecuencia de cada celda).
+        """
+        if self._celdas is not None:
+            return self._celdas
+        codigos = [variable.codigos.astype(np.int64) for variable in self.variables]
+        if math.prod(self.dimensiones) < 2 ** 62:
+            combinado = np.zeros(self.n, dtype=np.int64)
+            for codigo, k in zip(codigos, self.dimensiones):
+                combinado = combinado * k + codigo
+            if self.es_dispersa:
+                celdas, frecuencias = np.unique(combinado, return_counts=True)
+            else:
+                frecuencias = np.bincount(combinado, minlength=math.prod(self.dimensiones))
+                celdas = np.flatnonzero(frecuencias)
+                frecuencias = frecuencias[celdas]
+            indices = np.unravel_index(celdas, self.dimensiones) if len(celdas) else [celdas] * len(codigos)
+        else:
+            # El código combinado no entra en 64 bits: se agrupan las filas de códigos
+            filas, frecuencias = np.unique(np.column_stack(codigos), axis=0, return_counts=True)
+            indices = filas.T
+        self._celdas = ([np.asarray(indice) for indice in indices], frecuencias)
+        return self._celdas
+
+    def tabla(self):
+        """
+        Devuelve la tabla de frecuencias absolutas.
+
+        Returns:
+            pd.DataFrame: Si la tabla es densa, las categorías de la última
+                          variable van en columnas y las demás en el índice
+                          (como pd.crosstab). Si es dispersa, una fila por
+                          combinación observada y la columna "Frecuencia absoluta".
+        """
+        indices, frecuencias = self._contar()
+        nombres = [variable.nombre for variable in self.variables]
+        etiquetas = {nombre: variable.categorias[indice]
+                     for nombre, variable, indice in zip(nombres, self.variables, indices)}
+        larga = pd.DataFrame(etiquetas)
+        larga["Frecuencia absoluta"] = frecuencias
+        if self.es_dispersa:
+            return larga.sort_values(nombres, ignore_index=True)
+        tabla = larga.pivot_table(index=nombres[:-1], columns=nombres[-1], values="Frecuencia absoluta",
+                                  aggfunc="sum", fill_value=0, observed=True)
+        return tabla.sort_index().sort_index(axis=1)
+
+    def chi_cuadrado(self):
+        """
+        Prueba chi-cuadrado de Pearson de independencia entre las variables.
+        Solo se recorren las celdas observadas: sum((O - E)^2 / E) = sum(O^2 / E) - n.
+
+        Returns:
+            dict: 'chi2', 'grados_libertad', 'p_valor' y, para dos variables, 'v_cramer'.
+        """
+        indices, frecuencias = self._contar()
+        esperadas = np.full(len(frecuencias), float(self.n))
+        # Las categorías declaradas sin datos no cuentan para los grados de libertad
+        observadas = []
+        for variable, indice in zip(self.variables, indices):
+            marginal = np.bincount(variable.codigos, minlength=len(variable.categorias))
+            esperadas *= marginal[indice] / self.n
+            observadas.append(int(np.count_nonzero(marginal)))
+        chi2 = max(0.0, float(np.sum(frecuencias.astype(np.float64) ** 2 / esperadas)) - self.n)
+        grados = math.prod(observadas) - 1 - sum(k - 1 for k in observadas)
+        resultado = {
+            "chi2": chi2,
+            "grados_libertad": grados,
+            "p_valor": _gamma_superior_regularizada(grados / 2, chi2 / 2) if grados > 0 else 1.0,
+        }
+        if len(self.variables) == 2:
+            menor = min(observadas) - 1
+            resultado["v_cramer"] = math.sqrt(chi2 / (self.n * menor)) if menor > 0 else 0.0
+        return resultado
+
+
+#### Correlación y covarianza ###
+
+def _sumas_pares(xi, mi, xj, mj):
+    """
+    Sumas por par de columnas usando solo las filas donde ambas tienen dato.
+    xi, xj tienen 0 donde falta el dato y mi, mj son las máscaras (1.0 / 0.0).
+    Todo se resuelve con productos de matrices (BLAS).
+    """
+    return {
+        "n": mi.T @ mj,
+        "suma_i": xi.T @ mj,
+        "suma_j": mi.T @ xj,
+        "cuadrados_i": (xi * xi).T @ mj,
+        "cuadrados_j": mi.T @ (xj * xj),
+        "productos": xi.T @ xj,
+    }
+
+
+def _sumas_columnas(xi, xj, mascara):
+    """
+    Como _sumas_pares, pero solo para cada columna de xi con la misma columna
+    de xj (no todos los pares), usando las filas marcadas en `mascara`.
+    """
+    xi = np.where(mascara, xi, 0.0)
+    xj = np.where(mascara, xj, 0.0)
+    return {
+        "n": mascara.sum(axis=0).astype(np.float64),
+        "suma_i": xi.sum(axis=0),
+        "suma_j": xj.sum(axis=0),
+        "cuadrados_i": np.einsum("ij,ij->j", xi, xi),
+        "cuadrados_j": np.einsum("ij,ij->j", xj, xj),
+        "productos": np.einsum("ij,ij->j", xi, xj),
+    }
+
+
+def _matrices_desde_sumas(sumas):
+    """Covarianza muestral y correlación de Pearson a partir de las sumas por par."""
+    n = sumas["n"]
+    with np.errstate(invalid="ignore", divide="ignore"):
+        cruzado = sumas["productos"] - sumas["suma_i"] * sumas["suma_j"] / n
+        var_i = sumas["cuadrados_i"] - sumas["suma_i"] ** 2 / n
+        var_j = sumas["cuadrados_j"] - sumas["suma_j"] ** 2 / n
+        covarianza = np.where(n >= 2, cruzado / (n - 1), np.nan)
+        denominador = np.sqrt(np.clip(var_i, 0, None) * np.clip(var_j, 0, None))
+        correlacion = np.where((n >= 2) & (denominador > 0), cruzado / denominador, np.nan)
+    return covarianza, np.clip(correlacion, -1.0, 1.0)
+
+
+class MatrizCorrelacion:
+    """
+    Matrices de covarianza y de correlación (Pearson y Spearman) entre muchas
+    variables cuantitativas, calculadas como productos de matrices en lugar
+    de recorrer cada par en Python.
+
+    Los faltantes se manejan por pares: cada celda usa solo las filas donde
+    las dos columnas tienen dato. Con `bloque` la matriz se calcula por
+    bloques de columnas (y los datos se recorren por bloques de
+    FILAS_POR_BLOQUE filas, así que no se copian enteros) y con `salida` se
+    escribe en un archivo .npy con memoria mapeada, para matrices que no
+    caben en memoria. Los datos en sí deben caber en memoria; para archivos
+    más grandes, AcumuladorCovarianza (o desde_csv) los recorre por bloques.
+    """
+    FILAS_POR_BLOQUE = 1 << 16
+
+    def __init__(self, datos, nombres=None):
+        """
+        Args:
+            datos (list, pd.DataFrame, np.ndarray): Lista de VariableCuantitativa
+                (con la misma cantidad de datos), DataFrame numérico (se
+                conservan los NaN) o arreglo de n filas por p columnas.
+            nombres (list, optional): Nombres de las columnas.
+        """
+        if isinstance(datos, pd.DataFrame):
+            nombres = list(datos.columns) if nombres is None else nombres
+            matriz = datos.to_numpy(dtype=np.float64)
+        elif isinstance(datos, (list, tuple)) and datos and isinstance(datos[0], VariableCuantitativa):
+            if len({variable.n for variable in datos}) != 1:
+                raise ValueError("Las variables no tienen la misma cantidad de datos; "
+                                 "usa MatrizCorrelacion.desde_dataframe para conservar los faltantes.")
+            nombres = [variable.nombre for variable in datos] if nombres is None else nombres
+            matriz = np.column_stack([variable.datos for variable in datos])
+        else:
+            matriz = np.asarray(datos, dtype=np.float64)
+            if matriz.ndim != 2:
+                raise ValueError("Los datos deben tener dos dimensiones (filas x columnas).")
+        self.datos = matriz
+        self.nombres = list(nombres) if nombres is not None else list(range(matriz.shape[1]))
+
+    @classmethod
+    def desde_dataframe(cls, df, columnas=None):
+        """Crea el motor con columnas de un DataFrame, conservando los faltantes."""
+        return cls(df[list(columnas)] if columnas is not None else df)
+
+    @staticmethod
+    def desde_csv(ruta, columnas=None, tamano_bloque=1_000_000, **kwargs):
+        """
+        Acumula covarianza y Pearson recorriendo un CSV por bloques de filas,
+        con memoria que solo depende de la cantidad de columnas.
+
+        Returns:
+            AcumuladorCovarianza: Acumulador ya lleno con todo el archivo.
+        """
+        lector = LectorCSV(ruta, columnas=columnas, tamano_bloque=tamano_bloque, **kwargs)
+        cuantitativas = [columna for columna, tipo in lector.tipos().items() if tipo == "cuantitativa"]
+        acumulador = AcumuladorCovarianza(cuantitativas)
+        for bloque in lector.bloques():
+            acumulador.agregar_bloque(bloque[cuantitativas])
+        return acumulador
+
+    @staticmethod
+    def _preparar(datos, medias):
+        """Datos centrados en la media de su columna (0 donde falta) y máscara de datos presentes."""
+        mascara = ~np.isnan(datos)
+        with np.errstate(invalid="ignore"):
+            centrados = np.where(mascara, datos - medias, 0.0)
+        return centrados, mascara.astype(np.float64)
+
+    def _calcular(self, columnas, que, bloque, salida):
+        """
+        Calcula la matriz pedida. `columnas(i0, i1)` devuelve los datos de esas
+        columnas (los originales, o sus rangos para Spearman).
+        """
+        n, p = self.datos.shape
+        if salida is not None:
+            resultado = np.lib.format.open_memmap(salida, mode="w+", dtype=np.float64, shape=(p, p))
+        else:
+            resultado = np.empty((p, p))
+        filas = self.FILAS_POR_BLOQUE if bloque else max(n, 1)
+        bloque = bloque or p
+        for i0 in range(0, p, bloque):
+            i1 = min(i0 + bloque, p)
+            datos_i = columnas(i0, i1)
+            # Centrar cada columna en su media reduce la pérdida de precisión
+            with warnings.catch_warnings():
+                warnings.simplefilter("ignore", RuntimeWarning)
+                medias_i = np.nanmean(datos_i, axis=0)
+            for j0 in range(i0, p, bloque):
+                j1 = min(j0 + bloque, p)
+                if j0 == i0:
+                    datos_j, medias_j = datos_i, medias_i
+                else:
+                    datos_j = columnas(j0, j1)
+                    with warnings.catch_warnings():
+                        warnings.simplefilter("ignore", RuntimeWarning)
+                        medias_j = np.nanmean(datos_j, axis=0)
+                sumas = None
+                for f0 in range(0, max(n, 1), filas):
+                    parciales = _sumas_pares(*self._preparar(datos_i[f0:f0 + filas], medias_i),
+                                             *self._preparar(datos_j[f0:f0 + filas], medias_j))
+                    sumas = parciales if sumas is None else {k: sumas[k] + parciales[k] for k in sumas}
+                covarianza, correlacion = _matrices_desde_sumas(sumas)
+                parcial = covarianza if que == "covarianza" else correlacion
+                resultado[i0:i1, j0:j1] = parcial
+                resultado[j0:j1, i0:i1] = parcial.T
+        return resultado
+
+    def _entregar(self, resultado, salida):
+        if salida is not None:
+            resultado.flush()
+            return resultado
+        return pd.DataFrame(resultado, index=self.nombres, columns=self.nombres)
+
+    def covarianza(self, bloque=None, salida=None):
+        """
+        Matriz de covarianzas muestrales (divididas entre n - 1), por pares.
+
+        Args:
+            bloque (int, optional): Cantidad de columnas por bloque.
+            salida (str, optional): Archivo .npy donde escribir la matriz.
+        """
+        resultado = self._calcular(lambda i0, i1: self.datos[:, i0:i1], "covarianza", bloque, salida)
+        return self._entregar(resultado, salida)
+
+    def pearson(self, bloque=None, salida=None):
+        """Matriz de correlaciones de Pearson, por pares (mismos argumentos que covarianza)."""
+        resultado = self._calcular(lambda i0, i1: self.datos[:, i0:i1], "correlacion", bloque, salida)
+        return self._entregar(resultado, salida)
+
+    def spearman(self, bloque=None, salida=None):
+        """
+        Matriz de correlaciones de Spearman: Pearson sobre los rangos (con
+        empates promediados). Con `bloque`, los rangos se calculan por bloque
+        de columnas.
+
+        Los pares sin faltantes salen de los rangos de cada columna entera.
+        En los pares donde alguna de las dos columnas tiene faltantes, los
+        rangos se calculan solo sobre las filas donde ambas tienen dato, igual
+        que df.corr("spearman").
+
+        Cada columna se ordena una sola vez. Después, por cada columna i con
+        faltantes se hace una pasada sobre todas las columnas j a la vez: el
+        rango de un dato dentro de las filas que comparten dos columnas es la
+        cantidad de filas compartidas que quedan antes que él en el orden de
+        su columna (un np.cumsum de la máscara de la otra), promediando los
+        empates. Los órdenes ocupan unas dos veces la memoria de los datos.
+        """
+        n, p = self.datos.shape
+        presentes = ~np.isnan(self.datos.T)
+        cantidades = presentes.sum(axis=1)
+        orden, posicion, inicio, fin, con_empates = self._ordenar_columnas()
+
+        def rangos_en_orden(contadas, inicio_k, fin_k, empates_k):
+            """
+            Rango promedio de cada posición del orden de su columna (una fila
+            por columna), contando solo las posiciones marcadas en `contadas`.
+            """
+            hasta = np.cumsum(contadas, axis=1, dtype=orden.dtype)
+            rangos = hasta.astype(np.float64)
+            filas = np.flatnonzero(np.broadcast_to(empates_k, len(contadas)))
+            if len(filas):
+                inicio_k = np.broadcast_to(inicio_k, contadas.shape)[filas]
+                fin_k = np.broadcast_to(fin_k, contadas.shape)[filas]
+                antes = np.take_along_axis(hasta[filas] - contadas[filas], inicio_k, axis=1)
+                ultimo = np.take_along_axis(hasta[filas], fin_k - 1, axis=1)
+                rangos[filas] = antes + (ultimo - antes + 1) / 2
+            return rangos
+
+        def rangos(i0, i1):
+            # Los faltantes quedan al final del orden: se cuentan las primeras `cantidades` posiciones
+            contadas = np.arange(n) < cantidades[i0:i1, None]
+            resultado = rangos_en_orden(contadas, inicio[i0:i1], fin[i0:i1], con_empates[i0:i1])
+            resultado = np.take_along_axis(resultado, posicion[i0:i1], axis=1)
+            return np.where(presentes[i0:i1], resultado, np.nan).T
+
+        resultado = self._calcular(rangos, "correlacion", bloque, salida)
+        con_faltantes = cantidades < n
+        for i in np.flatnonzero(con_faltantes):
+            # Los pares con una columna j < i que también tiene faltantes salieron en la pasada de j
+            columnas = np.flatnonzero(~con_faltantes | (np.arange(p) >= i))
+            paso = bloque or len(columnas)
+            orden_i = orden[i]
+            for b0 in range(0, len(columnas), paso):
+                j = columnas[b0:b0 + paso]
+                # Filas compartidas, en el orden de i, y rango de i dentro de ellas
+                compartidas = presentes[j][:, orden_i] & presentes[i, orden_i]
+                rangos_i = rangos_en_orden(compartidas, inicio[i:i + 1], fin[i:i + 1], con_empates[i:i + 1])
+                # En el orden de cada j, las filas compartidas son las presentes de j que también están en i
+                contadas = presentes[i][orden[j]] & (np.arange(n) < cantidades[j, None])
+                rangos_j = rangos_en_orden(contadas, inicio[j], fin[j], con_empates[j])
+                rangos_j = np.take_along_axis(rangos_j, posicion[j][:, orden_i], axis=1)
+                correlacion = _matrices_desde_sumas(_sumas_columnas(rangos_i.T, rangos_j.T, compartidas.T))[1]
+                resultado[i, j] = correlacion
+                resultado[j, i] = correlacion
+        return self._entregar(resultado, salida)
+
+    def _ordenar_columnas(self):
+        """
+        Ordena cada columna una vez (los faltantes quedan al final). Todo se
+        guarda con una fila por columna de los datos, para recorrer memoria
+        contigua.
+
+        Returns:
+            tuple: (orden de las filas de cada columna; posición de cada fila
+                    en ese orden; dónde empieza y dónde termina el grupo de
+                    empates de cada posición del orden; si la columna tiene empates).
+        """
+        n, p = self.datos.shape
+        tipo = np.int32 if n < 2 ** 31 else np.int64
+        traspuestos = np.ascontiguousarray(self.datos.T)
+        orden = np.argsort(traspuestos, axis=1, kind="stable").astype(tipo)
+        posiciones = np.arange(n, dtype=tipo)
+        posicion = np.empty_like(orden)
+        np.put_along_axis(posicion, orden, np.broadcast_to(posiciones, orden.shape), axis=1)
+        ordenados = np.take_along_axis(traspuestos, orden, axis=1)
+        comienza = np.ones((p, n), dtype=bool)
+        comienza[:, 1:] = ordenados[:, 1:] != ordenados[:, :-1]
+        inicio = np.maximum.accumulate(np.where(comienza, posiciones, 0), axis=1).astype(tipo)
+        termina = np.ones((p, n), dtype=bool)
+        termina[:, :-1] = comienza[:, 1:]
+        fin = np.minimum.accumulate(np.where(termina, posiciones + 1, n)[:, ::-1], axis=1)[:, ::-1].astype(tipo)
+        return orden, posicion, inicio, fin, ~comienza.all(axis=1)
+
+
+class AcumuladorCovarianza:
+    """
+    Acumula por bloques de filas las sumas necesarias para la covarianza y
+    la correlación de Pearson por pares. La memoria depende solo de la
+    cantidad de columnas y dos acumuladores parciales pueden combinarse.
+    """
+    def __init__(self, nombres):
+        self.nombres = list(nombres)
+        self.centro = None
+        self.sumas = None
+
+    def agregar_bloque(self, bloque):
+        """
+        Args:
+            bloque (pd.DataFrame, np.ndarray): Filas nuevas, con las columnas en el orden de `nombres`.
+        """
+        datos = np.asarray(bloque, dtype=np.float64)
+        if len(datos) == 0:
+            return self
+        mascara = (~np.isnan(datos)).astype(np.float64)
+        if self.centro is None:
+            # Se centra en las medias del primer bloque para no perder precisión
+            with np.errstate(invalid="ignore"):
+                self.centro = np.nan_to_num(np.nanmean(np.where(mascara > 0, datos, np.nan), axis=0))
+        centrados = np.where(mascara > 0, datos - self.centro, 0.0)
+        sumas = _sumas_pares(centrados, mascara, centrados, mascara)
+        self.sumas = sumas if self.sumas is None else {clave: self.sumas[clave] + valor
+                                                       for clave, valor in sumas.items()}
+        return self
+
+    def combinar(self, otro):
+        """Combina en este acumulador las sumas de otro con las mismas columnas."""
+        if otro.sumas is None:
+            return self
+        if self.sumas is None:
+            self.centro, self.sumas = otro.centro, dict(otro.sumas)
+            return self
+        # Llevamos las sumas del otro al mismo centro que las de este
+        desplazamiento = otro.centro - self.centro
+        n, si, sj = otro.sumas["n"], otro.sumas["suma_i"], otro.sumas["suma_j"]
+        di, dj = desplazamiento[:, None], desplazamiento[None, :]
+        movidas = {
+            "n": n,
+            "suma_i": si + di * n,
+            "suma_j": sj + dj * n,
+            "cuadrados_i": otro.sumas["cuadrados_i"] + 2 * di * si + di * di * n,
+            "cuadrados_j": otro.sumas["cuadrados_j"] + 2 * dj * sj + dj * dj * n,
+            "productos": otro.sumas["productos"] + di * sj + dj * si + di * dj * n,
+        }
+        self.sumas = {clave: self.sumas[clave] + valor for clave, valor in movidas.items()}
+        return self
+
+    def covarianza(self):
+        return pd.DataFrame(_matrices_desde_sumas(self.sumas)[0], index=self.nombres, columns=self.nombres)
+
+    def pearson(self):
+        return pd.DataFrame(_matrices_desde_sumas(self.sumas)[1], index=self.nombres, columns=self.nombres)
+
+
+#### Bootstrap ###
+
+def _estadistico_filas(remuestras, estadistico, args):
+    """
+    Calcula un estadístico de VariableCuantitativa sobre cada fila de una
+    matriz de remuestras, de forma vectorizada y con las mismas fórmulas.
+    """
+    n = remuestras.shape[1]
+    if estadistico in ("mediana", "percentil", "rango_intercuartilico"):
+        if estadistico == "mediana":
+            return np.percentile(remuestras, 50, axis=1)
+        if estadistico == "percentil":
+            return np.percentile(remuestras, args[0], axis=1)
+        q1, q3 = np.percentile(remuestras, [25, 75], axis=1)
+        return q3 - q1
+    if estadistico == "rango":
+        return remuestras.max(axis=1) - remuestras.min(axis=1)
+
+    media = remuestras.mean(axis=1)
+    if estadistico == "media":
+        return media
+    desvios = remuestras - media[:, None]
+    cuadrados = desvios * desvios
+    m2 = cuadrados.sum(axis=1)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        if estadistico in ("varianza", "desviacion_estandar", "coeficiente_variacion"):
+            es_muestra = args[0] if args and estadistico != "coeficiente_variacion" else True
+            if es_muestra:
+                varianza = m2 / (n - 1) if n >= 2 else np.zeros(len(m2))
+            else:
+                varianza = m2 / n
+            if estadistico == "varianza":
+                return varianza
+            desviacion = np.sqrt(varianza)
+            if estadistico == "desviacion_estandar":
+                return desviacion
+            return np.where(media == 0, np.inf, desviacion / np.abs(media) * 100)
+        std_dev = np.sqrt(m2 / n)
+        if estadistico == "asimetria":
+            if n < 3: return np.zeros(len(m2))
+            m3 = np.einsum("ij,ij->i", cuadrados, desvios)
+            return np.where(std_dev == 0, 0.0, (n / ((n - 1) * (n - 2))) * m3 / std_dev ** 3)
+        if estadistico == "curtosis":
+            if n < 4: return np.zeros(len(m2))
+            m4 = np.einsum("ij,ij->i", cuadrados, cuadrados)
+            return np.where(std_dev == 0, 0.0, (m4 / std_dev ** 4) / n - 3)
+    raise ValueError(f"El estadístico '{estadistico}' no se puede usar en el bootstrap.")
+
+
+_DATOS_BOOTSTRAP = None
+
+
+def _iniciar_bootstrap(datos):
+    """Guarda los datos una sola vez en cada proceso del pool."""
+    global _DATOS_BOOTSTRAP
+    _DATOS_BOOTSTRAP = datos
+
+
+def _tarea_bootstrap(estadistico, args, cantidad, semilla, datos=None):
+    """Genera `cantidad` remuestras con su propia semilla y devuelve el estadístico de cada una."""
+    datos = _DATOS_BOOTSTRAP if datos is None else datos
+    n = len(datos)
+    generador = np.random.default_rng(semilla)
+    filas_por_bloque = max(1, Bootstrap.ELEMENTOS_POR_BLOQUE // n)
+    resultados = []
+    for inicio in range(0, cantidad, filas_por_bloque):
+        filas = min(filas_por_bloque, cantidad - inicio)
+        # Matriz de índices: cada fila es una remuestra con reemplazo
+        indices = generador.integers(0, n, size=(filas, n), dtype=np.int64 if n > 2 ** 31 - 1 else np.int32)
+        resultados.append(_estadistico_filas(datos[indices], estadistico, args))
+    return np.concatenate(resultados)
+
+
+class Bootstrap:
+    """
+    Intervalos de confianza bootstrap (método de percentiles) para los
+    estadísticos de una VariableCuantitativa.
+
+    Las remuestras se generan como matrices de índices y el estadístico se
+    calcula para todas las filas a la vez. El trabajo se divide en tareas
+    de tamaño fijo, cada una con su propia semilla derivada de `semilla`, y
+    se reparte en un pool de procesos; así el resultado es reproducible sin
+    importar cuántos procesos se usen.
+    """
+    ESTADISTICOS = ("media", "mediana", "varianza", "desviacion_estandar", "coeficiente_variacion",
+                    "asimetria", "curtosis", "rango", "rango_intercuartilico", "percentil")
+    ELEMENTOS_POR_BLOQUE = 1 << 22
+    REMUESTRAS_POR_TAREA = 250
+
+    def __init__(self, variable, remuestras=10_000, semilla=None, max_trabajadores=None):
+        """
+        Args:
+            variable (VariableCuantitativa): Variable a analizar.
+            remuestras (int): Cantidad de remuestras bootstrap.
+            semilla (int, optional): Semilla para que los resultados sean reproducibles.
+            max_trabajadores (int, optional): Procesos a usar. Por defecto, os.cpu_count().
+        """
+        if not isinstance(variable, VariableCuantitativa):
+            raise TypeError("Se requiere un objeto de tipo VariableCuantitativa.")
+        self.variable = variable
+        self.remuestras = remuestras
+        self.semilla = semilla
+        self.max_trabajadores = max_trabajadores or os.cpu_count() or 1
+
+    def distribucion(self, estadistico, *args):
+        """
+        Devuelve el valor del estadístico en cada remuestra.
+
+        Args:
+            estadistico (str): Nombre del método de VariableCuantitativa (por ejemplo "media").
+            *args: Argumentos del método (por ejemplo, p para "percentil").
+        """
+        if estadistico not in self.ESTADISTICOS:
+            raise ValueError(f"El estadístico '{estadistico}' no se puede usar en el bootstrap.")
+        # Los argumentos se validan con la firma del método antes de repartir el trabajo
+        try:
+            inspect.signature(getattr(VariableCuantitativa, estadistico)).bind(self.variable, *args)
+        except TypeError as error:
+            raise ValueError(f"Argumentos inválidos para '{estadistico}': {error}.") from None
+        if estadistico == "percentil" and not 0 <= args[0] <= 100:
+            raise ValueError("El percentil debe estar entre 0 y 100.")
+        if self.variable.n == 0:
+            raise ValueError(f"La variable '{self.variable.nombre}' no tiene datos.")
+        cantidades = [min(self.REMUESTRAS_POR_TAREA, self.remuestras - inicio)
+                      for inicio in range(0, self.remuestras, self.REMUESTRAS_POR_TAREA)]
+        semillas = np.random.SeedSequence(self.semilla).spawn(len(cantidades))
+        datos = np.ascontiguousarray(self.variable.datos)
+
+        trabajadores = min(self.max_trabajadores, len(cantidades))
+        if trabajadores <= 1:
+            partes = [_tarea_bootstrap(estadistico, args, cantidad, semilla, datos)
+                      for cantidad, semilla in zip(cantidades, semillas)]
+        else:
+            with ProcessPoolExecutor(max_workers=trabajadores, initializer=_iniciar_bootstrap,
+                                     initargs=(datos,)) as pool:
+                partes = list(pool.map(_tarea_bootstrap, [estadistico] * len(cantidades),
+                                       [args] * len(cantidades), cantidades, semillas))
+        return np.concatenate(partes)
+
+    def intervalo(self, estadistico, *args, nivel=0.95):
+        """
+        Intervalo de confianza del estadístico.
+
+        Args:
+            estadistico (str): Nombre del método de VariableCuantitativa.
+            *args: Argumentos del método.
+            nivel (float): Nivel de confianza, entre 0 y 1.
+
+        Returns:
+            dict: 'estimacion', 'inferior', 'superior', 'error_estandar' y 'nivel'.
+        """
+        if not 0 < nivel < 1:
+            raise ValueError("El nivel de confianza debe estar entre 0 y 1.")
+        replicas = self.distribucion(estadistico, *args)
+        alfa = (1 - nivel) / 2
+        inferior, superior = np.percentile(replicas, [100 * alfa, 100 * (1 - alfa)])
+        return {
+            "estimacion": getattr(self.variable, estadistico)(*args),
+            "inferior": float(inferior),
+            "superior": float(superior),
+            "error_estandar": float(np.std(replicas, ddof=1)),
+            "nivel": nivel,
+        }
+
+
+#### Lectura de archivos ###
+
+class LectorCSV:
+    """
+    Capa de lectura de CSV para las clases de variables. Lee solo las columnas
+    pedidas (usecols), infiere el tipo de cada una una sola vez a partir de una
+    muestra y después lee el archivo por bloques con esos dtypes: las columnas
+    cuantitativas como float64 y las cualitativas como categóricas. Así, para
+    resumir dos columnas de un archivo enorme solo se guardan esas dos.
+
+    Si una columna que en la muestra era numérica tiene después un valor no
+    numérico, pd.read_csv lanza ValueError al llegar a ese bloque. leer() y
+    acumuladores() lo manejan: revisan esas columnas en todo el archivo, pasan
+    a cualitativas (categóricas) las que tienen texto y vuelven a leer.
+    """
+    FILAS_MUESTRA = 10_000
+
+    def __init__(self, ruta, columnas=None, tamano_bloque=1_000_000, memory_map=True,
+                 usar_cache=False, directorio_cache=None, verificar_contenido=True, **kwargs):
+        """
+        Args:
+            ruta (str): Ruta del archivo CSV.
+            columnas (list, optional): Columnas a leer. Por defecto, todas.
+            tamano_bloque (int): Cantidad de filas leídas en cada bloque.
+            memory_map (bool): Si es True, el archivo se mapea en memoria al leerlo.
+            usar_cache (bool): Si es True, leer() usa una CacheColumnar del archivo.
+            directorio_cache (str, optional): Carpeta de la caché (ver CacheColumnar).
+            verificar_contenido (bool): Si es False, la caché confía en el tamaño y
+                                        la fecha de modificación (ver CacheColumnar).
+            **kwargs: Argumentos adicionales para pd.read_csv.
+        """
+        self.ruta = ruta
+        self.columnas = list(columnas) if columnas is not None else None
+        self.tamano_bloque = tamano_bloque
+        self.memory_map = memory_map
+        self.usar_cache = usar_cache
+        self.directorio_cache = directorio_cache
+        self.verificar_contenido = verificar_contenido
+        self.kwargs = kwargs
+        self._tipos = None
+        # Una sola caché por lector, así el hash del archivo se reutiliza entre lecturas
+        self._cache = None
+
+    def tipos(self):
+        """
+        Tipo de cada columna ("cuantitativa" o "cualitativa"), detectado con
+        detectar_tipo sobre las primeras FILAS_MUESTRA filas.
+        """
+        if self._tipos is None:
+            muestra = pd.read_csv(self.ruta, usecols=self.columnas, nrows=self.FILAS_MUESTRA, **self.kwargs)
+            self._tipos = {columna: Variable(muestra[columna]).tipo for columna in muestra.columns}
+        return self._tipos
+
+    def _dtypes(self):
+        return {columna: np.float64 if tipo == "cuantitativa" else "category"
+                for columna, tipo in self.tipos().items()}
+
+    def _corregir_tipos(self):
+        """
+        Revisa en todo el archivo las columnas que la muestra marcó como
+        cuantitativas y pasa a cualitativas las que tienen algún valor no numérico.
+
+        Returns:
+            list: Columnas que cambiaron de tipo.
+        """
+        numericas = [columna for columna, tipo in self.tipos().items() if tipo == "cuantitativa"]
+        con_texto = set()
+        if numericas:
+            for bloque in pd.read_csv(self.ruta, usecols=numericas, chunksize=self.tamano_bloque,
+                                      memory_map=self.memory_map, **self.kwargs):
+                con_texto.update(columna for columna in numericas
+                                 if not pd.api.types.is_numeric_dtype(bloque[columna]))
+        for columna in con_texto:
+            self._tipos[columna] = "cualitativa"
+        return [columna for columna in numericas if columna in con_texto]
+
+    def bloques(self):
+        """Recorre el archivo por bloques (DataFrames) con las columnas y dtypes inferidos."""
+        return pd.read_csv(self.ruta, usecols=list(self.tipos()), dtype=self._dtypes(),
+                           chunksize=self.tamano_bloque, memory_map=self.memory_map, **self.kwargs)
+
+    def leer(self):
+        """
+        Lee las columnas pedidas en un DataFrame. Los bloques se van uniendo
+        columna por columna, así que nunca se carga más que esas columnas.
+        Con usar_cache, las lecturas siguientes salen de la caché binaria.
+        """
+        if self.usar_cache:
+            if self._cache is None:
+                self._cache = CacheColumnar(self.ruta, self.directorio_cache, self.verificar_contenido)
+            return self._cache.cargar(self)
+        return self._leer_csv()
+
+    def _leer_csv(self):
+        try:
+            return self._unir_bloques()
+        except ValueError:
+            # Una columna numérica en la muestra tiene texto más adelante
+            if not self._corregir_tipos():
+                raise
+            return self._unir_bloques()
+
+    def _unir_bloques(self):
+        partes = {columna: [] for columna in self.tipos()}
+        for bloque in self.bloques():
+            for columna in partes:
+                partes[columna].append(bloque[columna].array)
+
+        datos = {}
+        for columna, arreglos in partes.items():
+            if not arreglos:
+                datos[columna] = pd.Series([], dtype=self._dtypes()[columna])
+            elif self.tipos()[columna] == "cuantitativa":
+                datos[columna] = np.concatenate([np.asarray(arreglo) for arreglo in arreglos])
+            else:
+                datos[columna] = pd.api.types.union_categoricals(arreglos)
+        return pd.DataFrame(datos)
+
+    def variables(self):
+        """
+        Devuelve un VariableCuantitativa o VariableCualitativa por cada columna leída.
+
+        Returns:
+            dict: Variable de cada columna.
+        """
+        datos = self.leer()
+        return {columna: VariableCuantitativa(datos[columna], columna) if tipo == "cuantitativa"
+                else VariableCualitativa(datos[columna], columna)
+                for columna, tipo in self.tipos().items()}
+
+    def acumuladores(self, error_cuantiles=None):
+        """
+        Resume las columnas cuantitativas bloque a bloque, con memoria
+        constante, usando AcumuladorCuantitativo.
+
+        Returns:
+            dict: AcumuladorCuantitativo de cada columna cuantitativa.
+        """
+        try:
+            return self._acumular(error_cuantiles)
+        except ValueError:
+            if not self._corregir_tipos():
+                raise
+            return self._acumular(error_cuantiles)
+
+    def _acumular(self, error_cuantiles):
+        acumuladores = {columna: AcumuladorCuantitativo(columna, error_cuantiles=error_cuantiles)
+                        for columna, tipo in self.tipos().items() if tipo == "cuantitativa"}
+        for bloque in self.bloques():
+            for columna, acumulador in acumuladores.items():
+                acumulador.agregar_bloque(bloque[columna])
+        return acumuladores
+
+
+class CacheColumnar:
+    """
+    Caché binaria y columnar de un CSV ya parseado. La primera vez que se lee
+    una columna se guarda en formato .npy (las cualitativas como códigos
+    enteros más su diccionario de categorías); las lecturas siguientes abren
+    esos archivos con memoria mapeada en lugar de volver a parsear el texto.
+
+    La caché se identifica con el tamaño, la fecha de modificación y un hash
+    del contenido del archivo original, así que se invalida sola cuando el
+    archivo cambia.
+    """
+    MANIFIESTO = "manifiesto.json"
+
+    def __init__(self, ruta, directorio=None, verificar_contenido=True):
+        """
+        Args:
+            ruta (str): Ruta del archivo CSV original.
+            directorio (str, optional): Carpeta de la caché. Por defecto,
+                                        '.cache_<archivo>' junto al archivo.
+            verificar_contenido (bool): Si es False y el tamaño y la fecha de
+                                        modificación coinciden, no se recalcula
+                                        el hash del contenido.
+        """
+        self.ruta = ruta
+        if directorio is None:
+            carpeta, archivo = os.path.split(os.path.abspath(ruta))
+            directorio = os.path.join(carpeta, f".cache_{archivo}")
+        self.directorio = directorio
+        self.verificar_contenido = verificar_contenido
+        # Último hash calculado, junto con el tamaño y la fecha del archivo en ese momento
+        self._hash = None
+
+    def _hash_contenido(self):
+        estado = os.stat(self.ruta)
+        firma = (estado.st_size, estado.st_mtime_ns)
+        if self._hash is None or self._hash[0] != firma:
+            resumen = hashlib.blake2b(digest_size=16)
+            with open(self.ruta, "rb") as f:
+                for bloque in iter(lambda: f.read(1 << 23), b""):
+                    resumen.update(bloque)
+            self._hash = (firma, resumen.hexdigest())
+        return self._hash[1]
+
+    def _leer_manifiesto(self):
+        try:
+            with open(os.path.join(self.directorio, self.MANIFIESTO), encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def _escribir_manifiesto(self, manifiesto):
+        os.makedirs(self.directorio, exist_ok=True)
+        destino = os.path.join(self.directorio, self.MANIFIESTO)
+        with open(destino + ".tmp", "w", encoding="utf-8") as f:
+            json.dump(manifiesto, f, ensure_ascii=False)
+        os.replace(destino + ".tmp", destino)
+
+    def manifiesto_valido(self, opciones=""):
+        """
+        Devuelve el manifiesto de la caché si sigue correspondiendo al archivo
+        original (y a las mismas opciones de lectura); si no, None.
+        """
+        manifiesto = self._leer_manifiesto()
+        estado = os.stat(self.ruta)
+        if manifiesto is None or manifiesto["tamano"] != estado.st_size or manifiesto["opciones"] != opciones:
+            return None
+        if manifiesto["mtime_ns"] == estado.st_mtime_ns and not self.verificar_contenido:
+            return manifiesto
+        if manifiesto["hash"] != self._hash_contenido():
+            return None
+        if manifiesto["mtime_ns"] != estado.st_mtime_ns:
+            # El archivo solo se volvió a guardar sin cambios: actualizamos la fecha
+            manifiesto["mtime_ns"] = estado.st_mtime_ns
+            self._escribir_manifiesto(manifiesto)
+        return manifiesto
+
+    def limpiar(self):
+        """
+        Borra los archivos de la caché: el manifiesto y las columnas que lista.
+        Cualquier otro archivo de la carpeta se deja como está.
+        """
+        manifiesto = self._leer_manifiesto() or {}
+        archivos = [entrada.get("archivo") for entrada in manifiesto.get("columnas", {}).values()]
+        for archivo in archivos + [self.MANIFIESTO, self.MANIFIESTO + ".tmp"]:
+            if not archivo or os.path.basename(archivo) != archivo:
+                continue
+            try:
+                os.remove(os.path.join(self.directorio, archivo))
+            except OSError:
+                pass
+
+    def cargar(self, lector):
+        """
+        Devuelve las columnas pedidas por un LectorCSV, leyendo del CSV y
+        guardando en la caché solo las que todavía no están.
+
+        Args:
+            lector (LectorCSV): Lector con la ruta, las columnas y las opciones de lectura.
+
+        Returns:
+            pd.DataFrame: Columnas pedidas, respaldadas por archivos con memoria mapeada.
+        """
+        opciones = repr(sorted(lector.kwargs.items()))
+        manifiesto = self.manifiesto_valido(opciones)
+        if manifiesto is None:
+            self.limpiar()
+            estado = os.stat(self.ruta)
+            manifiesto = {"tamano": estado.st_size, "mtime_ns": estado.st_mtime_ns,
+                          "hash": self._hash_contenido(), "opciones": opciones, "columnas": {}}
+
+        pedidas = lector.columnas
+        if pedidas is None:
+            pedidas = list(pd.read_csv(self.ruta, nrows=0, **lector.kwargs).columns)
+        faltantes = [columna for columna in pedidas if columna not in manifiesto["columnas"]]
+        if faltantes:
+            nuevo = LectorCSV(self.ruta, columnas=faltantes, tamano_bloque=lector.tamano_bloque,
+                              memory_map=lector.memory_map, **lector.kwargs)
+            self._guardar(manifiesto, nuevo._leer_csv(), nuevo.tipos())
+
+        return pd.DataFrame({columna: self._cargar_columna(manifiesto["columnas"][columna])
+                             for columna in pedidas}, copy=False)
+
+    def _guardar(self, manifiesto, datos, tipos):
+        os.makedirs(self.directorio, exist_ok=True)
+        for columna in datos.columns:
+            archivo = f"col_{len(manifiesto['columnas'])}.npy"
+            entrada = {"archivo": archivo, "tipo": tipos[columna]}
+            if tipos[columna] == "cuantitativa":
+                np.save(os.path.join(self.directorio, archivo), datos[columna].to_numpy(dtype=np.float64))
+            else:
+                categorico = datos[columna].array
+                np.save(os.path.join(self.directorio, archivo), np.asarray(categorico.codes))
+                entrada["categorias"] = categorico.categories.tolist()
+            manifiesto["columnas"][columna] = entrada
+        self._escribir_manifiesto(manifiesto)
+
+    def _cargar_columna(self, entrada):
+        valores = np.load(os.path.join(self.directorio, entrada["archivo"]), mmap_mode="r")
+        if entrada["tipo"] == "cuantitativa":
+            return valores
+        return pd.Categorical.from_codes(valores, entrada["categorias"])
+
+
+#### Perfilador de datasets ###
+
+def _perfilar_columna(nombre, serie):
+    """
+    Clasifica una columna y calcula su resumen. Es una función de módulo para
+    que los procesos del perfilador puedan ejecutarla.
+    """
+    try:
+        variable = VariableCuantitativa(serie, nombre)
+    except TypeError:
+        variable = VariableCualitativa(serie, nombre)
+
+    resumen = variable.resumen_dict()
+    del resumen["nombre"]
+    return resumen
+
+
+class PerfiladorDataset:
+    """
+    Analiza todas las columnas de un DataFrame (o de un CSV) de una sola vez.
+    Cada columna se clasifica con detectar_tipo y se resume como
+    VariableCuantitativa o VariableCualitativa; los resúmenes se calculan en
+    paralelo en un pool de procesos (o hilos) del tamaño de la máquina.
+    """
+    def __init__(self, datos, columnas=None, max_trabajadores=None, modo="procesos"):
+        """
+        Args:
+            datos (pd.DataFrame, str): DataFrame o ruta de un archivo CSV.
+            columnas (list, optional): Columnas a analizar. Por defecto, todas.
+            max_trabajadores (int, optional): Tamaño del pool. Por defecto, os.cpu_count().
+            modo (str): "procesos" o "hilos".
+        """
+        if modo not in ("procesos", "hilos"):
+            raise ValueError("El modo debe ser 'procesos' o 'hilos'.")
+        if not isinstance(datos, pd.DataFrame):
+            datos = LectorCSV(datos, columnas=columnas).leer()
+        self.datos = datos if columnas is None else datos[list(columnas)]
+        self.max_trabajadores = max_trabajadores or os.cpu_count() or 1
+        self.modo = modo
+
+    def clasificar(self):
+        """
+        Returns:
+            dict: Tipo ("cuantitativa" o "cualitativa") de cada columna.
+        """
+        return {columna: Variable(self.datos[columna]).tipo for columna in self.datos.columns}
+
+    def perfilar(self):
+        """
+        Calcula el resumen de todas las columnas.
+
+        Returns:
+            dict: Resumen de cada columna, en el orden del DataFrame.
+        """
+        columnas = list(self.datos.columns)
+        trabajadores = min(self.max_trabajadores, len(columnas))
+        if trabajadores <= 1:
+            return {columna: _perfilar_columna(columna, self.datos[columna]) for columna in columnas}
+
+        Pool = ProcessPoolExecutor if self.modo == "procesos" else ThreadPoolExecutor
+        with Pool(max_workers=trabajadores) as pool:
+            resumenes = pool.map(_perfilar_columna, columnas, (self.datos[columna] for columna in columnas))
+            return dict(zip(columnas, resumenes))
+
+    def tabla(self):
+        """Devuelve el reporte como DataFrame: una fila por columna analizada."""
+        return pd.DataFrame.from_dict(
+            {columna: {clave: valor for clave, valor in resumen.items() if clave != "frecuencias"}
+             for columna, resumen in self.perfilar().items()},
+            orient="index")
+
+
+#### Exportación de resúmenes ###
+
+class ExportadorResumenes:
+    """
+    Serializa los resúmenes (resumen_dict) de muchas variables a la vez, para
+    que otros procesos los carguen sin interpretar texto.
+
+    - JSON: una lista con el resumen completo de cada variable.
+    - Columnar: una fila por variable y una columna por estadístico, en
+      Parquet (requiere pyarrow o fastparquet), .npz de numpy o CSV. Las
+      frecuencias por categoría no entran en este formato, solo en el JSON.
+
+    Los valores no finitos (por ejemplo, coeficiente_variacion = inf cuando la
+    media es 0) se escriben como null en JSON y como valor faltante en el
+    formato columnar, porque Infinity y NaN no son JSON válido.
+    """
+    def __init__(self, variables):
+        """
+        Args:
+            variables (list): Objetos VariableCuantitativa y/o VariableCualitativa.
+        """
+        for variable in variables:
+            if not isinstance(variable, (VariableCuantitativa, VariableCualitativa)):
+                raise TypeError("Se requieren objetos VariableCuantitativa o VariableCualitativa.")
+        self.variables = list(variables)
+        self._resumenes = None
+
+    def resumenes(self):
+        """Resumen de cada variable, calculado una sola vez."""
+        if self._resumenes is None:
+            self._resumenes = [variable.resumen_dict() for variable in self.variables]
+        return self._resumenes
+
+    def _resumenes_finitos(self):
+        """Resúmenes con None en lugar de los valores inf o NaN."""
+        return [{clave: None if isinstance(valor, float) and not math.isfinite(valor) else valor
+                 for clave, valor in resumen.items()}
+                for resumen in self.resumenes()]
+
+    def a_json(self, archivo=None):
+        """
+        Args:
+            archivo (str, optional): Ruta del archivo. Si no se indica, se devuelve el texto.
+
+        Returns:
+            str: El JSON, o la ruta del archivo escrito.
+        """
+        resumenes = self._resumenes_finitos()
+        if archivo is None:
+            return json.dumps(resumenes, ensure_ascii=False, allow_nan=False)
+        with open(archivo, "w", encoding="utf-8") as f:
+            json.dump(resumenes, f, ensure_ascii=False, allow_nan=False)
+        return archivo
+
+    def tabla(self):
+        """DataFrame con una fila por variable (sin las frecuencias por categoría)."""
+        filas = [{clave: valor for clave, valor in resumen.items() if clave != "frecuencias"}
+                 for resumen in self._resumenes_finitos()]
+        return pd.DataFrame(filas).set_index("nombre")
+
+    def a_columnas(self, archivo, formato=None):
+        """
+        Escribe la tabla de resúmenes en formato columnar.
+
+        Args:
+            archivo (str): Ruta del archivo.
+            formato (str, optional): "parquet", "npz" o "csv". Por defecto, según la extensión.
+
+        Returns:
+            str: La ruta del archivo escrito.
+        """
+        formato = formato or os.path.splitext(archivo)[1].lstrip(".").lower()
+        tabla = self.tabla()
+        # Las columnas no numéricas (moda, menos_frecuente) pueden mezclar
+        # tipos según la variable; se guardan como texto
+        texto = [columna for columna in tabla.columns if not pd.api.types.is_numeric_dtype(tabla[columna])]
+        tabla[texto] = tabla[texto].astype("string")
+        if formato == "parquet":
+            tabla.to_parquet(archivo)
+        elif formato == "npz":
+            columnas = {"nombre": tabla.index.to_numpy(dtype=str)}
+            for columna in tabla.columns:
+                if columna in texto:
+                    columnas[columna] = tabla[columna].fillna("").to_numpy(dtype=str)
+                else:
+                    columnas[columna] = tabla[columna].to_numpy(dtype=np.float64)
+            # np.savez agrega la extensión si falta; se abre el archivo para respetar la ruta
+            with open(archivo, "wb") as f:
+                np.savez(f, **columnas)
+        elif formato == "csv":
+            tabla.to_csv(archivo)
+        else:
+            raise ValueError(f"Formato '{formato}' no soportado. Use 'parquet', 'npz' o 'csv'.")
+        return archivo
+
+
+#### Exportación de frecuencias ###
+
+def _tabla_frecuencias_larga(variable):
+    """Tabla de frecuencias de una variable en formato largo (una fila por categoría)."""
+    tabla = variable.calcular_frecuencia()
+    return pd.DataFrame({
+        "variable": variable.nombre,
+        "categoria": tabla.index,
+        "frecuencia_absoluta": tabla["Frecuencia absoluta"].to_numpy(),
+        "frecuencia_relativa": tabla["Frecuencia relativa"].to_numpy(),
+    })
+
+
+class ExportadorFrecuencias:
+    """
+    Exporta las tablas de frecuencia de muchas variables cualitativas a un
+    único archivo en formato largo: variable, categoria, frecuencia_absoluta
+    y frecuencia_relativa.
+
+    Las tablas se calculan en paralelo (hilos o procesos) y, en CSV, se
+    escriben a medida que están listas sobre un único archivo con buffer
+    grande y compresión opcional (gzip, bz2 o xz). Parquet y Feather
+    requieren pyarrow y se escriben de una vez.
+    """
+    TAMANO_BUFFER = 1 << 20
+    COMPRESIONES = {".gz": "gzip", ".bz2": "bz2", ".xz": "xz"}
+
+    def __init__(self, variables, max_trabajadores=None, modo="hilos"):
+        """
+        Args:
+            variables (list): Objetos VariableCualitativa.
+            max_trabajadores (int, optional): Tamaño del pool. Por defecto, os.cpu_count().
+            modo (str): "hilos" o "procesos".
+        """
+        if modo not in ("procesos", "hilos"):
+            raise ValueError("El modo debe ser 'procesos' o 'hilos'.")
+        for variable in variables:
+            if not isinstance(variable, VariableCualitativa):
+                raise TypeError("Se requieren objetos de tipo VariableCualitativa.")
+        self.variables = list(variables)
+        self.max_trabajadores = max_trabajadores or os.cpu_count() or 1
+        self.modo = modo
+
+    @classmethod
+    def desde_dataframe(cls, df, columnas=None, **kwargs):
+        """Crea el exportador con una VariableCualitativa por cada columna del DataFrame."""
+        columnas = df.columns if columnas is None else columnas
+        return cls([VariableCualitativa(df[columna], columna) for columna in columnas], **kwargs)
+
+    def tablas(self):
+        """
+        Genera la tabla de frecuencias (formato largo) de cada variable, en orden,
+        a medida que el pool las termina.
+        """
+        trabajadores = min(self.max_trabajadores, len(self.variables))
+        if trabajadores <= 1:
+            yield from map(_tabla_frecuencias_larga, self.variables)
+            return
+        Pool = ProcessPoolExecutor if self.modo == "procesos" else ThreadPoolExecutor
+        with Pool(max_workers=trabajadores) as pool:
+            yield from pool.map(_tabla_frecuencias_larga, self.variables)
+
+    def tabla(self):
+        """Devuelve todas las tablas concatenadas en un único DataFrame."""
+        tablas = list(self.tablas())
+        if not tablas:
+            return pd.DataFrame(columns=["variable", "categoria", "frecuencia_absoluta", "frecuencia_relativa"])
+        return pd.concat(tablas, ignore_index=True)
+
+    def exportar(self, archivo, formato=None, compresion="infer"):
+        """
+        Escribe todas las tablas en un solo archivo.
+
+        Args:
+            archivo (str): Ruta del archivo.
+            formato (str, optional): "csv", "parquet" o "feather". Por defecto, según la extensión.
+            compresion (str, optional): Para CSV: "gzip", "bz2", "xz", None o "infer" (según la extensión).
+
+        Returns:
+            str: La ruta del archivo escrito.
+        """
+        base, extension = os.path.splitext(archivo)
+        comprimido = self.COMPRESIONES.get(extension.lower())
+        if comprimido is not None:
+            # El formato es la extensión anterior a la de compresión (datos.csv.gz)
+            extension = os.path.splitext(base)[1]
+        if compresion == "infer":
+            compresion = comprimido
+        formato = formato or extension.lstrip(".").lower()
+
+        if formato in ("parquet", "feather"):
+            tabla = self.tabla()
+            tabla["categoria"] = tabla["categoria"].astype("string")
+            if formato == "parquet":
+                tabla.to_parquet(archivo, index=False)
+            else:
+                tabla.to_feather(archivo)
+            return archivo
+        if formato not in ("csv", "txt"):
+            raise ValueError(f"Formato '{formato}' no soportado. Use 'csv', 'parquet' o 'feather'.")
+
+        if compresion is None:
+            f = open(archivo, "w", encoding="utf-8", newline="", buffering=self.TAMANO_BUFFER)
+        else:
+            modulos = {"gzip": gzip, "bz2": bz2, "xz": lzma}
+            if compresion not in modulos:
+                raise ValueError(f"Compresión '{compresion}' no soportada. Use 'gzip', 'bz2' o 'xz'.")
+            f = io.TextIOWrapper(io.BufferedWriter(modulos[compresion].open(archivo, "wb"), self.TAMANO_BUFFER),
+                                 encoding="utf-8", newline="")
+        with f:
+            f.write("variable,categoria,frecuencia_absoluta,frecuencia_relativa\n")
+            for tabla in self.tablas():
+                tabla.to_csv(f, header=False, index=False)
+        return archivo
 
 
 
@@ -0,0 +1,253 @@
+"""
+Benchmark de la librería estadística.
+
+Genera columnas sintéticas de distintos tamaños y cardinalidades, mide el
+tiempo de cada método público de VariableCuantitativa, VariableCualitativa
+y de los visualizadores, y registra el pico de memoria de cada uno. Los
+resultados se guardan en JSON; si se pasa una corrida anterior con
+--referencia, se marcan los métodos que se volvieron más lentos que el umbral.
+
+Ejemplos:
+    python benchmark.py
+    python benchmark.py --tamanos 1e3,1e5,1e7 --salida base.json
+    python benchmark.py --referencia base.json --umbral 0.2
+
+No necesita conexión: los datos se generan con numpy y los gráficos se
+renderizan en memoria, sin pantalla.
+"""
+import argparse
+import io
+import json
+import platform
+import sys
+import time
+import tracemalloc
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+
+import POO_LIBRERIA.libreria_completa as mi_libreria
+
+# Métodos a medir: (nombre, función que recibe la variable)
+METODOS_CUANTITATIVOS = [
+    ("media", lambda v: v.media()),
+    ("varianza", lambda v: v.varianza()),
+    ("desviacion_estandar", lambda v: v.desviacion_estandar()),
+    ("mediana", lambda v: v.mediana()),
+    ("percentil", lambda v: v.percentil(90)),
+    ("rango", lambda v: v.rango()),
+    ("coeficiente_variacion", lambda v: v.coeficiente_variacion()),
+    ("asimetria", lambda v: v.asimetria()),
+    ("curtosis", lambda v: v.curtosis()),
+    ("cuartiles", lambda v: v.cuartiles()),
+    ("rango_intercuartilico", lambda v: v.rango_intercuartilico()),
+    ("detectar_atipicos", lambda v: v.detectar_atipicos()),
+    ("histograma", lambda v: v.histograma()),
+    ("resumen_dict", lambda v: v.resumen_dict()),
+]
+
+METODOS_CUALITATIVOS = [
+    ("calcular_moda", lambda v: v.calcular_moda()),
+    ("calcular_menos_frecuente", lambda v: v.calcular_menos_frecuente()),
+    ("calcular_frecuencia", lambda v: v.calcular_frecuencia()),
+    ("tabla_frecuencia_acumulada", lambda v: v.tabla_frecuencia_acumulada()),
+    ("tabla_frecuencia_alfabetica", lambda v: v.tabla_frecuencia_alfabetica()),
+    ("porcentajes_categorias", lambda v: v.porcentajes_categorias(["c0", "c1", "no_existe"])),
+    ("resumen_dict", lambda v: v.resumen_dict()),
+]
+
+GRAFICOS_CUANTITATIVOS = [
+    ("graficar_histograma", lambda v: mi_libreria.VisualizadorEstadistico(v).graficar_histograma(archivo=io.BytesIO())),
+    ("graficar_boxplot", lambda v: mi_libreria.VisualizadorEstadistico(v).graficar_boxplot(archivo=io.BytesIO())),
+]
+
+GRAFICOS_CUALITATIVOS = [
+    ("graficar_pastel", lambda v: mi_libreria.VisualizadorCualitativo(v).graficar_pastel(archivo=io.BytesIO())),
+    ("graficar_barras", lambda v: mi_libreria.VisualizadorCualitativo(v).graficar_barras(archivo=io.BytesIO())),
+]
+
+# Los gráficos cualitativos dibujan una porción o barra por categoría
+MAX_CATEGORIAS_GRAFICO = 100
+
+# Las columnas de strings, a diferencia de las categóricas, pasan por detectar_tipo y pd.factorize
+FORMATOS_CUALITATIVOS = ["categorica", "texto"]
+
+
+def generar_cuantitativa(filas, semilla):
+    """Columna numérica con forma de distribución log-normal."""
+    return pd.Series(np.random.default_rng(semilla).lognormal(0, 0.5, filas), name="cuantitativa")
+
+
+def generar_cualitativa(filas, cardinalidad, semilla, formato="categorica"):
+    """
+    Columna con `cardinalidad` categorías de frecuencias desiguales.
+
+    Args:
+        formato (str): "categorica" para dtype category; "texto" para una columna de
+            strings, que pasa por detectar_tipo y la factorización.
+    """
+    generador = np.random.default_rng(semilla)
+    pesos = 1 / np.arange(1, cardinalidad + 1)
+    codigos = generador.choice(cardinalidad, size=filas, p=pesos / pesos.sum())
+    categorias = [f"c{i}" for i in range(cardinalidad)]
+    serie = pd.Series(pd.Categorical.from_codes(codigos, categorias), name="cualitativa")
+    return serie if formato == "categorica" else serie.astype(str)
+
+
+def medir(crear, metodo, repeticiones):
+    """
+    Mide un método sobre una variable nueva en cada repetición, para no medir
+    las cachés de la variable.
+
+    Returns:
+        tuple: (mejor tiempo en segundos, pico de memoria en bytes).
+    """
+    tiempos = []
+    for _ in range(repeticiones):
+        variable = crear()
+        inicio = time.perf_counter()
+        metodo(variable)
+        tiempos.append(time.perf_counter() - inicio)
+        del variable
+
+    # El pico de memoria se mide aparte porque tracemalloc hace más lento el código
+    variable = crear()
+    tracemalloc.start()
+    metodo(variable)
+    _, pico = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return min(tiempos), pico
+
+
+def ejecutar(tamanos, cardinalidades, repeticiones, graficos=True, semilla=0):
+    """
+    Corre todos los métodos para cada tamaño (y cardinalidad y formato, en las cualitativas).
+
+    Returns:
+        list: Un diccionario por medición.
+    """
+    resultados = []
+
+    def registrar(clase, metodo, filas, cardinalidad, segundos, memoria_pico, formato=None):
+        resultados.append({
+            "clase": clase,
+            "metodo": metodo,
+            "filas": filas,
+            "cardinalidad": cardinalidad,
+            "formato": formato,
+            "segundos": segundos,
+            "memoria_pico": memoria_pico,
+        })
+        detalle = f"{filas:>11,} filas" + (f", {cardinalidad:,} categorías, {formato}" if cardinalidad else "")
+        print(f"{clase:<22} {metodo:<28} {detalle:<46} {segundos * 1000:>10.2f} ms {memoria_pico / 2 ** 20:>9.1f} MiB")
+
+    for filas in tamanos:
+        serie = generar_cuantitativa(filas, semilla)
+        crear = lambda: mi_libreria.VariableCuantitativa(serie, "cuantitativa")
+        registrar("VariableCuantitativa", "__init__", filas, None, *medir(lambda: None, lambda _: crear(), repeticiones))
+        metodos = METODOS_CUANTITATIVOS + (GRAFICOS_CUANTITATIVOS if graficos else [])
+        for nombre, metodo in metodos:
+            registrar("VariableCuantitativa", nombre, filas, None, *medir(crear, metodo, repeticiones))
+        del serie
+
+        for cardinalidad in cardinalidades:
+            for formato in FORMATOS_CUALITATIVOS:
+                serie = generar_cualitativa(filas, cardinalidad, semilla, formato)
+                crear = lambda: mi_libreria.VariableCualitativa(serie, "cualitativa")
+                registrar("VariableCualitativa", "__init__", filas, cardinalidad,
+                          *medir(lambda: None, lambda _: crear(), repeticiones), formato=formato)
+                # Con strings, detectar_tipo intenta convertir la columna a número antes de factorizar
+                registrar("VariableCualitativa", "detectar_tipo", filas, cardinalidad,
+                          *medir(lambda: mi_libreria.Variable(serie, "cualitativa"),
+                                 lambda v: v.detectar_tipo(), repeticiones), formato=formato)
+                metodos = METODOS_CUALITATIVOS
+                if graficos and cardinalidad <= MAX_CATEGORIAS_GRAFICO:
+                    metodos = metodos + GRAFICOS_CUALITATIVOS
+                for nombre, metodo in metodos:
+                    registrar("VariableCualitativa", nombre, filas, cardinalidad,
+                              *medir(crear, metodo, repeticiones), formato=formato)
+                del serie
+    return resultados
+
+
+def comparar(resultados, referencia, umbral, minimo):
+    """
+    Compara con una corrida anterior.
+
+    Args:
+        umbral (float): Aumento relativo del tiempo a partir del cual hay regresión (0.2 = 20%).
+        minimo (float): Tiempos de referencia por debajo de este valor (en segundos) se ignoran por ruido.
+
+    Returns:
+        list: Las mediciones que empeoraron, con su tiempo de referencia.
+    """
+    # Las corridas anteriores al campo "formato" solo medían columnas categóricas
+    clave = lambda r: (r["clase"], r["metodo"], r["filas"], r["cardinalidad"],
+                       r.get("formato", "categorica" if r["cardinalidad"] else None))
+    anteriores = {clave(r): r for r in referencia["resultados"]}
+    regresiones = []
+    for resultado in resultados:
+        anterior = anteriores.get(clave(resultado))
+        if anterior is None or anterior["segundos"] < minimo:
+            continue
+        if resultado["segundos"] > anterior["segundos"] * (1 + umbral):
+            regresiones.append({**resultado, "segundos_referencia": anterior["segundos"],
+                                "cambio": resultado["segundos"] / anterior["segundos"] - 1})
+    return regresiones
+
+
+def lista_enteros(texto):
+    """Convierte "1e3,1e5" en [1000, 100000]."""
+    return [int(float(valor)) for valor in texto.split(",") if valor]
+
+
+def main(argumentos=None):
+    parser = argparse.ArgumentParser(description="Benchmark de la librería estadística.")
+    parser.add_argument("--tamanos", type=lista_enteros, default=lista_enteros("1e3,1e4,1e5,1e6"),
+                        help="Cantidades de filas, separadas por comas (hasta 1e8).")
+    parser.add_argument("--cardinalidades", type=lista_enteros, default=lista_enteros("2,100,10000"),
+                        help="Cantidades de categorías de las variables cualitativas.")
+    parser.add_argument("--repeticiones", type=int, default=3)
+    parser.add_argument("--sin-graficos", action="store_true", help="No medir los visualizadores.")
+    parser.add_argument("--salida", default="benchmark_resultados.json")
+    parser.add_argument("--referencia", help="JSON de una corrida anterior para detectar regresiones.")
+    parser.add_argument("--umbral", type=float, default=0.2)
+    parser.add_argument("--minimo", type=float, default=1e-3)
+    args = parser.parse_args(argumentos)
+
+    # Sin caché en disco: se mide el cálculo, no la lectura de resultados guardados
+    mi_libreria.CACHE_RESULTADOS.activa = False
+
+    resultados = ejecutar(args.tamanos, args.cardinalidades, args.repeticiones, graficos=not args.sin_graficos)
+    reporte = {
+        "fecha": datetime.now().isoformat(timespec="seconds"),
+        "entorno": {
+            "python": platform.python_version(),
+            "numpy": np.__version__,
+            "pandas": pd.__version__,
+            "plataforma": platform.platform(),
+            "procesador": platform.processor(),
+        },
+        "resultados": resultados,
+    }
+    with open(args.salida, "w", encoding="utf-8") as f:
+        json.dump(reporte, f, indent=2)
+    print(f"\nResultados guardados en {args.salida}")
+
+    if args.referencia:
+        with open(args.referencia, encoding="utf-8") as f:
+            referencia = json.load(f)
+        regresiones = comparar(resultados, referencia, args.umbral, args.minimo)
+        if regresiones:
+            print(f"\nRegresiones (más de {args.umbral:.0%} más lento que {args.referencia}):")
+            for r in regresiones:
+                print(f"  {r['clase']}.{r['metodo']} ({r['filas']:,} filas, cardinalidad {r['cardinalidad']}, {r['formato']}): "
+                      f"{r['segundos_referencia'] * 1000:.2f} ms -> {r['segundos'] * 1000:.2f} ms ({r['cambio']:+.0%})")
+            return 1
+        print(f"\nSin regresiones respecto de {args.referencia}.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
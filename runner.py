@@ -3,7 +3,8 @@ import pandas as pd
 import math
 import matplotlib.pyplot as plt
 import POO_LIBRERIA.libreria_completa as mi_libreria
-df = pd.read_csv("archivo_prueba.txt")
+# Leemos solo las columnas que vamos a analizar
+df = mi_libreria.LectorCSV("archivo_prueba.txt", columnas=["Estado_Civil", "Altura"]).leer()
 
 #inyectamos las librerias 
 mi_libreria.pd = pd
@@ -0,0 +1,51 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+import POO_LIBRERIA.libreria_completa as mi_libreria
+
+
+@pytest.mark.parametrize("datos", [
+    np.random.default_rng(3).normal(10, 2, 5_000),
+    np.random.default_rng(3).lognormal(0, 1, 3_000),
+    1e9 + np.random.default_rng(4).normal(0, 1, 2_000),
+    np.array([4.0, 1.0, 7.0]),
+    np.full(50, 2.5),
+], ids=["normal", "lognormal", "desplazados", "pocos", "constantes"])
+def test_acumulador_por_bloques_igual_a_la_variable(datos):
+    variable = mi_libreria.VariableCuantitativa(pd.Series(datos, name="x"), "x")
+    primero, segundo = mi_libreria.AcumuladorCuantitativo(), mi_libreria.AcumuladorCuantitativo()
+    mitad = len(datos) // 2
+    for inicio in range(0, mitad, 700):
+        primero.agregar_bloque(datos[inicio:min(inicio + 700, mitad)])
+    segundo.agregar_bloque(datos[mitad:])
+    primero.combinar(segundo)
+
+    assert primero.n == variable.n
+    assert primero.media() == pytest.approx(variable.media(), rel=1e-12)
+    assert primero.varianza() == pytest.approx(variable.varianza(), rel=1e-9, abs=1e-12)
+    assert primero.asimetria() == pytest.approx(variable.asimetria(), rel=1e-6, abs=1e-9)
+    assert primero.curtosis() == pytest.approx(variable.curtosis(), rel=1e-6, abs=1e-9)
+
+
+
+
+def test_acumulador_descarta_faltantes_y_rechaza_texto():
+    acumulador = mi_libreria.AcumuladorCuantitativo("x")
+    acumulador.agregar_bloque([1.0, np.nan, 3.0]).agregar_bloque(pd.Series([None, 5.0]))
+    assert acumulador.n == 3
+    assert acumulador.media() == 3.0
+    assert acumulador.rango() == 4.0
+    with pytest.raises(TypeError):
+        acumulador.agregar_bloque(["a", "b"])
+
+
+def test_acumulador_desde_csv(tmp_path):
+    ruta = tmp_path / "datos.csv"
+    valores = np.random.default_rng(1).normal(size=2_500)
+    pd.DataFrame({"x": valores, "y": 1}).to_csv(ruta, index=False)
+    acumulador = mi_libreria.AcumuladorCuantitativo.desde_csv(ruta, "x", tamano_bloque=1_000)
+    variable = mi_libreria.VariableCuantitativa(pd.Series(valores, name="x"), "x")
+    assert acumulador.n == 2_500
+    assert acumulador.media() == pytest.approx(variable.media(), rel=1e-12)
+    assert acumulador.desviacion_estandar() == pytest.approx(variable.desviacion_estandar(), rel=1e-9)
@@ -0,0 +1,66 @@
+import pickle
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import POO_LIBRERIA.libreria_completa as mi_libreria
+
+
+def _variable(valores):
+    return mi_libreria.VariableCuantitativa(pd.Series(valores, name="x"), "x")
+
+
+def test_agregar_equivale_a_variable_nueva():
+    generador = np.random.default_rng(0)
+    lotes = [generador.normal(size=n) for n in (500, 1, 37, 1000)]
+    variable = _variable(lotes[0])
+    variable.mediana()
+    variable._huella_datos()
+    for lote in lotes[1:]:
+        variable.agregar(lote)
+
+    nueva = _variable(np.concatenate(lotes))
+    assert variable.mediana() == nueva.mediana()
+    assert variable.percentiles([5, 50, 95]) == nueva.percentiles([5, 50, 95])
+    assert np.array_equal(variable._datos_ordenados(), np.sort(np.concatenate(lotes)))
+    assert variable.media() == pytest.approx(nueva.media())
+    assert variable.varianza() == pytest.approx(nueva.varianza())
+    assert variable._huella_datos() == nueva._huella_datos()
+
+
+def test_agregar_no_reordena_todo_en_cada_lote():
+    variable = _variable(np.arange(10.0))
+    variable.mediana()
+    ordenados = variable._ordenados
+    variable.agregar([3.5, -1.0])
+    variable.agregar([100.0])
+    # Los lotes quedan pendientes hasta que se pide la vista ordenada
+    assert variable._ordenados is ordenados
+    assert len(variable._corridas) == 2
+    assert variable.percentil(0) == -1.0
+    assert variable.percentil(100) == 100.0
+    assert variable._corridas == []
+
+
+def test_variable_con_huella_se_puede_serializar():
+    variable = _variable([1.0, 2.0, 3.0])
+    huella = variable._huella_datos()
+    copia = pickle.loads(pickle.dumps(variable))
+    copia.agregar([4.0])
+    assert copia._huella_datos() == _variable([1.0, 2.0, 3.0, 4.0])._huella_datos()
+    assert variable._huella_datos() == huella
+
+
+def test_texto_numerico_se_convierte_una_sola_vez():
+    textos = pd.Series(["1.5", "2", None, "-3"], name="x")
+    variable = mi_libreria.Variable(textos)
+    assert variable.tipo == "cuantitativa"
+    assert not hasattr(variable, "_valores_float")
+
+    cuantitativa = mi_libreria.VariableCuantitativa(textos)
+    assert cuantitativa._valores_float is None
+    cuantitativa.agregar(["4", None])
+    assert cuantitativa.datos.tolist() == [1.5, 2.0, -3.0, 4.0]
+    with pytest.raises(TypeError):
+        cuantitativa.agregar(["a"])
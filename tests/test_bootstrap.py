@@ -0,0 +1,58 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+import POO_LIBRERIA.libreria_completa as mi_libreria
+
+
+@pytest.fixture
+def variable():
+    return mi_libreria.VariableCuantitativa(pd.Series(np.random.default_rng(0).gamma(2, 3, 40), name="x"), "x")
+
+
+def test_misma_semilla_mismo_resultado_con_uno_o_varios_procesos(variable):
+    remuestras = 3 * mi_libreria.Bootstrap.REMUESTRAS_POR_TAREA
+    un_proceso = mi_libreria.Bootstrap(variable, remuestras, semilla=7, max_trabajadores=1)
+    varios = mi_libreria.Bootstrap(variable, remuestras, semilla=7, max_trabajadores=3)
+    assert np.array_equal(un_proceso.distribucion("mediana"), varios.distribucion("mediana"))
+    assert un_proceso.intervalo("media") == varios.intervalo("media")
+    otra_semilla = mi_libreria.Bootstrap(variable, remuestras, semilla=8, max_trabajadores=1)
+    assert not np.array_equal(un_proceso.distribucion("media"), otra_semilla.distribucion("media"))
+
+
+@pytest.mark.parametrize("estadistico, args", [
+    ("media", ()), ("mediana", ()), ("varianza", ()), ("varianza", (False,)),
+    ("desviacion_estandar", ()), ("coeficiente_variacion", ()), ("asimetria", ()),
+    ("curtosis", ()), ("rango", ()), ("rango_intercuartilico", ()), ("percentil", (90,)),
+])
+def test_estadistico_como_un_bootstrap_en_python(variable, estadistico, args):
+    remuestras = mi_libreria.Bootstrap.REMUESTRAS_POR_TAREA + 50
+    replicas = mi_libreria.Bootstrap(variable, remuestras, semilla=3, max_trabajadores=1).distribucion(estadistico, *args)
+
+    # Las mismas remuestras (cada tarea con su semilla derivada) y el método de la variable en cada una
+    datos = variable.datos.tolist()
+    esperado = []
+    for semilla, cantidad in zip(np.random.SeedSequence(3).spawn(2), (remuestras - 50, 50)):
+        generador = np.random.default_rng(semilla)
+        for fila in generador.integers(0, len(datos), size=(cantidad, len(datos)), dtype=np.int32):
+            remuestra = mi_libreria.VariableCuantitativa(pd.Series([datos[i] for i in fila]), "r")
+            esperado.append(getattr(remuestra, estadistico)(*args))
+    np.testing.assert_allclose(replicas, esperado, rtol=1e-9, atol=1e-12)
+
+
+def test_intervalo_de_la_media_cerca_del_normal():
+    datos = np.random.default_rng(1).normal(10, 2, 2_000)
+    variable = mi_libreria.VariableCuantitativa(pd.Series(datos, name="x"), "x")
+    intervalo = variable.intervalo_confianza("media", remuestras=2_000, semilla=0, max_trabajadores=1)
+    error = datos.std(ddof=1) / np.sqrt(len(datos))
+    assert intervalo["estimacion"] == pytest.approx(datos.mean())
+    assert intervalo["error_estandar"] == pytest.approx(error, rel=0.1)
+    assert intervalo["inferior"] < datos.mean() < intervalo["superior"]
+    assert intervalo["superior"] - intervalo["inferior"] == pytest.approx(2 * 1.96 * error, rel=0.1)
+
+
+@pytest.mark.parametrize("estadistico, args", [("percentil", ()), ("percentil", (50, 2)), ("percentil", (150,)),
+                                               ("media", (1,)), ("moda", ())])
+def test_argumentos_invalidos(variable, estadistico, args):
+    with pytest.raises(ValueError):
+        mi_libreria.Bootstrap(variable, 10, semilla=0, max_trabajadores=1).distribucion(estadistico, *args)
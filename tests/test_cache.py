@@ -0,0 +1,64 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+import POO_LIBRERIA.libreria_completa as lib
+
+
+@pytest.fixture
+def cache(tmp_path, monkeypatch):
+    cache = lib.CacheResultados(directorio=str(tmp_path / "cache"), activa=True)
+    monkeypatch.setattr(lib, "CACHE_RESULTADOS", cache)
+    return cache
+
+
+def test_cache_desactivada_por_defecto(monkeypatch):
+    monkeypatch.delenv("POO_LIBRERIA_CACHE", raising=False)
+    assert not lib.CacheResultados().activa
+    monkeypatch.setenv("POO_LIBRERIA_CACHE", "1")
+    assert lib.CacheResultados().activa
+
+
+def test_arreglos_largos_no_comparten_clave(cache):
+    v = lib.VariableCuantitativa(np.arange(100.0))
+    a = np.linspace(0, 100, 2000)
+    b = a.copy()
+    b[1000] = 1.0
+    assert np.allclose(v.percentiles(a), np.percentile(v.datos, a))
+    assert np.allclose(v.percentiles(b), np.percentile(v.datos, b))
+    bordes = np.linspace(0, 99, 1500)
+    otros = bordes.copy()
+    otros[700] += 0.01
+    assert np.array_equal(v.histograma(bordes)[1], bordes)
+    assert np.array_equal(v.histograma(otros)[1], otros)
+
+
+def test_nombre_de_la_variable_en_la_clave(cache):
+    lib.VariableCualitativa(pd.Series(["s", "n", "s"], name="Fumador"), None).calcular_frecuencia()
+    tabla = lib.VariableCualitativa(pd.Series(["s", "n", "s"], name="Casado"), None).calcular_frecuencia()
+    assert tabla.index.name == "Casado"
+
+
+def test_resultado_guardado_se_reutiliza(cache):
+    lib.VariableCuantitativa([1.0, 2.0, 3.0]).media()
+    assert len(cache._entradas()) == 1
+    assert lib.VariableCuantitativa([1.0, 2.0, 3.0]).media() == 2.0
+    assert len(cache._entradas()) == 1
+
+
+def test_carpeta_no_escribible_es_un_fallo_de_cache(tmp_path, monkeypatch):
+    archivo = tmp_path / "no_es_carpeta"
+    archivo.write_text("x")
+    cache = lib.CacheResultados(directorio=str(archivo / "resultados"), activa=True)
+    monkeypatch.setattr(lib, "CACHE_RESULTADOS", cache)
+    assert lib.VariableCuantitativa([1, 2, 3]).media() == 2.0
+
+
+def test_desalojo_respeta_tamano_maximo(tmp_path):
+    cache = lib.CacheResultados(directorio=str(tmp_path), tamano_maximo=10_000, activa=True)
+    for i in range(50):
+        cache.guardar(("clave", i), np.zeros(100))
+    total = sum(tamano for _, tamano, _ in cache._entradas())
+    assert total <= 10_000
+    assert cache._tamano_total == total
+    assert cache.obtener(("clave", 49))[0]
@@ -0,0 +1,78 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+import POO_LIBRERIA.libreria_completa as mi_libreria
+
+
+def test_categorias_sin_datos_no_suman_grados_de_libertad():
+    texto = pd.DataFrame({"a": list("xyxyxy"), "b": list("ppqqpq")})
+    categorico = texto.astype({"a": pd.CategoricalDtype(list("xyz"))})
+
+    esperado = mi_libreria.TablaContingencia.desde_dataframe(texto, ["a", "b"]).chi_cuadrado()
+    resultado = mi_libreria.TablaContingencia.desde_dataframe(categorico, ["a", "b"]).chi_cuadrado()
+    assert resultado["grados_libertad"] == esperado["grados_libertad"] == 1
+    assert resultado["p_valor"] == pytest.approx(esperado["p_valor"])
+    assert resultado["v_cramer"] == pytest.approx(esperado["v_cramer"])
+
+
+def _datos(filas=3_000, semilla=2):
+    generador = np.random.default_rng(semilla)
+    return pd.DataFrame({
+        "ciudad": generador.choice(["Lima", "Quito", "Cusco"], filas),
+        "grado": generador.choice(["A", "B", "C", "D"], filas, p=[0.4, 0.3, 0.2, 0.1]),
+        "estado": generador.choice(["soltero", "casado"], filas),
+    })
+
+
+def test_tabla_como_crosstab():
+    df = _datos()
+    df.loc[::50, "grado"] = None
+    tabla = mi_libreria.TablaContingencia.desde_dataframe(df, ["ciudad", "grado"]).tabla()
+    esperado = pd.crosstab(df["ciudad"], df["grado"])
+    np.testing.assert_array_equal(tabla.to_numpy(), esperado.to_numpy())
+    assert tabla.index.tolist() == esperado.index.tolist()
+    assert tabla.columns.tolist() == esperado.columns.tolist()
+
+    tres = mi_libreria.TablaContingencia.desde_dataframe(df, ["ciudad", "grado", "estado"]).tabla()
+    esperado = pd.crosstab([df["ciudad"], df["grado"]], df["estado"])
+    np.testing.assert_array_equal(tres.to_numpy(), esperado.to_numpy())
+
+
+def test_tabla_dispersa_igual_a_la_densa(monkeypatch):
+    df = _datos()
+    densa = mi_libreria.TablaContingencia.desde_dataframe(df, ["ciudad", "grado"]).tabla()
+    monkeypatch.setattr(mi_libreria.TablaContingencia, "LIMITE_DENSA", 0)
+    dispersa = mi_libreria.TablaContingencia.desde_dataframe(df, ["ciudad", "grado"]).tabla()
+    larga = densa.stack().rename("Frecuencia absoluta").reset_index()
+    larga = larga[larga["Frecuencia absoluta"] > 0].reset_index(drop=True)
+    assert dispersa["Frecuencia absoluta"].tolist() == larga["Frecuencia absoluta"].tolist()
+    assert dispersa[["ciudad", "grado"]].values.tolist() == larga[["ciudad", "grado"]].values.tolist()
+
+
+@pytest.mark.parametrize("columnas", [["ciudad", "grado"], ["ciudad", "grado", "estado"]])
+def test_chi_cuadrado_como_la_formula(columnas):
+    df = _datos()
+    # Tabla esperada E = n * producto de las proporciones marginales, en todas las celdas
+    observadas = df.groupby(columnas).size()
+    marginales = [df[columna].value_counts(normalize=True) for columna in columnas]
+    indice = pd.MultiIndex.from_product([m.index for m in marginales], names=columnas)
+    esperadas = pd.Series(len(df), index=indice, dtype=float)
+    for columna, marginal in zip(columnas, marginales):
+        esperadas *= marginal.reindex(indice.get_level_values(columna)).to_numpy()
+    observadas = observadas.reindex(indice, fill_value=0)
+    chi2 = float(((observadas - esperadas) ** 2 / esperadas).sum())
+    grados = len(indice) - 1 - sum(len(m) - 1 for m in marginales)
+
+    resultado = mi_libreria.TablaContingencia.desde_dataframe(df, columnas).chi_cuadrado()
+    assert resultado["chi2"] == pytest.approx(chi2, rel=1e-9)
+    assert resultado["grados_libertad"] == grados
+    if len(columnas) == 2:
+        menor = min(len(m) for m in marginales) - 1
+        assert resultado["v_cramer"] == pytest.approx(np.sqrt(chi2 / (len(df) * menor)))
+
+
+def test_p_valor_con_tabla_de_la_chi_cuadrado():
+    # Valores críticos de la chi-cuadrado al 5% (1, 2 y 10 grados de libertad)
+    for grados, critico in ((1, 3.841459), (2, 5.991465), (10, 18.307038)):
+        assert mi_libreria._gamma_superior_regularizada(grados / 2, critico / 2) == pytest.approx(0.05, abs=1e-6)
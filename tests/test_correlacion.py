@@ -0,0 +1,77 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+import POO_LIBRERIA.libreria_completa as lib
+
+
+@pytest.fixture
+def datos():
+    generador = np.random.default_rng(0)
+    base = generador.normal(size=(500, 1))
+    df = pd.DataFrame(base + generador.normal(scale=[0.5, 1, 2, 4, 8, 1], size=(500, 6)),
+                      columns=list("abcdef"))
+    df["e"] = np.round(df["e"])  # con empates
+    df.loc[generador.random(500) < 0.2, "b"] = np.nan
+    df.loc[generador.random(500) < 0.1, "d"] = np.nan
+    return df
+
+
+@pytest.mark.parametrize("bloque", [None, 2, 4])
+def test_pearson_y_covarianza_como_pandas(datos, bloque):
+    motor = lib.MatrizCorrelacion(datos)
+    assert np.allclose(motor.pearson(bloque=bloque), datos.corr())
+    assert np.allclose(motor.covarianza(bloque=bloque), datos.cov())
+
+
+@pytest.mark.parametrize("bloque", [None, 4])
+def test_spearman_por_pares_como_pandas(datos, bloque):
+    rangos = datos.rank()
+    # df.corr("spearman") necesita scipy; sin faltantes en el par es Pearson de los rangos
+    esperado = pd.DataFrame(index=datos.columns, columns=datos.columns, dtype=float)
+    for i in datos.columns:
+        for j in datos.columns:
+            filas = datos[i].notna() & datos[j].notna()
+            esperado.loc[i, j] = datos[i][filas].rank().corr(datos[j][filas].rank())
+    obtenido = lib.MatrizCorrelacion(datos).spearman(bloque=bloque)
+    assert np.allclose(obtenido, esperado, atol=1e-12)
+    assert not np.allclose(obtenido.loc["b", "c"], rangos["b"].corr(rangos["c"]), atol=1e-6)
+
+
+@pytest.mark.parametrize("bloque", [None, 2, 3])
+def test_spearman_con_empates_y_faltantes_en_todas_las_columnas(bloque, tmp_path):
+    generador = np.random.default_rng(1)
+    datos = pd.DataFrame(generador.normal(size=(300, 5)), columns=list("abcde"))
+    datos["c"] = np.round(datos["c"])
+    datos["d"] = np.round(datos["a"] * 2)
+    datos = datos.mask(generador.random(datos.shape) < 0.15)
+    datos.loc[:5, "e"] = datos.loc[:5, "c"]  # empates entre columnas en filas compartidas
+    esperado = datos.corr("spearman")
+
+    obtenido = lib.MatrizCorrelacion(datos).spearman(bloque=bloque)
+    assert np.allclose(obtenido, esperado, atol=1e-12)
+    ruta = str(tmp_path / "s.npy")
+    lib.MatrizCorrelacion(datos).spearman(bloque=bloque, salida=ruta)
+    assert np.allclose(np.load(ruta), esperado, atol=1e-12)
+
+
+def test_salida_en_archivo(datos, tmp_path):
+    ruta = str(tmp_path / "m.npy")
+    lib.MatrizCorrelacion(datos).pearson(bloque=3, salida=ruta)
+    assert np.allclose(np.load(ruta), datos.corr())
+
+
+def test_acumulador_por_bloques_como_pandas(datos):
+    completos = datos.dropna()
+    acumulador = lib.AcumuladorCovarianza(list(completos.columns))
+    for inicio in range(0, len(completos), 97):
+        acumulador.agregar_bloque(completos.iloc[inicio:inicio + 97])
+    assert np.allclose(acumulador.pearson(), completos.corr())
+    assert np.allclose(acumulador.covarianza(), completos.cov())
+
+
+def test_correlacion_entre_variables():
+    x = lib.VariableCuantitativa(np.arange(50.0))
+    y = lib.VariableCuantitativa(np.arange(50.0) ** 3)
+    assert x.correlacion(y) == pytest.approx(np.corrcoef(x.datos, y.datos)[0, 1])
+    assert x.correlacion(y, metodo="spearman") == pytest.approx(1.0)
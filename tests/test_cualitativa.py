@@ -0,0 +1,45 @@
+import pandas as pd
+
+import POO_LIBRERIA.libreria_completa as mi_libreria
+
+
+def test_categorias_declaradas_sin_datos_se_cuentan():
+    serie = pd.Series(pd.Categorical(["x", "y", "x"], categories=["z", "y", "x", "v"]), name="c")
+    variable = mi_libreria.VariableCualitativa(serie, "c")
+
+    conteo, esperado = variable._conteo_categorias(), serie.value_counts()
+    assert conteo.index.tolist() == esperado.index.tolist()
+    assert conteo.tolist() == esperado.tolist()
+    assert variable.calcular_menos_frecuente() == ("z", 0)
+    assert variable.calcular_frecuencia()["Frecuencia absoluta"].tolist() == [2, 1, 0, 0]
+
+
+def test_empates_en_el_orden_de_las_categorias():
+    serie = pd.Series(pd.Categorical(["x", "y"], categories=["z", "y", "x"]), name="c")
+    variable = mi_libreria.VariableCualitativa(serie, "c")
+    assert variable._conteo_categorias().index.tolist() == serie.value_counts().index.tolist()
+
+
+def test_texto_sin_categorias_no_agrega_ceros():
+    serie = pd.Series(["b", "a", "b", None], name="t")
+    variable = mi_libreria.VariableCualitativa(serie, "t")
+    assert variable._conteo_categorias().to_dict() == serie.value_counts().to_dict()
+
+
+def test_categorias_sin_datos_no_cuentan_como_observadas(tmp_path, capsys):
+    serie = pd.Series(pd.Categorical(["a", "b", "a"], categories=["a", "b", "z"]), name="c")
+    variable = mi_libreria.VariableCualitativa(serie, "c")
+
+    assert variable.porcentaje_categoria("z") is None
+    assert "no existe" in capsys.readouterr().out
+    assert variable.porcentajes_categorias(["a", "z"]) == {"a": 66.67, "z": None}
+
+    resumen = variable.resumen_dict()
+    assert resumen["categorias"] == serie.nunique() == 2
+    assert resumen["frecuencias"] == {"a": 2, "b": 1}
+
+    variable.resumen()
+    assert "Número de categorías: 2" in capsys.readouterr().out
+    archivo = tmp_path / "resumen.txt"
+    variable.exportar_resumen(str(archivo))
+    assert "Número de categorías: 2" in archivo.read_text(encoding="utf-8")
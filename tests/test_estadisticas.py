@@ -0,0 +1,110 @@
+import math
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import POO_LIBRERIA.libreria_completa as mi_libreria
+
+
+# Fórmulas de la versión original de VariableCuantitativa, en Python puro
+def _media(datos):
+    return sum(datos) / len(datos) if datos else 0
+
+
+def _varianza(datos, es_muestra=True):
+    n = len(datos)
+    if n < (2 if es_muestra else 1):
+        return 0
+    media = _media(datos)
+    suma = sum((x - media) ** 2 for x in datos)
+    return suma / (n - 1) if es_muestra else suma / n
+
+
+def _asimetria(datos):
+    n = len(datos)
+    if n < 3:
+        return 0
+    media, std = _media(datos), math.sqrt(_varianza(datos, False))
+    if std == 0:
+        return 0
+    return (n / ((n - 1) * (n - 2))) * sum(((x - media) / std) ** 3 for x in datos)
+
+
+def _curtosis(datos):
+    n = len(datos)
+    if n < 4:
+        return 0
+    media, std = _media(datos), math.sqrt(_varianza(datos, False))
+    if std == 0:
+        return 0
+    return sum(((x - media) / std) ** 4 for x in datos) / n - 3
+
+
+def _percentil(datos, p):
+    ordenados = sorted(datos)
+    indice = (p / 100) * (len(ordenados) - 1)
+    bajo = int(indice)
+    if indice.is_integer():
+        return ordenados[bajo]
+    return ordenados[bajo] + (ordenados[bajo + 1] - ordenados[bajo]) * (indice - bajo)
+
+
+_generador = np.random.default_rng(3)
+DATOS = {
+    "normal": _generador.normal(10, 2, 5_000),
+    "lognormal": _generador.lognormal(0, 1, 3_000),
+    "enteros": _generador.integers(0, 5, 101).astype(float),
+    "pocos": np.array([4.0, 1.0, 7.0]),
+    "constantes": np.full(50, 2.5),
+}
+
+
+@pytest.fixture(params=list(DATOS))
+def datos(request):
+    return DATOS[request.param]
+
+
+def test_momentos_como_la_version_original(datos):
+    variable = mi_libreria.VariableCuantitativa(pd.Series(datos, name="x"), "x")
+    lista = datos.tolist()
+
+    assert variable.media() == pytest.approx(_media(lista), rel=1e-12)
+    assert variable.varianza() == pytest.approx(_varianza(lista), rel=1e-9, abs=1e-12)
+    assert variable.varianza(es_muestra=False) == pytest.approx(_varianza(lista, False), rel=1e-9, abs=1e-12)
+    assert variable.asimetria() == pytest.approx(_asimetria(lista), rel=1e-6, abs=1e-9)
+    assert variable.curtosis() == pytest.approx(_curtosis(lista), rel=1e-6, abs=1e-9)
+
+
+def test_orden_como_la_version_original(datos):
+    variable = mi_libreria.VariableCuantitativa(pd.Series(datos, name="x"), "x")
+    lista = datos.tolist()
+
+    for p in (0, 10, 25, 33.3, 50, 75, 99, 100):
+        assert variable.percentil(p) == pytest.approx(_percentil(lista, p))
+    assert variable.percentiles([5, 50, 95]) == pytest.approx([_percentil(lista, p) for p in (5, 50, 95)])
+    assert variable.mediana() == pytest.approx(float(np.median(datos)))
+    assert variable.cuartiles() == pytest.approx(
+        {"Q1": _percentil(lista, 25), "Q2": _percentil(lista, 50), "Q3": _percentil(lista, 75)})
+    assert variable.rango() == max(lista) - min(lista)
+
+
+def test_momentos_estables_lejos_del_cero():
+    # Con 1e9 de desplazamiento la fórmula original pierde dígitos; los momentos
+    # centrales no dependen del desplazamiento, así que se comparan con los del ruido
+    ruido = np.random.default_rng(4).normal(0, 1, 2_000)
+    desplazados = 1e9 + ruido
+    centrados = (desplazados - 1e9).tolist()
+    variable = mi_libreria.VariableCuantitativa(pd.Series(desplazados, name="x"), "x")
+    # Bloques combinados uno por uno, y dos acumuladores parciales combinados entre sí
+    por_bloques = mi_libreria.AcumuladorMomentos()
+    for inicio in range(0, 1_000, 300):
+        por_bloques.actualizar(desplazados[inicio:min(inicio + 300, 1_000)])
+    por_bloques.combinar(mi_libreria.AcumuladorMomentos.desde_datos(desplazados[1_000:]))
+
+    assert variable.media() == pytest.approx(1e9 + _media(centrados), rel=1e-15)
+    assert por_bloques.media == pytest.approx(1e9 + _media(centrados), rel=1e-15)
+    for resultado in (variable, por_bloques):
+        assert resultado.varianza() == pytest.approx(_varianza(centrados), rel=1e-9)
+        assert resultado.asimetria() == pytest.approx(_asimetria(centrados), rel=1e-6)
+        assert resultado.curtosis() == pytest.approx(_curtosis(centrados), rel=1e-6)
@@ -0,0 +1,57 @@
+import json
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import POO_LIBRERIA.libreria_completa as lib
+
+
+def variables():
+    return [lib.VariableCuantitativa([-1.0, 0.0, 1.0], "centrada"),
+            lib.VariableCuantitativa([1.0, 2.0, 4.0], "positiva"),
+            lib.VariableCualitativa(pd.Series(["a", "b", "a"]), "letras")]
+
+
+def rechazar_constante(constante):
+    raise AssertionError(f"JSON inválido: {constante}")
+
+
+def test_json_sin_valores_no_finitos():
+    texto = lib.ExportadorResumenes(variables()).a_json()
+    resumenes = json.loads(texto, parse_constant=rechazar_constante)
+    assert resumenes[0]["coeficiente_variacion"] is None
+    assert resumenes[1]["coeficiente_variacion"] > 0
+    assert resumenes[2]["frecuencias"] == {"a": 2, "b": 1}
+
+
+def test_formatos_columnares_sin_infinitos(tmp_path):
+    exportador = lib.ExportadorResumenes(variables())
+    exportador.a_columnas(str(tmp_path / "r.csv"))
+    tabla = pd.read_csv(tmp_path / "r.csv", index_col="nombre")
+    assert np.isnan(tabla.loc["centrada", "coeficiente_variacion"])
+    assert tabla.loc["positiva", "media"] == pytest.approx(exportador.resumenes()[1]["media"])
+
+    exportador.a_columnas(str(tmp_path / "r.npz"))
+    columnas = np.load(tmp_path / "r.npz")
+    assert list(columnas["nombre"]) == ["centrada", "positiva", "letras"]
+    assert not np.isinf(columnas["coeficiente_variacion"]).any()
+
+
+def cualitativas():
+    generador = np.random.default_rng(0)
+    return [lib.VariableCualitativa(pd.Series(generador.choice(list("abcd"), 200)), f"v{i}") for i in range(5)]
+
+
+@pytest.mark.parametrize("archivo, compresion", [
+    ("f.csv", "infer"), ("f.csv.gz", "infer"), ("f.csv.gz", "gzip"), ("f.csv.bz2", "bz2"), ("f.csv", "xz"),
+])
+def test_exportar_frecuencias_en_un_archivo(tmp_path, archivo, compresion):
+    variables = cualitativas()
+    ruta = str(tmp_path / archivo)
+    lib.ExportadorFrecuencias(variables, max_trabajadores=2).exportar(ruta, compresion=compresion)
+    tabla = pd.read_csv(ruta, compression=compresion)
+    assert list(tabla.columns) == ["variable", "categoria", "frecuencia_absoluta", "frecuencia_relativa"]
+    for variable in variables:
+        filas = tabla[tabla["variable"] == variable.nombre].set_index("categoria")
+        assert filas["frecuencia_absoluta"].to_dict() == variable.datos.value_counts().to_dict()
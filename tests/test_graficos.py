@@ -0,0 +1,104 @@
+import io
+import pickle
+
+import numpy as np
+import pandas as pd
+import pytest
+from matplotlib import cbook
+
+import POO_LIBRERIA.libreria_completa as lib
+
+
+@pytest.fixture
+def variable():
+    return lib.VariableCuantitativa(np.random.default_rng(0).standard_t(3, size=200_000), "t")
+
+
+@pytest.mark.parametrize("bins", ["auto", "fd", "sturges", "scott", "rice", "sqrt", "doane", 30])
+def test_histograma_como_numpy(variable, bins):
+    conteos, bordes = variable.histograma(bins)
+    esperado_conteos, esperado_bordes = np.histogram(variable.datos, bins)
+    assert np.array_equal(conteos, esperado_conteos)
+    assert np.allclose(bordes, esperado_bordes)
+
+
+def test_caja_como_matplotlib(variable):
+    visualizador = lib.VisualizadorEstadistico(variable)
+    esperado = cbook.boxplot_stats(variable.datos)[0]
+    obtenido = visualizador.estadisticas_caja(max_atipicos=10**9)
+    for clave in ("med", "q1", "q3", "whislo", "whishi"):
+        assert obtenido[clave] == pytest.approx(esperado[clave])
+    assert np.array_equal(np.sort(obtenido["fliers"]), np.sort(esperado["fliers"]))
+    recortado = visualizador.estadisticas_caja(max_atipicos=100)["fliers"]
+    assert len(recortado) == 100
+    assert recortado[0] == esperado["fliers"].min() and recortado[-1] == esperado["fliers"].max()
+
+
+def test_caja_con_sketch_no_ordena_la_columna(variable):
+    aproximada = lib.VariableCuantitativa(variable.datos, "t", error_cuantiles=0.001)
+    obtenido = lib.VisualizadorEstadistico(aproximada).estadisticas_caja(max_atipicos=10**9)
+    assert aproximada._ordenados is None
+    esperado = cbook.boxplot_stats(variable.datos)[0]
+    for clave in ("med", "q1", "q3", "whislo", "whishi"):
+        assert obtenido[clave] == pytest.approx(esperado[clave], abs=0.05)
+    assert obtenido["whislo"] <= obtenido["q1"] and obtenido["whishi"] >= obtenido["q3"]
+    assert len(obtenido["fliers"]) == pytest.approx(len(esperado["fliers"]), rel=0.05)
+
+
+@pytest.mark.parametrize("datos", [[5.0], [1.0, 1.0, 1.0], [1.0, 2.0, 3.0, 100.0]])
+def test_caja_con_pocos_datos_como_matplotlib(datos):
+    obtenido = lib.VisualizadorEstadistico(lib.VariableCuantitativa(datos, "x")).estadisticas_caja()
+    esperado = cbook.boxplot_stats(np.asarray(datos))[0]
+    for clave in ("med", "q1", "q3", "whislo", "whishi"):
+        assert obtenido[clave] == pytest.approx(esperado[clave])
+    assert np.array_equal(obtenido["fliers"], esperado["fliers"])
+
+
+def test_caja_con_matplotlib_sin_orientation():
+    class EjesAnteriores:
+        """Axes de matplotlib < 3.10: bxp solo acepta vert."""
+        def bxp(self, estadisticas, vert=True, patch_artist=False):
+            self.argumentos = {"vert": vert, "patch_artist": patch_artist}
+
+        def set_title(self, *args): pass
+        def set_xlabel(self, *args): pass
+        def grid(self, *args, **kwargs): pass
+
+    ejes = EjesAnteriores()
+    lib._dibujar_boxplot(ejes, "x", {})
+    assert ejes.argumentos == {"vert": False, "patch_artist": True}
+
+
+def test_lote_envia_solo_resumenes(variable):
+    renderizador = lib.RenderizadorGraficos(max_trabajadores=2)
+    visualizador = lib.VisualizadorEstadistico(variable)
+    renderizador.agregar(visualizador, "graficar_histograma")
+    renderizador.agregar(visualizador, "graficar_boxplot")
+    assert len(pickle.dumps(renderizador.trabajos)) < variable.datos.nbytes / 20
+
+
+def test_lote_genera_las_mismas_imagenes(variable, tmp_path):
+    cualitativa = lib.VariableCualitativa(pd.Series(list("aabcd") * 20), "letras")
+    visualizadores = [(lib.VisualizadorEstadistico(variable), "graficar_histograma"),
+                      (lib.VisualizadorEstadistico(variable), "graficar_boxplot"),
+                      (lib.VisualizadorCualitativo(cualitativa), "graficar_pastel"),
+                      (lib.VisualizadorCualitativo(cualitativa), "graficar_barras")]
+    renderizador = lib.RenderizadorGraficos(max_trabajadores=2)
+    for visualizador, metodo in visualizadores:
+        renderizador.agregar(visualizador, metodo)
+    renderizador.agregar(visualizadores[0][0], "graficar_histograma", archivo=str(tmp_path / "h.svg"))
+    imagenes = renderizador.renderizar()
+
+    for (visualizador, metodo), imagen in zip(visualizadores, imagenes):
+        buffer = io.BytesIO()
+        getattr(visualizador, metodo)(archivo=buffer)
+        assert imagen == buffer.getvalue()
+    assert imagenes[-1] == str(tmp_path / "h.svg")
+    assert (tmp_path / "h.svg").read_text().startswith("<?xml")
+    assert renderizador.trabajos == []
+
+
+def test_metodo_inexistente():
+    visualizador = lib.VisualizadorEstadistico(lib.VariableCuantitativa([1.0, 2.0]))
+    with pytest.raises(ValueError):
+        lib.RenderizadorGraficos().agregar(visualizador, "resumen")
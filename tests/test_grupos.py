@@ -0,0 +1,43 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+import POO_LIBRERIA.libreria_completa as mi_libreria
+
+
+def test_estadisticas_por_grupo_como_pandas():
+    generador = np.random.default_rng(5)
+    df = pd.DataFrame({
+        "valor": generador.normal(50, 10, 4_000),
+        "ciudad": generador.choice(["Lima", "Quito", "Bogotá", "Caracas"], 4_000, p=[0.5, 0.3, 0.199, 0.001]),
+    })
+    df.loc[::97, "valor"] = np.nan
+    df.loc[::89, "ciudad"] = None
+
+    tabla = mi_libreria.EstadisticasPorGrupo.desde_dataframe(df, "valor", "ciudad").tabla()
+    grupos = df.dropna().groupby("ciudad")["valor"]
+
+    assert tabla.index.tolist() == sorted(grupos.groups)
+    esperado = pd.DataFrame({
+        "n": grupos.size(),
+        "media": grupos.mean(),
+        "mediana": grupos.median(),
+        "desviacion_estandar": grupos.std(),
+        "varianza": grupos.var(),
+        "minimo": grupos.min(),
+        "Q1": grupos.quantile(0.25),
+        "Q3": grupos.quantile(0.75),
+        "maximo": grupos.max(),
+    }).fillna({"desviacion_estandar": 0.0, "varianza": 0.0})
+    for columna in esperado:
+        np.testing.assert_allclose(tabla[columna].to_numpy(dtype=float),
+                                   esperado[columna].to_numpy(dtype=float), rtol=1e-10, err_msg=columna)
+
+    # Asimetría y curtosis con las fórmulas de VariableCuantitativa
+    for ciudad, valores in grupos:
+        variable = mi_libreria.VariableCuantitativa(valores, "valor")
+        assert tabla.loc[ciudad, "asimetria"] == pytest.approx(variable.asimetria(), rel=1e-6, abs=1e-9)
+        assert tabla.loc[ciudad, "curtosis"] == pytest.approx(variable.curtosis(), rel=1e-6, abs=1e-9)
+        atipicos = variable.detectar_atipicos()
+        assert tabla.loc[ciudad, "atipicos_inferiores"] == len(atipicos["inferiores"])
+        assert tabla.loc[ciudad, "atipicos_superiores"] == len(atipicos["superiores"])
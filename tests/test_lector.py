@@ -0,0 +1,116 @@
+import numpy as np
+import pandas as pd
+
+import POO_LIBRERIA.libreria_completa as lib
+
+
+def escribir_csv(ruta, filas=100):
+    pd.DataFrame({"x": np.arange(filas, dtype=float), "c": ["a", "b"] * (filas // 2)}).to_csv(ruta, index=False)
+
+
+def test_cache_columnar_no_borra_archivos_ajenos(tmp_path):
+    ruta = tmp_path / "datos.csv"
+    escribir_csv(ruta)
+    carpeta = tmp_path / "carpeta"
+    carpeta.mkdir()
+    (carpeta / "importante.txt").write_text("no borrar")
+
+    lib.LectorCSV(str(ruta), usar_cache=True, directorio_cache=str(carpeta)).leer()
+    escribir_csv(ruta, filas=200)
+    datos = lib.LectorCSV(str(ruta), usar_cache=True, directorio_cache=str(carpeta)).leer()
+
+    assert len(datos) == 200
+    assert (carpeta / "importante.txt").read_text() == "no borrar"
+
+
+def test_cache_columnar_calcula_el_hash_una_vez(tmp_path, monkeypatch):
+    ruta = tmp_path / "datos.csv"
+    escribir_csv(ruta)
+    lib.LectorCSV(str(ruta), usar_cache=True).leer()
+    # Mismo tamaño y distinto contenido: hay que comparar el hash y rehacer la caché
+    ruta.write_text(ruta.read_text().replace("a", "z"))
+
+    hashes = []
+    blake2b = lib.hashlib.blake2b
+
+    def contar(*args, **kwargs):
+        hashes.append(kwargs.get("digest_size"))
+        return blake2b(*args, **kwargs)
+
+    monkeypatch.setattr(lib.hashlib, "blake2b", contar)
+    datos = lib.LectorCSV(str(ruta), usar_cache=True).leer()
+    assert set(datos["c"].astype(str)) == {"z", "b"}
+    assert hashes.count(16) == 1
+
+
+def _contar_hashes(monkeypatch):
+    hashes = []
+    blake2b = lib.hashlib.blake2b
+
+    def contar(*args, **kwargs):
+        hashes.append(kwargs.get("digest_size"))
+        return blake2b(*args, **kwargs)
+
+    monkeypatch.setattr(lib.hashlib, "blake2b", contar)
+    return hashes
+
+
+def test_lector_reutiliza_el_hash_entre_lecturas(tmp_path, monkeypatch):
+    ruta = tmp_path / "datos.csv"
+    escribir_csv(ruta)
+    lector = lib.LectorCSV(str(ruta), usar_cache=True)
+    hashes = _contar_hashes(monkeypatch)
+    for _ in range(3):
+        assert len(lector.leer()) == 100
+    assert hashes.count(16) == 1
+
+    # Si el archivo cambia, el mismo lector lo detecta
+    escribir_csv(ruta, filas=200)
+    assert len(lector.leer()) == 200
+
+
+def test_lector_sin_verificar_contenido_no_lee_el_archivo(tmp_path, monkeypatch):
+    ruta = tmp_path / "datos.csv"
+    escribir_csv(ruta)
+    lib.LectorCSV(str(ruta), usar_cache=True).leer()
+    hashes = _contar_hashes(monkeypatch)
+    datos = lib.LectorCSV(str(ruta), usar_cache=True, verificar_contenido=False).leer()
+    assert len(datos) == 100
+    assert hashes.count(16) == 0
+
+
+def test_cache_columnar_devuelve_los_mismos_datos(tmp_path):
+    ruta = tmp_path / "datos.csv"
+    escribir_csv(ruta)
+    esperado = pd.read_csv(ruta)
+    for _ in range(2):
+        datos = lib.LectorCSV(str(ruta), usar_cache=True).leer()
+        assert np.array_equal(datos["x"], esperado["x"])
+        assert list(datos["c"].astype(str)) == list(esperado["c"])
+
+
+def csv_con_texto_tardio(ruta):
+    valores = [str(i) for i in range(lib.LectorCSV.FILAS_MUESTRA + 500)] + ["sin dato"]
+    pd.DataFrame({"codigo": valores, "x": np.arange(len(valores), dtype=float)}).to_csv(ruta, index=False)
+
+
+def test_columna_numerica_con_texto_tardio_pasa_a_categorica(tmp_path):
+    ruta = tmp_path / "datos.csv"
+    csv_con_texto_tardio(ruta)
+    lector = lib.LectorCSV(str(ruta), tamano_bloque=4096)
+    datos = lector.leer()
+    esperado = pd.read_csv(ruta, dtype={"codigo": str})
+    assert lector.tipos() == {"codigo": "cualitativa", "x": "cuantitativa"}
+    assert isinstance(datos["codigo"].dtype, pd.CategoricalDtype)
+    assert list(datos["codigo"].astype(str)) == list(esperado["codigo"])
+    assert np.array_equal(datos["x"], esperado["x"])
+
+
+def test_texto_tardio_con_cache_y_acumuladores(tmp_path):
+    ruta = tmp_path / "datos.csv"
+    csv_con_texto_tardio(ruta)
+    datos = lib.LectorCSV(str(ruta), tamano_bloque=4096, usar_cache=True).leer()
+    assert datos["codigo"].iloc[-1] == "sin dato"
+    acumuladores = lib.LectorCSV(str(ruta), tamano_bloque=4096).acumuladores()
+    assert list(acumuladores) == ["x"]
+    assert acumuladores["x"].n == len(datos)
@@ -0,0 +1,64 @@
+import math
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+import POO_LIBRERIA.libreria_completa as mi_libreria
+
+ARCHIVO = Path(__file__).resolve().parent.parent / "archivo_prueba.txt"
+
+
+def _tipo_original(serie):
+    """detectar_tipo de la versión original: convierte toda la columna a float."""
+    try:
+        serie.dropna().astype(float)
+        return "cuantitativa"
+    except ValueError:
+        return "cualitativa"
+
+
+def _iguales(a, b):
+    if isinstance(a, dict):
+        return a.keys() == b.keys() and all(_iguales(a[clave], b[clave]) for clave in a)
+    if isinstance(a, float) and math.isnan(a):
+        return isinstance(b, float) and math.isnan(b)
+    return a == b
+
+
+@pytest.mark.parametrize("leer", [
+    lambda: pd.read_csv(ARCHIVO),
+    lambda: pd.read_csv(ARCHIVO, dtype=str),  # todo como texto: pasa por la muestra de detectar_tipo
+], ids=["tipos_de_pandas", "texto"])
+def test_clasificar_como_detectar_tipo_original(leer):
+    df = leer()
+    tipos = mi_libreria.PerfiladorDataset(df).clasificar()
+    assert tipos == {columna: _tipo_original(df[columna]) for columna in df.columns}
+    assert tipos["Edad"] == tipos["Ingreso_Mensual"] == "cuantitativa"
+    assert tipos["Ciudad"] == "cualitativa"
+
+
+def test_procesos_hilos_y_en_serie_dan_el_mismo_reporte():
+    df = pd.read_csv(ARCHIVO)
+    en_serie = mi_libreria.PerfiladorDataset(df, max_trabajadores=1).perfilar()
+    procesos = mi_libreria.PerfiladorDataset(df, max_trabajadores=3, modo="procesos").perfilar()
+    hilos = mi_libreria.PerfiladorDataset(df, max_trabajadores=3, modo="hilos").perfilar()
+
+    assert list(en_serie) == list(df.columns)
+    assert _iguales(en_serie, procesos)
+    assert _iguales(en_serie, hilos)
+    assert en_serie["Edad"]["media"] == pytest.approx(df["Edad"].mean())
+    assert en_serie["Ciudad"]["frecuencias"] == df["Ciudad"].value_counts().to_dict()
+
+
+def test_desde_archivo_igual_que_desde_dataframe():
+    columnas = ["Edad", "Ciudad", "Ingreso_Mensual"]
+    desde_archivo = mi_libreria.PerfiladorDataset(str(ARCHIVO), columnas=columnas, max_trabajadores=1)
+    desde_dataframe = mi_libreria.PerfiladorDataset(pd.read_csv(ARCHIVO), columnas=columnas, max_trabajadores=1)
+    assert _iguales(desde_archivo.perfilar(), desde_dataframe.perfilar())
+    assert list(desde_archivo.tabla().index) == columnas
+
+
+def test_modo_invalido():
+    with pytest.raises(ValueError):
+        mi_libreria.PerfiladorDataset(pd.DataFrame({"a": [1]}), modo="gpu")
@@ -0,0 +1,90 @@
+import json
+import math
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import POO_LIBRERIA.libreria_completa as mi_libreria
+
+PERCENTILES = np.arange(1, 100)
+
+
+def _error_de_rango(sketch, ordenados):
+    """Mayor diferencia entre el rango pedido y el rango real de cada percentil aproximado."""
+    valores = np.asarray(sketch.percentiles(PERCENTILES))
+    rangos = np.searchsorted(ordenados, valores, side="right") / len(ordenados)
+    return float(np.max(np.abs(rangos - PERCENTILES / 100)))
+
+
+@pytest.fixture(scope="module")
+def datos():
+    return np.random.default_rng(0).lognormal(0, 1, 200_000)
+
+
+@pytest.mark.parametrize("error", [0.05, 0.01])
+def test_error_de_rango_acotado(datos, error):
+    sketch = mi_libreria.SketchCuantiles(error=error, semilla=1).actualizar(datos)
+    assert _error_de_rango(sketch, np.sort(datos)) <= error
+    # La memoria no depende de la cantidad de datos
+    assert sum(len(items) for items in sketch.niveles) < 4 * sketch.k + len(sketch.niveles)
+    assert sketch.percentil(0) == datos.min()
+    assert sketch.percentil(100) == datos.max()
+
+
+def test_combinar_partes_como_un_solo_sketch(datos):
+    completo = mi_libreria.SketchCuantiles(error=0.01, semilla=1).actualizar(datos)
+    partes = [mi_libreria.SketchCuantiles(error=0.01, semilla=semilla).actualizar(parte)
+              for semilla, parte in enumerate(np.array_split(datos, 7))]
+    combinado = partes[0]
+    for parte in partes[1:]:
+        combinado.combinar(parte)
+
+    ordenados = np.sort(datos)
+    assert (combinado.n, combinado.minimo, combinado.maximo) == (completo.n, completo.minimo, completo.maximo)
+    assert _error_de_rango(combinado, ordenados) <= 0.01
+    rangos = [np.searchsorted(ordenados, sketch.percentiles(PERCENTILES)) / len(datos)
+              for sketch in (combinado, completo)]
+    assert np.max(np.abs(rangos[0] - rangos[1])) <= 0.02
+
+
+def test_serializar_y_deserializar(datos):
+    sketch = mi_libreria.SketchCuantiles(error=0.02, semilla=3).actualizar(datos[:50_000])
+    copia = mi_libreria.SketchCuantiles.deserializar(sketch.serializar())
+    assert (copia.n, copia.k, copia.error, copia.minimo, copia.maximo) == \
+        (sketch.n, sketch.k, sketch.error, sketch.minimo, sketch.maximo)
+    assert all(np.array_equal(a, b) for a, b in zip(copia.niveles, sketch.niveles))
+    assert copia.percentiles(PERCENTILES) == sketch.percentiles(PERCENTILES)
+
+    # La copia se puede seguir actualizando y combinando
+    copia.actualizar(datos[50_000:])
+    assert copia.n == len(datos)
+    assert _error_de_rango(copia, np.sort(datos)) <= 0.02
+
+
+def test_sketch_vacio_se_serializa_como_json_valido():
+    contenido = mi_libreria.SketchCuantiles().serializar()
+    estado = json.loads(contenido, parse_constant=lambda valor: pytest.fail(f"JSON inválido: {valor}"))
+    assert estado["minimo"] is None and estado["maximo"] is None
+
+    copia = mi_libreria.SketchCuantiles.deserializar(contenido)
+    assert (copia.n, copia.minimo, copia.maximo) == (0, math.inf, -math.inf)
+    copia.actualizar([3.0, 1.0])
+    assert (copia.minimo, copia.maximo) == (1.0, 3.0)
+
+
+def test_variable_con_error_cuantiles_usa_el_sketch(datos, monkeypatch):
+    llamadas = []
+    percentiles = mi_libreria.SketchCuantiles.percentiles
+    monkeypatch.setattr(mi_libreria.SketchCuantiles, "percentiles",
+                        lambda self, ps: llamadas.append(ps) or percentiles(self, ps))
+    variable = mi_libreria.VariableCuantitativa(pd.Series(datos, name="x"), "x", error_cuantiles=0.01)
+
+    ordenados = np.sort(datos)
+    for p, valor in zip((25, 50, 75), (variable.cuartiles()["Q1"], variable.mediana(), variable.percentil(75))):
+        assert abs(np.searchsorted(ordenados, valor) / len(datos) - p / 100) <= 0.01
+    assert llamadas
+    # No se ordenó la columna entera
+    assert variable._ordenados is None
+    exacta = mi_libreria.VariableCuantitativa(pd.Series(datos, name="x"), "x")
+    assert variable.mediana() != exacta.mediana()
@@ -0,0 +1,50 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+import POO_LIBRERIA.libreria_completa as lib
+
+
+def por_fuerza_bruta(datos, inicio, fin, estadistico):
+    return np.array([getattr(lib.VariableCuantitativa(datos[a:b]), estadistico)() for a, b in zip(inicio, fin)])
+
+
+@pytest.fixture
+def salto_de_nivel():
+    generador = np.random.default_rng(0)
+    return np.concatenate([generador.normal(0, 1, 1000), generador.normal(1e5, 1, 1000)])
+
+
+@pytest.mark.parametrize("tipo", ["deslizante", "fija"])
+@pytest.mark.parametrize("estadistico", ["media", "varianza", "asimetria", "curtosis"])
+def test_momentos_con_salto_de_nivel(salto_de_nivel, tipo, estadistico):
+    ventana = lib.VentanaCuantitativa(lib.VariableCuantitativa(salto_de_nivel), 50, tipo=tipo, min_periodos=1)
+    inicio, fin = ventana._limites()
+    esperado = por_fuerza_bruta(salto_de_nivel, inicio, fin, estadistico)
+    obtenido = getattr(ventana, estadistico)()
+    assert np.allclose(obtenido, esperado, rtol=1e-7, atol=1e-7)
+
+
+def test_coincide_con_rolling_de_pandas(salto_de_nivel):
+    ventana = lib.VentanaCuantitativa(lib.VariableCuantitativa(salto_de_nivel), 37)
+    movil = pd.Series(salto_de_nivel).rolling(37)
+    assert np.allclose(ventana.media(), movil.mean(), equal_nan=True)
+    assert np.allclose(ventana.varianza(), movil.var(), equal_nan=True)
+    assert np.allclose(ventana.percentil(90), movil.quantile(0.9), equal_nan=True)
+
+
+def test_ventanas_de_tiempo():
+    generador = np.random.default_rng(1)
+    datos = generador.normal(size=500)
+    tiempos = pd.date_range("2024-01-01", periods=500, freq="7s")
+    serie = pd.Series(datos, index=tiempos)
+    ventana = lib.VentanaCuantitativa(lib.VariableCuantitativa(datos), "1min", tiempos=tiempos)
+    assert np.allclose(ventana.media(), serie.rolling("1min").mean())
+    fija = lib.VentanaCuantitativa(lib.VariableCuantitativa(datos), "1min", tipo="fija", tiempos=tiempos)
+    assert np.allclose(fija.media(), serie.groupby(tiempos.floor("1min")).transform("mean"))
+
+
+def test_ventana_constante_tiene_varianza_cero():
+    ventana = lib.VentanaCuantitativa(lib.VariableCuantitativa(np.full(100, 123456.789)), 10)
+    assert np.all(ventana.varianza()[9:] == 0)
+    assert np.all(ventana.asimetria()[9:] == 0)